@@ -11,6 +11,7 @@ import pandas as pd
 from pipeline import (
     PipelineConfig,
     aggregate_point_file,
+    compile_point_directory,
     load_pipeline_config,
 )
 
@@ -86,6 +87,9 @@ def aggregate_area(*, config: PipelineConfig, base_dir: Path, area_key: str) ->
         parquet_written = False
     combined.to_csv(combined_csv, index=False)
     LOGGER.info("Wrote combined CSV summary: %s", combined_csv)
+
+    # Memory-mappable columns for the API server, next to the raw JSON
+    compile_point_directory(base_dir / "outputs" / area_key)
     return combined_path if parquet_written else combined_csv
 
 
@@ -11,6 +11,7 @@ from .aggregation import (
     export_monthly_to_parquet,
     load_point_json,
 )
+from .compiled import compile_point_directory, compile_point_files
 
 __all__ = [
     "PipelineConfig",
@@ -25,4 +26,6 @@ __all__ = [
     "export_monthly_to_csv",
     "export_monthly_to_parquet",
     "load_point_json",
+    "compile_point_directory",
+    "compile_point_files",
 ]
@@ -0,0 +1,103 @@
+"""Compile raw POWER point JSON into memory-mappable column files.
+
+The compiled layout is read by the FastAPI ``DataService``; keep the two in
+sync when changing it::
+
+    <area>/compiled/
+        manifest.json     # coordinates, parameters, source files
+        dates.npy         # sorted datetime64[D] index
+        <PARAM>.npy       # one float32 column per parameter, NaN for missing
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .aggregation import load_point_json
+
+LOGGER = logging.getLogger(__name__)
+
+COMPILED_DIRNAME = "compiled"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def _tmp_path(path: Path) -> Path:
+    # Unique per process and thread so concurrent writers never share a temp file
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _atomic_save(path: Path, array: np.ndarray) -> None:
+    # Replace rather than overwrite so servers holding memory maps keep the old inode
+    tmp = _tmp_path(path)
+    with tmp.open("wb") as handle:
+        np.save(handle, array)
+    os.replace(tmp, path)
+
+
+def _read_coordinates(path: Path) -> list[float]:
+    payload = json.loads(path.read_text())
+    return payload["geometry"]["coordinates"]
+
+
+def compile_point_files(*, paths: Iterable[Path], destination: Path) -> Path:
+    """Merge raw point JSON files and write the compiled column layout.
+
+    Parameters
+    ----------
+    paths: Iterable[Path]
+        Raw POWER point JSON files for a single location.
+    destination: Path
+        Directory to write (typically ``<area>/compiled``).
+    """
+    paths = sorted(paths)
+    if not paths:
+        raise ValueError("No raw files to compile")
+
+    frames = [load_point_json(path) for path in paths]
+    daily = pd.concat(frames).sort_index()
+    daily = daily[~daily.index.duplicated(keep="last")]
+
+    destination.mkdir(parents=True, exist_ok=True)
+    # Withdraw the manifest first: servers re-check it after mapping a column
+    (destination / MANIFEST_NAME).unlink(missing_ok=True)
+    _atomic_save(destination / "dates.npy", daily.index.values.astype("datetime64[D]"))
+    for param_id in daily.columns:
+        column = daily[param_id].to_numpy(dtype=np.float32, na_value=np.nan)
+        _atomic_save(destination / f"{param_id}.npy", column)
+
+    lon, lat = _read_coordinates(paths[0])[:2]
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "lat": lat,
+        "lon": lon,
+        "parameters": list(daily.columns),
+        "n_days": int(len(daily)),
+        "start_date": str(daily.index.min().date()),
+        "end_date": str(daily.index.max().date()),
+        "source_files": [path.name for path in paths],
+        "source_mtime": max(path.stat().st_mtime for path in paths),
+    }
+    # Manifest last so a half-written directory is never picked up as current
+    tmp = _tmp_path(destination / MANIFEST_NAME)
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, destination / MANIFEST_NAME)
+    LOGGER.info("Compiled %d files into %s", len(paths), destination)
+    return destination
+
+
+def compile_point_directory(area_dir: Path) -> Path | None:
+    """Compile ``<area_dir>/raw/*.json`` into ``<area_dir>/compiled``."""
+    raw_dir = area_dir / "raw"
+    paths = list(raw_dir.glob("*.json"))
+    if not paths:
+        LOGGER.warning("No raw JSON to compile in %s", raw_dir)
+        return None
+    return compile_point_files(paths=paths, destination=area_dir / COMPILED_DIRNAME)
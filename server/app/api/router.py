@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.routes import where, when, advisor, debug
+from app.api.routes import where, when, compare, advisor, debug, admin
 
 # Create main API router
 api_router = APIRouter()
@@ -7,5 +7,7 @@ api_router = APIRouter()
 # Include route modules
 api_router.include_router(where.router, tags=["where"])
 api_router.include_router(when.router, tags=["when"])
+api_router.include_router(compare.router, tags=["compare"])
 api_router.include_router(advisor.router, tags=["advisor"])
 api_router.include_router(debug.router, tags=["debug"])
+api_router.include_router(admin.router, tags=["admin"])
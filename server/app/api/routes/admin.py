@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse
+from app.config import settings
+from app.services.reload import get_reloader
+from typing import Optional
+import hmac
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _authorize(token: Optional[str]):
+    """Require the configured ADMIN_TOKEN; without one the admin API is closed."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin API disabled: ADMIN_TOKEN is not set")
+    if token is None or not hmac.compare_digest(
+        token.encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def _reloader():
+    reloader = get_reloader()
+    if reloader is None:
+        raise HTTPException(status_code=503, detail="Reloader not initialized")
+    return reloader
+
+
+@router.post("/admin/reload")
+async def reload_data(
+    force: bool = False,
+    wait: bool = True,
+    x_admin_token: Optional[str] = Header(default=None),
+):
+    """
+    Rebuild the data service from the current data and swap it in.
+
+    The current service keeps serving until the new one has been built,
+    self-checked and warmed up; a failed build leaves it in place.
+
+    Args:
+        force: Swap even if the data snapshot is unchanged
+        wait: Wait for the reload to finish (otherwise return 202 at once)
+
+    Returns:
+        The reload state, or 202 when the reload was started in the background
+    """
+    _authorize(x_admin_token)
+    reloader = _reloader()
+    if reloader.running:
+        raise HTTPException(status_code=409, detail="A reload is already running")
+
+    logger.info(f"Admin reload requested (force={force}, wait={wait})")
+    if not wait:
+        reloader.start("admin", force=force)
+        return JSONResponse(
+            status_code=202, content={"accepted": True, "task": reloader.task_status}
+        )
+
+    state = await reloader.reload("admin", force=force)
+    if state.status == "failed":
+        raise HTTPException(status_code=500, detail=state.to_dict())
+    return state.to_dict()
+
+
+@router.get("/admin/reload")
+async def get_reload_status(x_admin_token: Optional[str] = Header(default=None)):
+    """Report the outcome of the most recent reload and of any background one."""
+    _authorize(x_admin_token)
+    reloader = _reloader()
+    return {**reloader.state.to_dict(), "task": reloader.task_status}
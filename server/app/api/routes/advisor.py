@@ -5,6 +5,8 @@ from app.core.vibe_engine import get_vibe_engine
 from app.services.data_service import get_data_service
 from app.core.advisors import crop_advisor, mood_predictor
 from app.core.advisors.fashion_rules import fashion_rules
+from app.services.result_cache import cached_response
+from datetime import datetime
 from typing import List
 import logging
 
@@ -72,66 +74,16 @@ async def get_advisor_recommendations(request: AdvisorRequest):
                 status_code=400, detail=f"Invalid advisor configuration: {str(e)}"
             )
 
-        required_params = vibe_config["parameters"]
-        logger.info(f"Required parameters: {required_params}")
-
-        # Get parameter values
-        logger.info("Getting parameter values")
-        try:
-            parameter_values = data_service.get_all_parameters(
-                required_params, request.lat, request.lon, request.month, request.year
-            )
-            logger.info(f"Parameter values retrieved: {parameter_values}")
-        except Exception as e:
-            logger.error(f"Error getting parameter values: {str(e)}")
-            raise HTTPException(
-                status_code=500, detail=f"Error retrieving weather data: {str(e)}"
-            )
-
-        if not parameter_values:
-            logger.error("No parameter values found")
-            raise HTTPException(
-                status_code=404, detail="No data available for the specified location"
-            )
-
-        # Get advisor function and generate recommendations
-        logger.info("Generating recommendations")
-        advisor_func = ADVISOR_FUNCTIONS[request.advisor_type]
-        logger.info(f"Using advisor function: {advisor_func}")
-
-        try:
-            advisor_result = advisor_func(
-                parameter_values, request.additional_params or {}
-            )
-            logger.info(f"Generated advisor result: {type(advisor_result)}")
-        except Exception as e:
-            logger.error(f"Error generating recommendations: {str(e)}")
-            raise HTTPException(
-                status_code=500, detail=f"Error generating recommendations: {str(e)}"
-            )
-
-        # Transform advisor result to list of recommendations
-        recommendations = _transform_advisor_result_to_recommendations(advisor_result, request.advisor_type)
-        logger.info(f"Transformed to {len(recommendations)} recommendations")
-
-        logger.info("Creating response")
-        response = AdvisorResponse(
-            advisor_type=request.advisor_type,
-            location={"lat": request.lat, "lon": request.lon},
-            recommendations=recommendations,
-            metadata={
-                "month": request.month,
-                "year": request.year,
-                "advisor_name": vibe_config.get("name", request.advisor_type),
-            },
-            raw_data=parameter_values,
+        # Points snapping to the same location share a result; echo this point
+        return await cached_response(
+            "advisor",
+            _cache_params(data_service, request),
+            lambda: _compute_advice(data_service, request, vibe_config),
+            data_service,
+            vibe_engine,
+            echo={"location": {"lat": request.lat, "lon": request.lon}},
         )
 
-        logger.info(
-            f"Advisor endpoint completed successfully. Returning {len(recommendations)} recommendations"
-        )
-        return response
-
     except ValueError as e:
         logger.error(f"ValueError in advisor endpoint: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -143,6 +95,85 @@ async def get_advisor_recommendations(request: AdvisorRequest):
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+def _cache_params(data_service, request):
+    """Canonical result-cache parameters, or None if no data location matches."""
+    location_name = data_service.nearest_location_name(request.lat, request.lon)
+    if location_name is None:
+        return None
+    return {
+        "advisor_type": request.advisor_type,
+        "location": location_name,
+        "month": request.month,
+        "year": request.year,
+        "additional_params": request.additional_params or {},
+        # Advisors consult the current month (e.g. for the season)
+        "current_month": datetime.now().strftime("%Y-%m"),
+    }
+
+
+def _compute_advice(data_service, request, vibe_config):
+    """Fetch the advisor's parameters and build its recommendations."""
+    required_params = vibe_config["parameters"]
+    logger.info(f"Required parameters: {required_params}")
+
+    # Get parameter values
+    logger.info("Getting parameter values")
+    try:
+        parameter_values = data_service.get_all_parameters(
+            required_params, request.lat, request.lon, request.month, request.year
+        )
+        logger.info(f"Parameter values retrieved: {parameter_values}")
+    except Exception as e:
+        logger.error(f"Error getting parameter values: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Error retrieving weather data: {str(e)}"
+        )
+
+    if not parameter_values:
+        logger.error("No parameter values found")
+        raise HTTPException(
+            status_code=404, detail="No data available for the specified location"
+        )
+
+    # Get advisor function and generate recommendations
+    logger.info("Generating recommendations")
+    advisor_func = ADVISOR_FUNCTIONS[request.advisor_type]
+    logger.info(f"Using advisor function: {advisor_func}")
+
+    try:
+        advisor_result = advisor_func(
+            parameter_values, request.additional_params or {}
+        )
+        logger.info(f"Generated advisor result: {type(advisor_result)}")
+    except Exception as e:
+        logger.error(f"Error generating recommendations: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Error generating recommendations: {str(e)}"
+        )
+
+    # Transform advisor result to list of recommendations
+    recommendations = _transform_advisor_result_to_recommendations(advisor_result, request.advisor_type)
+    logger.info(f"Transformed to {len(recommendations)} recommendations")
+
+    logger.info("Creating response")
+    response = AdvisorResponse(
+        advisor_type=request.advisor_type,
+        location={"lat": request.lat, "lon": request.lon},
+        recommendations=recommendations,
+        metadata={
+            "month": request.month,
+            "year": request.year,
+            "advisor_name": vibe_config.get("name", request.advisor_type),
+        },
+        raw_data=parameter_values,
+    )
+
+    logger.info(
+        f"Advisor endpoint completed successfully. Returning {len(recommendations)} recommendations"
+    )
+    return response
+
+
 def _transform_advisor_result_to_recommendations(advisor_result: dict, advisor_type: str) -> List[dict]:
     """
     Transform advisor result to list of Recommendation objects.
@@ -0,0 +1,139 @@
+from fastapi import APIRouter, HTTPException
+from app.models.requests import CompareRequest
+from app.models.responses import CompareResponse
+from app.core.vibe_engine import get_vibe_engine
+from app.services.data_service import get_data_service
+from app.services.compute_pool import run_compute
+from app.services.timeseries import TimeSpec
+from app.api.routes.when import MONTH_NAMES
+from datetime import datetime
+import numpy as np
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post("/compare", response_model=CompareResponse)
+async def compare_vibes(request: CompareRequest):
+    """
+    Score every standard vibe at once for a location or a radius.
+
+    The union of the vibes' parameters is fetched once and all vibes are
+    scored in a single pass. Without ``radius_km`` the columns are the 12
+    months (or the single month/date range given); with it, the columns are
+    the locations within the radius.
+
+    Args:
+        request: CompareRequest with location, optional radius and time
+
+    Returns:
+        CompareResponse with a vibes x columns score matrix
+
+    Raises:
+        HTTPException: If a vibe is unknown or no data is available
+    """
+    logger.info(f"Compare endpoint called with request: {request}")
+
+    try:
+        vibe_engine = get_vibe_engine()
+        data_service = get_data_service()
+
+        stacked = vibe_engine.get_stacked_plan(request.vibes)
+        logger.info(f"Comparing {len(stacked.vibe_ids)} vibes over {stacked.parameter_ids}")
+
+        return await run_compute(
+            _compute_compare, vibe_engine, data_service, request, stacked
+        )
+
+    except ValueError as e:
+        logger.error(f"ValueError in compare endpoint: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in compare endpoint: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+def _compute_compare(vibe_engine, data_service, request, stacked):
+    """Fetch the union of parameters once and score every vibe against it."""
+    parameter_ids = list(stacked.parameter_ids)
+    start_date = (
+        datetime.strptime(request.start_date, "%Y-%m-%d") if request.start_date else None
+    )
+    end_date = (
+        datetime.strptime(request.end_date, "%Y-%m-%d") if request.end_date else None
+    )
+
+    if request.radius_km is not None:
+        analysis_type = "locations"
+        coords, matrix = data_service.get_radius_matrix(
+            parameter_ids,
+            request.lat,
+            request.lon,
+            request.radius_km,
+            TimeSpec(request.month, request.year, start_date, end_date),
+        )
+        columns = [{"lat": lat, "lon": lon} for lat, lon in coords]
+    elif request.month is None and not (start_date or end_date):
+        analysis_type = "monthly"
+        specs = [TimeSpec(month, request.year) for month in range(1, 13)]
+        matrix = data_service.get_parameter_matrix(
+            parameter_ids, request.lat, request.lon, specs
+        )
+        columns = [
+            {"month": month, "month_name": MONTH_NAMES[month - 1]}
+            for month in range(1, 13)
+        ]
+    else:
+        analysis_type = "period"
+        spec = TimeSpec(request.month, request.year, start_date, end_date)
+        matrix = data_service.get_parameter_matrix(
+            parameter_ids, request.lat, request.lon, [spec]
+        )
+        columns = [
+            {
+                "month": request.month,
+                "year": request.year,
+                "start_date": request.start_date,
+                "end_date": request.end_date,
+            }
+        ]
+
+    # (n_vibes, n_columns); a vibe is unscored where any of its inputs is missing
+    scores = stacked.score(matrix)
+    incomplete = (np.isnan(matrix)[None, :, :] & stacked.usage[:, None, :]).any(axis=2)
+    scores[incomplete] = np.nan
+
+    if np.isnan(scores).all():
+        raise HTTPException(
+            status_code=404, detail="No valid data found for the specified location"
+        )
+
+    best_vibe = []
+    for column_scores in scores.T:
+        if np.isnan(column_scores).all():
+            best_vibe.append(None)
+        else:
+            best_vibe.append(stacked.vibe_ids[int(np.nanargmax(column_scores))])
+
+    return CompareResponse(
+        vibes=list(stacked.vibe_ids),
+        vibe_names=[
+            vibe_engine.get_vibe_config(v).get("name", v) for v in stacked.vibe_ids
+        ],
+        columns=columns,
+        scores=[
+            [None if np.isnan(x) else float(x) for x in row] for row in scores
+        ],
+        best_vibe=best_vibe,
+        analysis_type=analysis_type,
+        metadata={
+            "parameters": parameter_ids,
+            "num_columns": len(columns),
+            "year": request.year,
+        },
+    )
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from app.services.data_service import get_data_service
+from app.services.result_cache import get_result_cache
+from app.services.compute_pool import get_compute_pool
 from app.core.vibe_engine import get_vibe_engine
 from pathlib import Path
 import os
@@ -96,6 +98,40 @@ async def check_data_status():
         raise HTTPException(status_code=500, detail=f"Debug check failed: {str(e)}")
 
 
+@router.get("/debug/cache-stats")
+async def get_cache_stats():
+    """
+    Debug endpoint reporting location cache occupancy and hit/miss/eviction counters.
+    """
+    try:
+        data_service = get_data_service()
+        result_cache = get_result_cache()
+        return {
+            "location_cache": data_service.get_cache_stats(),
+            "grid_cache": data_service.grid_cache.stats(),
+            "distribution_cache": data_service.distribution_cache.stats(),
+            "result_cache": result_cache.stats() if result_cache else None,
+            "single_flight": {
+                "loads": data_service.load_flights.stats(),
+                "results": result_cache.flights.stats() if result_cache else None,
+            },
+        }
+    except Exception as e:
+        logger.error(f"Cache stats endpoint error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Cache stats failed: {str(e)}")
+
+
+@router.get("/debug/compute-pool")
+async def get_compute_pool_stats():
+    """
+    Debug endpoint reporting compute pool load and rejected/timed-out jobs.
+    """
+    pool = get_compute_pool()
+    if pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **pool.stats()}
+
+
 @router.get("/debug/test-data-download")
 async def test_data_download():
     """
@@ -1,10 +1,21 @@
 from fastapi import APIRouter, HTTPException
 from app.models.requests import WhenRequest
-from app.models.responses import WhenResponse, MonthlyScore, DailyScore, HourlyScore
+from app.models.responses import (
+    WhenResponse,
+    MonthlyScore,
+    MonthlyTrend,
+    DailyScore,
+    HourlyScore,
+)
 from app.core.vibe_engine import get_vibe_engine
 from app.services.data_service import get_data_service
-from datetime import datetime, timedelta
+from app.services.timeseries import TimeSpec
+from app.services.scoring_service import score_trends
+from app.services.result_cache import cached_response
+from app.config import settings
+from datetime import datetime
 from typing import List, Optional
+import numpy as np
 import logging
 
 # Configure logging
@@ -60,6 +71,11 @@ async def find_when(request: WhenRequest):
 
         analysis_type = request.analysis_type or "monthly"
         logger.info(f"Analysis type: {analysis_type}")
+        if request.distribution and analysis_type != "monthly":
+            raise HTTPException(
+                status_code=400,
+                detail="distribution is only available for monthly analysis",
+            )
 
         # Determine time parameters
         logger.info("Determining time parameters")
@@ -73,38 +89,29 @@ async def find_when(request: WhenRequest):
             year = request.year or datetime.now().year
             start_date = None
             end_date = None
+            if analysis_type == "hourly":
+                # Hourly analysis defaults to today
+                start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                end_date = start_date
 
         logger.info(
             f"Final time parameters - year: {year}, start_date: {start_date}, end_date: {end_date}"
         )
 
-        if analysis_type == "monthly":
-            logger.info("Calling monthly analysis")
-            return await _analyze_monthly(
-                vibe_engine,
-                data_service,
-                request,
-                vibe_config,
-                required_params,
-                year,
-                start_date,
-                end_date,
-            )
-        elif analysis_type == "daily":
-            logger.info("Calling daily analysis")
-            return await _analyze_daily(
-                vibe_engine,
-                data_service,
-                request,
-                vibe_config,
-                required_params,
-                year,
-                start_date,
-                end_date,
+        analyze = ANALYSES.get(analysis_type)
+        if analyze is None:
+            logger.error(f"Invalid analysis type: {analysis_type}")
+            raise HTTPException(
+                status_code=400,
+                detail="analysis_type must be 'monthly', 'monthly_trend', 'daily', or 'hourly'",
             )
-        elif analysis_type == "hourly":
-            logger.info("Calling hourly analysis")
-            return await _analyze_hourly(
+
+        logger.info(f"Calling {analysis_type} analysis")
+        # Points snapping to the same location share a result; echo this point
+        return await cached_response(
+            "when",
+            _cache_params(data_service, request, analysis_type, year, start_date, end_date),
+            lambda: analyze(
                 vibe_engine,
                 data_service,
                 request,
@@ -113,13 +120,11 @@ async def find_when(request: WhenRequest):
                 year,
                 start_date,
                 end_date,
-            )
-        else:
-            logger.error(f"Invalid analysis type: {analysis_type}")
-            raise HTTPException(
-                status_code=400,
-                detail="analysis_type must be 'monthly', 'daily', or 'hourly'",
-            )
+            ),
+            data_service,
+            vibe_engine,
+            echo={"location": {"lat": request.lat, "lon": request.lon}},
+        )
 
     except ValueError as e:
         logger.error(f"ValueError in when endpoint: {str(e)}")
@@ -132,7 +137,33 @@ async def find_when(request: WhenRequest):
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
-async def _analyze_monthly(
+def _cache_params(data_service, request, analysis_type, year, start_date, end_date):
+    """
+    Canonical result-cache parameters, or None if no data location matches.
+
+    Keyed on the dates the analysis actually uses, not the request strings,
+    so defaults such as "today" for hourly analysis are part of the key.
+    """
+    location_name = data_service.nearest_location_name(request.lat, request.lon)
+    if location_name is None:
+        return None
+    return {
+        "vibe": request.vibe,
+        "location": location_name,
+        "analysis_type": analysis_type,
+        "year": year,
+        "start_date": _format_date(start_date),
+        "end_date": _format_date(end_date),
+        "distribution": request.distribution,
+        "threshold": request.threshold,
+    }
+
+
+def _format_date(date: Optional[datetime]) -> Optional[str]:
+    return date.strftime("%Y-%m-%d") if date else None
+
+
+def _analyze_monthly(
     vibe_engine,
     data_service,
     request,
@@ -146,32 +177,31 @@ async def _analyze_monthly(
     logger.info("Starting monthly analysis")
     monthly_scores = []
 
-    # Calculate score for each month
+    # Fetch all 12 months x all parameters in one batched lookup
     logger.info("Calculating scores for each month")
-    for month in range(1, 13):
+    specs = [
+        TimeSpec(month=month, year=year, start_date=start_date, end_date=end_date)
+        for month in range(1, 13)
+    ]
+    matrix = data_service.get_parameter_matrix(
+        required_params, request.lat, request.lon, specs
+    )
+
+    # Score all 12 months in one vectorized pass
+    scores = vibe_engine.calculate_vibe_scores(request.vibe, matrix, required_params)
+
+    for month, row, score in zip(range(1, 13), matrix, scores.tolist()):
         logger.debug(f"Processing month {month}")
 
         try:
-            parameter_values = data_service.get_all_parameters(
-                required_params,
-                request.lat,
-                request.lon,
-                month,
-                year,
-                start_date,
-                end_date,
-            )
-            logger.debug(f"Parameter values for month {month}: {parameter_values}")
-
             # Skip if any required parameters are missing
-            if len(parameter_values) != len(required_params):
+            available = ~np.isnan(row)
+            if not available.all():
                 logger.warning(
-                    f"Skipping month {month}: Missing parameters. Got {len(parameter_values)}, expected {len(required_params)}"
+                    f"Skipping month {month}: Missing parameters. Got {int(available.sum())}, expected {len(required_params)}"
                 )
                 continue
 
-            # Calculate vibe score
-            score = vibe_engine.calculate_vibe_score(request.vibe, parameter_values)
             logger.debug(f"Calculated score for month {month}: {score}")
 
             monthly_scores.append(
@@ -185,6 +215,20 @@ async def _analyze_monthly(
 
     logger.info(f"Monthly analysis completed. Generated {len(monthly_scores)} scores")
 
+    if request.distribution:
+        threshold = (
+            request.threshold
+            if request.threshold is not None
+            else settings.good_score_threshold
+        )
+        distribution = data_service.get_score_distribution(
+            vibe_engine.get_scoring_plan(request.vibe), request.lat, request.lon, threshold
+        )
+        for monthly_score in monthly_scores:
+            summary = distribution.month(monthly_score.month) if distribution else None
+            for field, value in (summary or {}).items():
+                setattr(monthly_score, field, value)
+
     if not monthly_scores:
         logger.error("No monthly scores calculated")
         raise HTTPException(
@@ -202,9 +246,11 @@ async def _analyze_monthly(
         "num_months": len(monthly_scores),
         "vibe_name": vibe_config.get("name", request.vibe),
     }
+    if request.distribution:
+        metadata["distribution"] = {"threshold": threshold, "years": "all"}
 
     if start_date and end_date:
-        metadata["date_range"] = {"start": request.start_date, "end": request.end_date}
+        metadata["date_range"] = {"start": _format_date(start_date), "end": _format_date(end_date)}
 
     logger.info("Creating monthly response")
     response = WhenResponse(
@@ -221,7 +267,78 @@ async def _analyze_monthly(
     return response
 
 
-async def _analyze_daily(
+def _analyze_monthly_trend(
+    vibe_engine,
+    data_service,
+    request,
+    vibe_config,
+    required_params,
+    year,
+    start_date,
+    end_date,
+):
+    """Analyze each month's score across the years of the record."""
+    # Every year x month x parameter from the per-year monthly aggregates at once
+    years, cube = data_service.get_monthly_by_year(
+        required_params, request.lat, request.lon
+    )
+    if start_date and end_date:
+        keep = (years >= start_date.year) & (years <= end_date.year)
+        years, cube = years[keep], cube[keep]
+
+    n_years = len(years)
+    flat = cube.reshape(n_years * 12, len(required_params))
+    scores = vibe_engine.calculate_vibe_scores(request.vibe, flat, required_params)
+    # Skip year-months where any required parameter is missing
+    scores = np.where(np.isnan(flat).any(axis=1), np.nan, scores).reshape(n_years, 12)
+
+    mean, std, slope, counts = score_trends(years, scores)
+    if not counts.any():
+        raise HTTPException(
+            status_code=404, detail="No valid data found for the specified location"
+        )
+
+    monthly_trends = [
+        MonthlyTrend(
+            month=month,
+            month_name=MONTH_NAMES[month - 1],
+            scores=[None if np.isnan(v) else v for v in scores[:, month - 1].tolist()],
+            mean=float(mean[month - 1]),
+            std=float(std[month - 1]),
+            slope_per_year=None if np.isnan(slope[month - 1]) else float(slope[month - 1]),
+            num_years=int(counts[month - 1]),
+        )
+        for month in range(1, 13)
+        if counts[month - 1] > 0
+    ]
+
+    months = np.array([t.month for t in monthly_trends])
+    month_means = mean[months - 1]
+    month_slopes = slope[months - 1]
+    metadata = {
+        "num_years": n_years,
+        "num_months": len(monthly_trends),
+        "vibe_name": vibe_config.get("name", request.vibe),
+    }
+    if not np.isnan(month_slopes).all():
+        metadata["most_improving_month"] = int(months[np.nanargmax(month_slopes)])
+        metadata["most_declining_month"] = int(months[np.nanargmin(month_slopes)])
+    if start_date and end_date:
+        metadata["date_range"] = {"start": _format_date(start_date), "end": _format_date(end_date)}
+
+    return WhenResponse(
+        vibe=request.vibe,
+        location={"lat": request.lat, "lon": request.lon},
+        monthly_trends=monthly_trends,
+        years=years.tolist(),
+        best_month=int(months[np.argmax(month_means)]),
+        worst_month=int(months[np.argmin(month_means)]),
+        analysis_type="monthly_trend",
+        metadata=metadata,
+    )
+
+
+def _analyze_daily(
     vibe_engine,
     data_service,
     request,
@@ -238,44 +355,49 @@ async def _analyze_daily(
             detail="start_date and end_date are required for daily analysis",
         )
 
-    daily_scores = []
-    current_date = start_date
-
-    while current_date <= end_date:
-        # Get parameter values for this specific date
-        parameter_values = data_service.get_all_parameters(
-            required_params,
-            request.lat,
-            request.lon,
-            current_date.month,
-            year,
-            current_date,
-            current_date,
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+    num_requested = (end_date - start_date).days + 1
+    if num_requested > settings.max_daily_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Daily analysis covers at most {settings.max_daily_days} days; "
+            f"got {num_requested}",
         )
 
-        if len(parameter_values) == len(required_params):
-            score = vibe_engine.calculate_vibe_score(request.vibe, parameter_values)
-
-            daily_scores.append(
-                DailyScore(date=current_date.strftime("%Y-%m-%d"), score=score)
-            )
-
-        current_date += timedelta(days=1)
+    # Slice the whole range from the daily record once and score every day together
+    days, matrix, observed = data_service.get_daily_matrix(
+        required_params, request.lat, request.lon, start_date, end_date
+    )
+    scores = vibe_engine.calculate_vibe_scores(request.vibe, matrix, required_params)
 
-    if not daily_scores:
+    # Skip days where any required parameter is missing
+    complete = ~np.isnan(matrix).any(axis=1)
+    if not complete.any():
         raise HTTPException(
             status_code=404, detail="No valid data found for the specified date range"
         )
 
-    # Find best and worst dates
-    best_date = max(daily_scores, key=lambda x: x.score).date
-    worst_date = min(daily_scores, key=lambda x: x.score).date
+    days = days[complete]
+    scores = scores[complete]
+    date_strings = np.datetime_as_string(days, unit="D").tolist()
+    daily_scores = [
+        DailyScore(date=date, score=score)
+        for date, score in zip(date_strings, scores.tolist())
+    ]
+
+    # Find best and worst dates (first occurrence on ties)
+    best_date = date_strings[int(np.argmax(scores))]
+    worst_date = date_strings[int(np.argmin(scores))]
 
     metadata = {
         "year": year,
         "num_days": len(daily_scores),
+        "num_observed_days": int(observed[complete].sum()),
         "vibe_name": vibe_config.get("name", request.vibe),
-        "date_range": {"start": request.start_date, "end": request.end_date},
+        "date_range": {"start": _format_date(start_date), "end": _format_date(end_date)},
     }
 
     return WhenResponse(
@@ -289,7 +411,7 @@ async def _analyze_daily(
     )
 
 
-async def _analyze_hourly(
+def _analyze_hourly(
     vibe_engine,
     data_service,
     request,
@@ -299,62 +421,60 @@ async def _analyze_hourly(
     start_date,
     end_date,
 ):
-    """Analyze hourly scores for a specific date."""
-    if not start_date:
-        start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-    if not end_date:
-        end_date = start_date
-
-    hourly_scores = []
-
-    # For hourly analysis, we'll simulate hourly data based on daily patterns
-    # In a real implementation, you'd have hourly weather data
-    for hour in range(24):
-        # Simulate hourly variation (this is a simplified approach)
-        base_score = vibe_engine.calculate_vibe_score(
-            request.vibe,
-            data_service.get_all_parameters(
-                required_params,
-                request.lat,
-                request.lon,
-                start_date.month,
-                year,
-                start_date,
-                end_date,
-            ),
+    """
+    Analyze hourly scores for a date or date range.
+
+    This tree has daily data only, so each day is scored once from its daily
+    values and spread over 24 hours with the vibe's diurnal curve, giving a
+    (days x 24) array in one computation.
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+    num_requested = (end_date - start_date).days + 1
+    if num_requested > settings.max_daily_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Hourly analysis covers at most {settings.max_daily_days} days; "
+            f"got {num_requested}",
         )
 
-        # Add hourly variation based on typical patterns
-        if 6 <= hour <= 8:  # Morning
-            score = base_score * 0.9
-        elif 9 <= hour <= 11:  # Late morning
-            score = base_score * 1.1
-        elif 12 <= hour <= 14:  # Midday
-            score = base_score * 1.2
-        elif 15 <= hour <= 17:  # Afternoon
-            score = base_score * 1.1
-        elif 18 <= hour <= 20:  # Evening
-            score = base_score * 0.8
-        else:  # Night
-            score = base_score * 0.6
-
-        hourly_scores.append(
-            HourlyScore(hour=hour, score=max(0, min(100, score)))  # Clamp between 0-100
+    # One base fetch for the whole range, then every day x hour in one array
+    days, matrix, observed = data_service.get_daily_matrix(
+        required_params, request.lat, request.lon, start_date, end_date
+    )
+    scores = vibe_engine.calculate_hourly_scores(request.vibe, matrix, required_params)
+
+    complete = ~np.isnan(matrix).any(axis=1)
+    if not complete.any():
+        raise HTTPException(
+            status_code=404, detail="No valid data found for the specified date range"
         )
 
-    # Find best and worst hours
-    best_hour = max(hourly_scores, key=lambda x: x.score).hour
-    worst_hour = min(hourly_scores, key=lambda x: x.score).hour
+    days = days[complete]
+    scores = scores[complete]
+    date_strings = np.datetime_as_string(days, unit="D").tolist()
+    hourly_scores = [
+        HourlyScore(hour=hour, score=score, date=date)
+        for date, row in zip(date_strings, scores.tolist())
+        for hour, score in enumerate(row)
+    ]
+
+    # Find best and worst hours (first occurrence on ties)
+    best_day, best_hour = divmod(int(np.argmax(scores)), 24)
+    worst_day, worst_hour = divmod(int(np.argmin(scores)), 24)
 
     metadata = {
         "year": year,
         "num_hours": len(hourly_scores),
+        "num_days": len(date_strings),
+        "num_observed_days": int(observed[complete].sum()),
+        "best_date": date_strings[best_day],
+        "worst_date": date_strings[worst_day],
+        "hourly_source": "diurnal_curve",
         "vibe_name": vibe_config.get("name", request.vibe),
-        "date_range": {
-            "start": request.start_date or start_date.strftime("%Y-%m-%d"),
-            "end": request.end_date or end_date.strftime("%Y-%m-%d"),
-        },
+        "date_range": {"start": _format_date(start_date), "end": _format_date(end_date)},
     }
 
     return WhenResponse(
@@ -366,3 +486,11 @@ async def _analyze_hourly(
         analysis_type="hourly",
         metadata=metadata,
     )
+
+
+ANALYSES = {
+    "monthly": _analyze_monthly,
+    "monthly_trend": _analyze_monthly_trend,
+    "daily": _analyze_daily,
+    "hourly": _analyze_hourly,
+}
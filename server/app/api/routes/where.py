@@ -3,8 +3,13 @@ from app.models.requests import WhereRequest
 from app.models.responses import WhereResponse, LocationScore
 from app.core.vibe_engine import get_vibe_engine
 from app.services.data_service import get_data_service
+from app.services.timeseries import TimeSpec
+from app.config import settings
+from app.services.result_cache import cached_response, round_coordinate
 from datetime import datetime
 from typing import Optional
+import math
+import numpy as np
 import logging
 
 # Configure logging
@@ -75,53 +80,123 @@ async def find_where(request: WhereRequest):
             f"Final time parameters - month: {month}, year: {year}, start_date: {start_date}, end_date: {end_date}"
         )
 
-        # Get values in radius for each parameter
-        scores = []
+        # Keys round the center, so echo this request's exact center
+        return await cached_response(
+            "where",
+            _cache_params(request, month, year),
+            lambda: _compute_where(
+                vibe_engine,
+                data_service,
+                request,
+                vibe_config,
+                required_params,
+                month,
+                year,
+                start_date,
+                end_date,
+            ),
+            data_service,
+            vibe_engine,
+            echo={"metadata.center": {"lat": request.center_lat, "lon": request.center_lon}},
+        )
 
-        # First, collect all unique grid points
-        logger.info("Getting grid data for first parameter")
-        first_param = required_params[0]
-        logger.info(f"First parameter: {first_param}")
+    except ValueError as e:
+        logger.error(f"ValueError in where endpoint: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        # Re-raise HTTP exceptions as-is
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in where endpoint: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
+
+def _cache_params(request, month, year):
+    """Canonical result-cache parameters for a /where request."""
+    return {
+        "vibe": request.vibe,
+        "center": [
+            round_coordinate(request.center_lat),
+            round_coordinate(request.center_lon),
+        ],
+        "radius_km": request.radius_km,
+        "resolution": request.resolution,
+        "grid": request.grid,
+        "top_k": request.top_k,
+        "month": month,
+        "year": year,
+        "start_date": request.start_date,
+        "end_date": request.end_date,
+        "distribution": request.distribution,
+        "threshold": request.threshold,
+    }
+
+
+def _compute_where(
+    vibe_engine,
+    data_service,
+    request,
+    vibe_config,
+    required_params,
+    month,
+    year,
+    start_date,
+    end_date,
+):
+    """Score the radius and build the /where response."""
+    if request.distribution and (request.grid or month is None):
+        raise HTTPException(
+            status_code=400,
+            detail="distribution needs a month and station (non-grid) results",
+        )
+
+    scores = []
+    search_stats = None
+    spec = TimeSpec(month=month, year=year, start_date=start_date, end_date=end_date)
+
+    if request.grid:
+        logger.info(f"Interpolating onto a {request.resolution or 5} km grid")
+        scores = _score_grid(vibe_engine, data_service, request, required_params, spec)
+    elif request.top_k:
+        logger.info(f"Finding top {request.top_k} locations")
+        scores, search_stats = _find_top_k(vibe_engine, data_service, request, spec)
+    else:
+        # Fetch every location in the radius x all parameters in one batched lookup
+        logger.info("Getting grid data for all parameters")
         try:
-            grid_data = data_service.get_values_in_radius(
-                first_param,
+            coords, matrix = data_service.get_radius_matrix(
+                required_params,
                 request.center_lat,
                 request.center_lon,
                 request.radius_km,
-                month,
-                request.resolution,
-                year,
-                start_date,
-                end_date,
+                spec,
             )
-            logger.info(f"Grid data retrieved: {len(grid_data)} points")
+            logger.info(f"Grid data retrieved: {len(coords)} points")
         except Exception as e:
             logger.error(f"Error getting grid data: {str(e)}")
             raise HTTPException(
                 status_code=500, detail=f"Error getting grid data: {str(e)}"
             )
 
-        # For each grid point, get all parameter values and calculate score
+        # Score every grid point in one vectorized pass
         logger.info("Processing grid points")
-        for i, (lat, lon, _) in enumerate(grid_data):
-            logger.debug(f"Processing point {i+1}/{len(grid_data)}: ({lat}, {lon})")
+        point_scores = vibe_engine.calculate_vibe_scores(
+            request.vibe, matrix, required_params
+        )
+        for i, ((lat, lon), row, score) in enumerate(
+            zip(coords, matrix, point_scores.tolist())
+        ):
+            logger.debug(f"Processing point {i+1}/{len(coords)}: ({lat}, {lon})")
 
             try:
-                parameter_values = data_service.get_all_parameters(
-                    required_params, lat, lon, month, year, start_date, end_date
-                )
-                logger.debug(f"Parameter values for point {i+1}: {parameter_values}")
-
                 # Skip if any required parameters are missing
-                if len(parameter_values) != len(required_params):
+                available = ~np.isnan(row)
+                if not available.all():
                     logger.warning(
-                        f"Skipping point {i+1}: Missing parameters. Got {len(parameter_values)}, expected {len(required_params)}"
+                        f"Skipping point {i+1}: Missing parameters. Got {int(available.sum())}, expected {len(required_params)}"
                     )
                     continue
 
-                # Calculate vibe score
-                score = vibe_engine.calculate_vibe_score(request.vibe, parameter_values)
                 logger.debug(f"Calculated score for point {i+1}: {score}")
 
                 scores.append(LocationScore(lat=lat, lon=lon, score=score))
@@ -129,62 +204,147 @@ async def find_where(request: WhereRequest):
                 logger.error(f"Error processing point {i+1} ({lat}, {lon}): {str(e)}")
                 continue
 
-        logger.info(f"Processed {len(scores)} valid scores")
+    logger.info(f"Processed {len(scores)} valid scores")
 
-        if not scores:
-            logger.error("No valid scores calculated")
-            raise HTTPException(
-                status_code=404, detail="No valid data found in the specified area"
-            )
+    if request.distribution:
+        threshold = _attach_distributions(
+            vibe_engine, data_service, request, month, scores
+        )
+
+    if not scores:
+        logger.error("No valid scores calculated")
+        raise HTTPException(
+            status_code=404, detail="No valid data found in the specified area"
+        )
 
-        # Calculate statistics
-        logger.info("Calculating statistics")
-        score_values = [s.score for s in scores]
-        max_score = max(score_values)
-        min_score = min(score_values)
-        logger.info(f"Score range: {min_score} - {max_score}")
-
-        # Build metadata
-        logger.info("Building metadata")
-        metadata = {
-            "center": {"lat": request.center_lat, "lon": request.center_lon},
-            "radius_km": request.radius_km,
-            "resolution_km": request.resolution,
-            "num_points": len(scores),
-            "vibe_name": vibe_config.get("name", request.vibe),
+    # Calculate statistics
+    logger.info("Calculating statistics")
+    score_values = [s.score for s in scores]
+    max_score = max(score_values)
+    min_score = min(score_values)
+    logger.info(f"Score range: {min_score} - {max_score}")
+
+    # Build metadata
+    logger.info("Building metadata")
+    metadata = {
+        "center": {"lat": request.center_lat, "lon": request.center_lon},
+        "radius_km": request.radius_km,
+        "resolution_km": request.resolution,
+        "num_points": len(scores),
+        "vibe_name": vibe_config.get("name", request.vibe),
+    }
+    if request.grid:
+        metadata["grid"] = True
+        metadata["interpolation"] = "idw"
+    if request.top_k:
+        metadata["top_k"] = request.top_k
+    if search_stats is not None:
+        metadata["search"] = search_stats
+    if request.distribution:
+        metadata["distribution"] = {"threshold": threshold, "years": "all"}
+
+    # Add date range information if applicable
+    if start_date and end_date:
+        metadata["date_range"] = {
+            "start": request.start_date,
+            "end": request.end_date,
         }
 
-        # Add date range information if applicable
-        if start_date and end_date:
-            metadata["date_range"] = {
-                "start": request.start_date,
-                "end": request.end_date,
-            }
-
-        logger.info("Creating response")
-        response = WhereResponse(
-            vibe=request.vibe,
-            month=month,
-            year=year,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            scores=scores,
-            max_score=max_score,
-            min_score=min_score,
-            metadata=metadata,
-        )
+    logger.info("Creating response")
+    response = WhereResponse(
+        vibe=request.vibe,
+        month=month,
+        year=year,
+        start_date=request.start_date,
+        end_date=request.end_date,
+        scores=scores,
+        max_score=max_score,
+        min_score=min_score,
+        metadata=metadata,
+    )
 
-        logger.info(
-            f"Where endpoint completed successfully. Returning {len(scores)} locations"
+    logger.info(
+        f"Where endpoint completed successfully. Returning {len(scores)} locations"
+    )
+    return response
+
+
+def _find_top_k(vibe_engine, data_service, request, spec):
+    """Best ``request.top_k`` locations, pruned by climatology upper bounds."""
+    plan = vibe_engine.get_scoring_plan(request.vibe)
+    params = list(plan.parameter_ids)
+    results, stats = data_service.get_radius_top_k(
+        params,
+        request.center_lat,
+        request.center_lon,
+        request.radius_km,
+        spec,
+        request.top_k,
+        score_rows=plan.score,
+        upper_bound=plan.upper_bound,
+    )
+    logger.info(
+        f"Top-k search evaluated {stats['evaluated']} of {stats['candidates']} locations"
+    )
+    scores = [LocationScore(lat=lat, lon=lon, score=score) for lat, lon, score in results]
+    return scores, stats
+
+
+def _attach_distributions(vibe_engine, data_service, request, month, scores):
+    """Add the chance of a good day and score percentiles to each station score."""
+    threshold = (
+        request.threshold if request.threshold is not None else settings.good_score_threshold
+    )
+    distributions = data_service.get_radius_score_distributions(
+        vibe_engine.get_scoring_plan(request.vibe),
+        request.center_lat,
+        request.center_lon,
+        request.radius_km,
+        threshold,
+    )
+    for location_score in scores:
+        distribution = distributions.get((location_score.lat, location_score.lon))
+        summary = distribution.month(month) if distribution else None
+        for field, value in (summary or {}).items():
+            setattr(location_score, field, value)
+    return threshold
+
+
+def _score_grid(vibe_engine, data_service, request, required_params, spec):
+    """Score an IDW-interpolated grid over the radius in one batched pass."""
+    resolution_km = request.resolution or 5
+    estimated_points = math.pi * (request.radius_km / resolution_km) ** 2
+    if estimated_points > settings.max_grid_points:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Grid of ~{int(estimated_points)} points exceeds the limit of "
+                f"{settings.max_grid_points}; use a coarser resolution"
+            ),
         )
-        return response
 
-    except ValueError as e:
-        logger.error(f"ValueError in where endpoint: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in where endpoint: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+    lats, lons, matrix = data_service.get_grid_matrix(
+        required_params,
+        request.center_lat,
+        request.center_lon,
+        request.radius_km,
+        resolution_km,
+        spec,
+    )
+    point_scores = vibe_engine.calculate_vibe_scores(request.vibe, matrix, required_params)
+
+    # Only grid points where every required parameter could be interpolated
+    keep = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+    logger.info(f"Scored {len(keep)} of {len(lats)} grid points")
+    if request.top_k and len(keep) > request.top_k:
+        best = np.argpartition(-point_scores[keep], request.top_k - 1)[: request.top_k]
+        keep = keep[best]
+    if request.top_k:
+        keep = keep[np.argsort(-point_scores[keep], kind="stable")]
+
+    return [
+        LocationScore(lat=lat, lon=lon, score=score)
+        for lat, lon, score in zip(
+            lats[keep].tolist(), lons[keep].tolist(), point_scores[keep].tolist()
+        )
+    ]
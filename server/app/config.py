@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 import json
 import os
 
@@ -14,7 +14,52 @@ class Settings(BaseSettings):
 
     # Data Configuration
     data_path: str = "../data"
-    geotiff_cache_size: int = 100
+    precompute_climatology: bool = True
+    climatology_path: Optional[str] = None
+    use_binary_cache: bool = True
+    write_binary_cache: bool = True
+    location_cache_max_bytes: Optional[int] = 512 * 1024 * 1024
+    location_cache_ttl_seconds: Optional[float] = None
+    startup_index_workers: int = 8
+
+    # Gridded /where Configuration
+    grid_cache_size: int = 32
+    idw_neighbours: int = 4
+    idw_power: float = 2.0
+    max_grid_points: int = 250000
+
+    # /when Configuration
+    max_daily_days: int = 3660  # longest daily analysis range (~10 years)
+
+    # Distribution Scoring Configuration
+    good_score_threshold: float = 70.0  # a day "scores well" above this
+    distribution_cache_size: int = 256  # cached (location, vibe, threshold) entries
+
+    # Result Cache Configuration (/where, /when, /advisor)
+    result_cache_enabled: bool = True
+    result_cache_backend: str = "local"
+    result_cache_max_bytes: Optional[int] = 64 * 1024 * 1024
+    result_cache_ttl_seconds: Optional[float] = None
+
+    # Compute Pool Configuration (CPU-bound /where, /when, /advisor, /compare work)
+    compute_workers: int = 4  # 0 runs route work inline on the event loop
+    compute_queue_size: int = 16  # jobs allowed to wait; beyond this requests get 429
+    compute_timeout_seconds: Optional[float] = 30.0
+
+    # Shared Data Plane Configuration (multi-worker)
+    data_plane_enabled: bool = False  # attach to published snapshots instead of raw data
+    data_plane_path: Optional[str] = None  # default: <data_path>/outputs/snapshots
+    data_plane_poll_seconds: float = 5.0  # how often workers check for a new generation
+
+    # Hot Reload Configuration
+    reload_watch: bool = False  # rebuild when raw files under data/outputs change
+    reload_poll_seconds: float = 10.0
+    admin_token: Optional[str] = None  # required X-Admin-Token for /admin; unset disables it
+
+    # Warm-up Configuration
+    warmup_mode: str = "vibes"  # off | vibes | all
+    warmup_locations: str = ""  # comma-separated; empty means every location
+    warmup_background: bool = False
 
     # CORS Configuration
     cors_origins: List[str] = ["http://localhost:3000"]
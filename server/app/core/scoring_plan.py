@@ -0,0 +1,376 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+import numbers
+import numpy as np
+
+from app.services.scoring_service import (
+    calculate_weighted_scores,
+    score_low_is_better_array,
+    score_high_is_better_array,
+    score_optimal_range_array,
+)
+
+# Method codes stored in ScoringPlan.methods
+UNUSED = -1
+LOW_IS_BETTER = 0
+HIGH_IS_BETTER = 1
+OPTIMAL_RANGE = 2
+
+METHOD_CODES = {
+    "low_is_better": LOW_IS_BETTER,
+    "high_is_better": HIGH_IS_BETTER,
+    "optimal_range": OPTIMAL_RANGE,
+}
+
+# Config keys holding the (lower, upper) bounds of each method
+BOUND_KEYS = {
+    LOW_IS_BETTER: ("min", "max"),
+    HIGH_IS_BETTER: ("min", "max"),
+    OPTIMAL_RANGE: ("optimal_min", "optimal_max"),
+}
+
+
+# Hour-of-day score multipliers used when a vibe defines no "diurnal_curve":
+# night 0.6, morning 0.9, late morning 1.1, midday 1.2, afternoon 1.1, evening 0.8
+DEFAULT_DIURNAL_CURVE = (
+    (0.6,) * 6 + (0.9,) * 3 + (1.1,) * 3 + (1.2,) * 3 + (1.1,) * 3 + (0.8,) * 3 + (0.6,) * 3
+)
+
+
+def _readonly(values: Sequence, dtype) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+def gather_columns(
+    values: np.ndarray, parameter_ids: Sequence[str], target_ids: Sequence[str]
+) -> np.ndarray:
+    """Reorder columns labelled ``parameter_ids`` to ``target_ids``, NaN for absent ones."""
+    values = np.asarray(values, dtype=np.float64).reshape(-1, len(parameter_ids))
+    if tuple(parameter_ids) == tuple(target_ids):
+        return values
+    columns = {param_id: i for i, param_id in enumerate(parameter_ids)}
+    block = np.full((len(values), len(target_ids)), np.nan)
+    for j, param_id in enumerate(target_ids):
+        i = columns.get(param_id)
+        if i is not None:
+            block[:, j] = values[:, i]
+    return block
+
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    """
+    Validated, immutable scoring recipe for one standard vibe.
+
+    Parameter ``i`` is scored with ``methods[i]`` using the bounds
+    ``lower[i]``/``upper[i]`` (min/max, or optimal_min/optimal_max) and
+    ``falloff[i]`` for optimal ranges. ``weights`` sum to 1. ``diurnal``
+    holds 24 hour-of-day multipliers applied to a day's score.
+    """
+
+    vibe_id: str
+    parameter_ids: Tuple[str, ...]
+    methods: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    falloff: np.ndarray
+    weights: np.ndarray
+    diurnal: np.ndarray
+
+    def gather(self, values: np.ndarray, parameter_ids: Sequence[str]) -> np.ndarray:
+        """
+        Reorder the columns of ``values`` to this plan's parameter order.
+
+        Args:
+            values: Array of shape (n_samples, len(parameter_ids))
+            parameter_ids: Parameter ID of each column of ``values``
+
+        Returns:
+            Array of shape (n_samples, len(self.parameter_ids)), NaN for
+            parameters not present in ``parameter_ids``
+        """
+        return gather_columns(values, parameter_ids, self.parameter_ids)
+
+    def parameter_scores(self, block: np.ndarray) -> np.ndarray:
+        """Per-parameter 0-100 scores for a block in plan column order."""
+        scores = np.full(block.shape, np.nan)
+        for code, scorer in (
+            (LOW_IS_BETTER, score_low_is_better_array),
+            (HIGH_IS_BETTER, score_high_is_better_array),
+        ):
+            cols = self.methods == code
+            if cols.any():
+                scores[:, cols] = scorer(block[:, cols], self.lower[cols], self.upper[cols])
+        cols = self.methods == OPTIMAL_RANGE
+        if cols.any():
+            scores[:, cols] = score_optimal_range_array(
+                block[:, cols], self.lower[cols], self.upper[cols], self.falloff[cols]
+            )
+        return scores
+
+    def score(self, block: np.ndarray) -> np.ndarray:
+        """
+        Vibe scores for a block in plan column order.
+
+        Missing (NaN) values drop out and the remaining weights are
+        renormalized per row; rows with no values score 0.
+        """
+        return calculate_weighted_scores(self.parameter_scores(block), self.weights)
+
+    def hourly_scores(self, daily_scores: np.ndarray) -> np.ndarray:
+        """
+        Spread daily scores over the hours of the day with the diurnal curve.
+
+        Args:
+            daily_scores: Array of n_days scores
+
+        Returns:
+            Array of shape (n_days, 24) clamped to 0-100; NaN days stay NaN
+        """
+        daily_scores = np.asarray(daily_scores, dtype=np.float64).reshape(-1, 1)
+        return np.clip(daily_scores * self.diurnal, 0.0, 100.0)
+
+    def upper_bound(self, lower_values: np.ndarray, upper_values: np.ndarray) -> np.ndarray:
+        """
+        Highest score reachable when each value lies in ``[lower, upper]``.
+
+        Each parameter takes its best value inside its interval (the low end
+        for low_is_better, the high end for high_is_better, the point closest
+        to the optimum for optimal_range). Unknown (NaN) bounds count as 100.
+
+        Args:
+            lower_values: Lower bounds, shape (n_samples, n_parameters)
+            upper_values: Upper bounds, same shape
+
+        Returns:
+            Array of n_samples score upper bounds
+        """
+        lower_values = np.asarray(lower_values, dtype=np.float64)
+        upper_values = np.asarray(upper_values, dtype=np.float64)
+        best = np.where(self.methods == HIGH_IS_BETTER, upper_values, lower_values)
+        optimal = self.methods == OPTIMAL_RANGE
+        if optimal.any():
+            nearest = np.clip(self.lower, lower_values, upper_values)
+            best = np.where(optimal, nearest, best)
+        scores = self.parameter_scores(best)
+        scores = np.where(np.isnan(scores), 100.0, scores)
+        return scores @ self.weights
+
+    def score_values(self, parameter_values: Mapping[str, float]) -> float:
+        """Score a single sample given as a parameter ID -> value mapping."""
+        row = [
+            parameter_values.get(param_id, np.nan) for param_id in self.parameter_ids
+        ]
+        block = np.array([[np.nan if v is None else v for v in row]], dtype=np.float64)
+        return float(self.score(block)[0])
+
+
+def _number(vibe_id: str, param_id: str, config: Mapping[str, Any], key: str) -> float:
+    if key not in config:
+        raise ValueError(f"Vibe '{vibe_id}' parameter '{param_id}' is missing '{key}'")
+    value = config[key]
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        raise ValueError(
+            f"Vibe '{vibe_id}' parameter '{param_id}' has non-numeric '{key}': {value!r}"
+        )
+    return float(value)
+
+
+def compile_scoring_plan(vibe_id: str, config: Mapping[str, Any]) -> ScoringPlan:
+    """
+    Validate a standard vibe's configuration and compile it into a plan.
+
+    Args:
+        vibe_id: The vibe identifier
+        config: The vibe's entry in vibe_dictionary.json
+
+    Returns:
+        ScoringPlan for the vibe
+
+    Raises:
+        ValueError: If the configuration is malformed
+    """
+    parameters = config.get("parameters")
+    if not isinstance(parameters, list) or not parameters:
+        raise ValueError(f"Vibe '{vibe_id}' must define a non-empty 'parameters' list")
+
+    parameter_ids: List[str] = []
+    methods, lower, upper, falloff, weights = [], [], [], [], []
+    for param_config in parameters:
+        param_id = param_config.get("id") if isinstance(param_config, dict) else None
+        if not param_id:
+            raise ValueError(f"Vibe '{vibe_id}' has a parameter without an 'id'")
+        if param_id in parameter_ids:
+            raise ValueError(f"Vibe '{vibe_id}' lists parameter '{param_id}' twice")
+
+        method = METHOD_CODES.get(param_config.get("scoring"))
+        if method is None:
+            raise ValueError(
+                f"Unknown scoring method: {param_config.get('scoring')} "
+                f"(vibe '{vibe_id}', parameter '{param_id}')"
+            )
+
+        lower_key, upper_key = BOUND_KEYS[method]
+        lo = _number(vibe_id, param_id, param_config, lower_key)
+        hi = _number(vibe_id, param_id, param_config, upper_key)
+        if lo > hi:
+            raise ValueError(
+                f"Vibe '{vibe_id}' parameter '{param_id}' has {lower_key} > {upper_key}"
+            )
+
+        rate = 2.0
+        if method == OPTIMAL_RANGE and "falloff_rate" in param_config:
+            rate = _number(vibe_id, param_id, param_config, "falloff_rate")
+            if rate <= 0:
+                raise ValueError(
+                    f"Vibe '{vibe_id}' parameter '{param_id}' needs a positive falloff_rate"
+                )
+
+        weight = _number(vibe_id, param_id, param_config, "weight")
+        if weight < 0:
+            raise ValueError(f"Vibe '{vibe_id}' parameter '{param_id}' has a negative weight")
+
+        parameter_ids.append(param_id)
+        methods.append(method)
+        lower.append(lo)
+        upper.append(hi)
+        falloff.append(rate)
+        weights.append(weight)
+
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        raise ValueError(f"Vibe '{vibe_id}' weights must sum to a positive value")
+
+    diurnal = config.get("diurnal_curve", DEFAULT_DIURNAL_CURVE)
+    if not isinstance(diurnal, (list, tuple)) or len(diurnal) != 24:
+        raise ValueError(f"Vibe '{vibe_id}' diurnal_curve must list 24 hourly multipliers")
+    for multiplier in diurnal:
+        if isinstance(multiplier, bool) or not isinstance(multiplier, numbers.Real):
+            raise ValueError(
+                f"Vibe '{vibe_id}' diurnal_curve has non-numeric value: {multiplier!r}"
+            )
+        if multiplier < 0:
+            raise ValueError(f"Vibe '{vibe_id}' diurnal_curve has a negative multiplier")
+
+    return ScoringPlan(
+        vibe_id=vibe_id,
+        parameter_ids=tuple(parameter_ids),
+        methods=_readonly(methods, np.int8),
+        lower=_readonly(lower, np.float64),
+        upper=_readonly(upper, np.float64),
+        falloff=_readonly(falloff, np.float64),
+        weights=_readonly([w / total_weight for w in weights], np.float64),
+        diurnal=_readonly(diurnal, np.float64),
+    )
+
+
+@dataclass(frozen=True)
+class StackedScoringPlan:
+    """
+    Several vibes' plans laid out over the union of their parameters.
+
+    Row ``v`` of the ``(n_vibes, n_parameters)`` arrays is vibe ``v``;
+    parameters a vibe does not use have method ``UNUSED`` and weight 0, so
+    one pass over a ``(n_samples, n_parameters)`` block scores every vibe.
+    """
+
+    vibe_ids: Tuple[str, ...]
+    parameter_ids: Tuple[str, ...]
+    methods: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    falloff: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def usage(self) -> np.ndarray:
+        """Boolean ``(n_vibes, n_parameters)`` mask of parameters each vibe uses."""
+        return self.methods != UNUSED
+
+    def select(self, vibe_ids: Sequence[str]) -> "StackedScoringPlan":
+        """The plan restricted to ``vibe_ids`` (all stacked here), rows in that order."""
+        vibe_ids = tuple(vibe_ids)
+        if vibe_ids == self.vibe_ids:
+            return self
+        row = {vibe_id: v for v, vibe_id in enumerate(self.vibe_ids)}
+        rows = [row[vibe_id] for vibe_id in vibe_ids]
+        return StackedScoringPlan(
+            vibe_ids=vibe_ids,
+            parameter_ids=self.parameter_ids,
+            methods=_readonly(self.methods[rows], np.int8),
+            lower=_readonly(self.lower[rows], np.float64),
+            upper=_readonly(self.upper[rows], np.float64),
+            falloff=_readonly(self.falloff[rows], np.float64),
+            weights=_readonly(self.weights[rows], np.float64),
+        )
+
+    def gather(self, values: np.ndarray, parameter_ids: Sequence[str]) -> np.ndarray:
+        """Reorder the columns of ``values`` to the union parameter order."""
+        return gather_columns(values, parameter_ids, self.parameter_ids)
+
+    def score(self, block: np.ndarray) -> np.ndarray:
+        """
+        Score every vibe for a block in union column order.
+
+        Returns:
+            Array of shape (n_vibes, n_samples). Missing values drop out of
+            each vibe's weighting as in :meth:`ScoringPlan.score`.
+        """
+        block = np.asarray(block, dtype=np.float64)[None, :, :]
+        lower = self.lower[:, None, :]
+        upper = self.upper[:, None, :]
+        scores = np.full((len(self.vibe_ids),) + block.shape[1:], np.nan)
+        for code, values in (
+            (LOW_IS_BETTER, lambda: score_low_is_better_array(block, lower, upper)),
+            (HIGH_IS_BETTER, lambda: score_high_is_better_array(block, lower, upper)),
+            (
+                OPTIMAL_RANGE,
+                lambda: score_optimal_range_array(
+                    block, lower, upper, self.falloff[:, None, :]
+                ),
+            ),
+        ):
+            used = self.methods == code
+            if used.any():
+                scores = np.where(used[:, None, :], values(), scores)
+        return calculate_weighted_scores(scores, self.weights[:, None, :])
+
+
+def stack_scoring_plans(plans: Sequence[ScoringPlan]) -> StackedScoringPlan:
+    """Combine per-vibe plans into one plan over their parameter union."""
+    parameter_ids = tuple(sorted({p for plan in plans for p in plan.parameter_ids}))
+    column = {param_id: j for j, param_id in enumerate(parameter_ids)}
+    shape = (len(plans), len(parameter_ids))
+    methods = np.full(shape, UNUSED, dtype=np.int8)
+    lower = np.zeros(shape)
+    upper = np.ones(shape)
+    falloff = np.full(shape, 2.0)
+    weights = np.zeros(shape)
+    for v, plan in enumerate(plans):
+        cols = [column[p] for p in plan.parameter_ids]
+        methods[v, cols] = plan.methods
+        lower[v, cols] = plan.lower
+        upper[v, cols] = plan.upper
+        falloff[v, cols] = plan.falloff
+        weights[v, cols] = plan.weights
+
+    return StackedScoringPlan(
+        vibe_ids=tuple(plan.vibe_id for plan in plans),
+        parameter_ids=parameter_ids,
+        methods=_readonly(methods, np.int8),
+        lower=_readonly(lower, np.float64),
+        upper=_readonly(upper, np.float64),
+        falloff=_readonly(falloff, np.float64),
+        weights=_readonly(weights, np.float64),
+    )
+
+
+def compile_scoring_plans(vibes: Mapping[str, Mapping[str, Any]]) -> Dict[str, ScoringPlan]:
+    """Compile every standard (non-advisor) vibe, failing on the first bad entry."""
+    return {
+        vibe_id: compile_scoring_plan(vibe_id, config)
+        for vibe_id, config in vibes.items()
+        if config.get("type", "standard") != "advisor"
+    }
@@ -1,12 +1,19 @@
+import hashlib
 import json
+import numpy as np
 from pathlib import Path
-from typing import Dict, Any, List
-from app.services.scoring_service import (
-    score_low_is_better,
-    score_high_is_better,
-    score_optimal_range,
-    calculate_weighted_score
+from typing import Dict, Any, List, Optional, Sequence
+from app.core.scoring_plan import (
+    ScoringPlan,
+    StackedScoringPlan,
+    compile_scoring_plans,
+    stack_scoring_plans,
 )
+from app.services.cache import LRUCache
+
+
+# Distinct vibe selections whose stacked plans are kept
+STACKED_PLAN_CACHE_SIZE = 64
 
 
 class VibeEngine:
@@ -15,15 +22,31 @@ class VibeEngine:
     def __init__(self, config_path: str = "config/vibe_dictionary.json"):
         self.config_path = Path(config_path)
         self.vibes: Dict[str, Any] = {}
+        self.fingerprint: Optional[str] = None
+        self.plans: Dict[str, ScoringPlan] = {}
+        self._stacked_plans = LRUCache(max_entries=STACKED_PLAN_CACHE_SIZE)
         self.load_vibes()
 
     def load_vibes(self):
-        """Load vibe configurations from JSON file."""
+        """
+        Load vibe configurations from JSON file and compile their scoring plans.
+
+        Raises:
+            FileNotFoundError: If the vibe dictionary does not exist
+            ValueError: If a standard vibe is misconfigured
+        """
         if not self.config_path.exists():
             raise FileNotFoundError(f"Vibe dictionary not found at {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            self.vibes = json.load(f)
+        with open(self.config_path, 'rb') as f:
+            raw = f.read()
+        vibes = json.loads(raw)
+
+        # Validate everything before replacing the current vibes
+        self.plans = compile_scoring_plans(vibes)
+        self._stacked_plans = LRUCache(max_entries=STACKED_PLAN_CACHE_SIZE)
+        self.vibes = vibes
+        self.fingerprint = hashlib.sha1(raw).hexdigest()[:16]
 
         print(f"Loaded {len(self.vibes)} vibes from {self.config_path}")
 
@@ -61,6 +84,20 @@ class VibeEngine:
 
         return [param["id"] for param in config["parameters"]]
 
+    def get_scoring_plan(self, vibe_id: str) -> ScoringPlan:
+        """
+        Get the compiled scoring plan for a standard vibe.
+
+        Raises:
+            ValueError: If vibe_id is not found or is an advisor
+        """
+        config = self.get_vibe_config(vibe_id)
+
+        if config.get("type") == "advisor":
+            raise ValueError("Advisors use custom logic, not scoring")
+
+        return self.plans[vibe_id]
+
     def calculate_vibe_score(
         self,
         vibe_id: str,
@@ -79,50 +116,96 @@ class VibeEngine:
         Raises:
             ValueError: If vibe is an advisor type (advisors use custom logic)
         """
-        config = self.get_vibe_config(vibe_id)
+        return self.get_scoring_plan(vibe_id).score_values(parameter_values)
 
-        if config.get("type") == "advisor":
-            raise ValueError("Advisors use custom logic, not scoring")
+    def calculate_vibe_scores(
+        self,
+        vibe_id: str,
+        values: np.ndarray,
+        parameter_ids: List[str]
+    ) -> np.ndarray:
+        """
+        Calculate vibe scores for many samples in one vectorized pass.
+
+        Args:
+            vibe_id: The vibe identifier
+            values: Array of shape (n_samples, len(parameter_ids)); NaN marks
+                a missing value, whose weight is dropped for that sample
+            parameter_ids: Parameter ID of each column of ``values``
 
-        parameter_scores = {}
-        weights = {}
-
-        for param_config in config["parameters"]:
-            param_id = param_config["id"]
-            weight = param_config["weight"]
-            scoring_method = param_config["scoring"]
-
-            value = parameter_values.get(param_id)
-            if value is None:
-                continue
-
-            # Score based on method
-            if scoring_method == "low_is_better":
-                score = score_low_is_better(
-                    value,
-                    param_config["min"],
-                    param_config["max"]
-                )
-            elif scoring_method == "high_is_better":
-                score = score_high_is_better(
-                    value,
-                    param_config["min"],
-                    param_config["max"]
-                )
-            elif scoring_method == "optimal_range":
-                score = score_optimal_range(
-                    value,
-                    param_config["optimal_min"],
-                    param_config["optimal_max"],
-                    param_config.get("falloff_rate", 2.0)
-                )
-            else:
-                raise ValueError(f"Unknown scoring method: {scoring_method}")
-
-            parameter_scores[param_id] = score
-            weights[param_id] = weight
-
-        return calculate_weighted_score(parameter_scores, weights)
+        Returns:
+            Array of n_samples scores from 0-100
+
+        Raises:
+            ValueError: If vibe is an advisor type (advisors use custom logic)
+        """
+        plan = self.get_scoring_plan(vibe_id)
+        return plan.score(plan.gather(values, parameter_ids))
+
+    def calculate_hourly_scores(
+        self,
+        vibe_id: str,
+        values: np.ndarray,
+        parameter_ids: List[str]
+    ) -> np.ndarray:
+        """
+        Score each day once and spread it over 24 hours with the vibe's diurnal curve.
+
+        Args:
+            vibe_id: The vibe identifier
+            values: Daily values of shape (n_days, len(parameter_ids))
+            parameter_ids: Parameter ID of each column of ``values``
+
+        Returns:
+            Array of shape (n_days, 24) with scores from 0-100
+
+        Raises:
+            ValueError: If vibe is an advisor type (advisors use custom logic)
+        """
+        plan = self.get_scoring_plan(vibe_id)
+        return plan.hourly_scores(plan.score(plan.gather(values, parameter_ids)))
+
+    def get_stacked_plan(
+        self, vibe_ids: Optional[Sequence[str]] = None
+    ) -> StackedScoringPlan:
+        """
+        Get a combined plan for several standard vibes (default: all of them).
+
+        Rows follow the requested order with duplicates dropped. Plans are
+        cached per set of vibes, so reorderings of a selection share one
+        entry, and the cache is bounded to the most recent selections.
+
+        Raises:
+            ValueError: If a vibe is not found or is an advisor
+        """
+        requested = tuple(dict.fromkeys(vibe_ids if vibe_ids is not None else self.plans))
+        key = tuple(sorted(requested))
+        stacked = self._stacked_plans.get(key)
+        if stacked is None:
+            stacked = stack_scoring_plans([self.get_scoring_plan(v) for v in key])
+            self._stacked_plans.put(key, stacked)
+        return stacked.select(requested)
+
+    def calculate_all_vibe_scores(
+        self,
+        values: np.ndarray,
+        parameter_ids: List[str],
+        vibe_ids: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        Score several vibes (default: every standard vibe) in one pass.
+
+        Args:
+            values: Array of shape (n_samples, len(parameter_ids)), typically
+                fetched for ``get_stacked_plan(vibe_ids).parameter_ids``
+            parameter_ids: Parameter ID of each column of ``values``
+            vibe_ids: Vibes to score, in output row order
+
+        Returns:
+            Array of shape (n_vibes, n_samples) with scores from 0-100
+        """
+        stacked = self.get_stacked_plan(vibe_ids)
+        return stacked.score(stacked.gather(values, parameter_ids))
 
     def list_vibes(self) -> List[Dict[str, str]]:
         """
@@ -1,10 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.config import settings
 from app.api.router import api_router
 from app.core import vibe_engine as vibe_engine_module
 from app.services import data_service as data_service_module
+from app.services import compute_pool as compute_pool_module
+from app.services import data_plane
+from app.services import reload as reload_module
+from app.services import result_cache as result_cache_module
+from app.services import warmup as warmup_module
+import asyncio
+import functools
+from typing import List, Optional
 import logging
 import sys
 import os
@@ -28,6 +37,49 @@ logging.getLogger("app.services.data_service").setLevel(logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+def _data_plane_root() -> Optional[str]:
+    """Snapshot root workers attach to, or None when the data plane is off."""
+    if not settings.data_plane_enabled:
+        return None
+    return settings.data_plane_path or str(data_plane.default_root(settings.data_path))
+
+
+def _create_data_service() -> data_service_module.DataService:
+    """Build a DataService from the current settings."""
+    return data_service_module.DataService(
+        settings.data_path,
+        precompute_climatology=settings.precompute_climatology,
+        climatology_path=settings.climatology_path,
+        use_binary_cache=settings.use_binary_cache,
+        write_binary_cache=settings.write_binary_cache,
+        cache_max_bytes=settings.location_cache_max_bytes,
+        cache_ttl_seconds=settings.location_cache_ttl_seconds,
+        index_workers=settings.startup_index_workers,
+        grid_cache_size=settings.grid_cache_size,
+        idw_neighbours=settings.idw_neighbours,
+        idw_power=settings.idw_power,
+        distribution_cache_size=settings.distribution_cache_size,
+        snapshot_root=_data_plane_root(),
+    )
+
+
+def _warmup_locations() -> List[str]:
+    return [name.strip() for name in settings.warmup_locations.split(",") if name.strip()]
+
+
+def _prepare_reloaded_service(
+    service: data_service_module.DataService, vibe_engine: vibe_engine_module.VibeEngine
+):
+    """Warm a reloaded service like the startup one before it takes traffic."""
+    warmup_module.run_warmup(
+        warmup_module.WarmupState(),
+        service,
+        vibe_engine,
+        settings.warmup_mode,
+        _warmup_locations(),
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
@@ -65,14 +117,82 @@ async def lifespan(app: FastAPI):
     # Initialize data service
     logger.info(f"Initializing data service (path: {settings.data_path})...")
     try:
-        data_service_module.data_service = data_service_module.DataService(
-            settings.data_path
-        )
+        data_service_module.data_service = _create_data_service()
         logger.info("✓ Data service initialized")
     except Exception as e:
         logger.error(f"Failed to initialize data service: {e}")
         raise
 
+    # Initialize result cache
+    if settings.result_cache_enabled:
+        result_cache_module.result_cache = result_cache_module.ResultCache(
+            result_cache_module.create_backend(
+                settings.result_cache_backend,
+                max_bytes=settings.result_cache_max_bytes,
+                ttl_seconds=settings.result_cache_ttl_seconds,
+            )
+        )
+        logger.info(f"✓ Result cache enabled (backend: {settings.result_cache_backend})")
+
+    # Initialize compute pool for CPU-bound route work
+    if settings.compute_workers > 0:
+        compute_pool_module.compute_pool = compute_pool_module.ComputePool(
+            max_workers=settings.compute_workers,
+            max_queue=settings.compute_queue_size,
+            timeout_seconds=settings.compute_timeout_seconds,
+        )
+        logger.info(f"✓ Compute pool started ({settings.compute_workers} workers)")
+
+    # Hot reload: rebuild in the background and swap when the data changes
+    reload_module.reloader = reload_module.SnapshotReloader(
+        _create_data_service,
+        prepare=_prepare_reloaded_service,
+        vibes_factory=vibe_engine_module.VibeEngine,
+    )
+    watch_task = None
+    if settings.data_plane_enabled:
+        root = _data_plane_root()
+        watch_task = asyncio.create_task(
+            reload_module.watch(
+                reload_module.reloader,
+                functools.partial(data_plane.read_current, root),
+                settings.data_plane_poll_seconds,
+                settle=False,
+            )
+        )
+        logger.info(f"✓ Following data snapshots under {root}")
+    elif settings.reload_watch:
+        watch_task = asyncio.create_task(
+            reload_module.watch(
+                reload_module.reloader,
+                functools.partial(
+                    reload_module.raw_files_signature,
+                    settings.data_path,
+                    [str(vibe_engine_module.vibe_engine.config_path)],
+                ),
+                settings.reload_poll_seconds,
+            )
+        )
+        logger.info(f"✓ Watching {settings.data_path}/outputs and the vibe dictionary")
+
+    # Warm up caches; /ready reports 503 until this completes
+    warmup_locations = _warmup_locations()
+    warm_up = functools.partial(
+        warmup_module.run_warmup,
+        warmup_module.warmup_state,
+        data_service_module.data_service,
+        vibe_engine_module.vibe_engine,
+        settings.warmup_mode,
+        warmup_locations,
+    )
+    if settings.warmup_background:
+        logger.info(f"Starting background warm-up (mode: {settings.warmup_mode})...")
+        warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    else:
+        logger.info(f"Warming up (mode: {settings.warmup_mode})...")
+        await asyncio.to_thread(warm_up)
+        logger.info(f"✓ Warm-up {warmup_module.warmup_state.status}")
+
     logger.info("=" * 50)
     logger.info(f"Server ready at http://{settings.host}:{settings.port}")
     logger.info(f"API docs at http://{settings.host}:{settings.port}/docs")
@@ -82,6 +202,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Cleanup if needed
     logger.info("Shutting down Weather Vibes API...")
+    if watch_task is not None:
+        watch_task.cancel()
+    if compute_pool_module.compute_pool is not None:
+        compute_pool_module.compute_pool.shutdown()
+        compute_pool_module.compute_pool = None
+    if settings.warmup_background and not warmup_task.done():
+        logger.info("Warm-up still running at shutdown")
 
 
 # Create FastAPI application
@@ -117,6 +244,7 @@ async def root():
         "description": "Theme-based weather discovery engine",
         "docs": "/docs",
         "health": "/health",
+        "ready": "/ready",
         "vibes": "/vibes",
     }
 
@@ -137,6 +265,16 @@ async def health_check():
         return {"status": "unhealthy", "error": str(e)}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the startup warm-up has completed."""
+    state = warmup_module.warmup_state
+    body = {"ready": state.ready, **state.to_dict()}
+    if not state.ready:
+        return JSONResponse(status_code=503, content=body)
+    return body
+
+
 @app.get("/vibes")
 async def list_vibes():
     """List all available vibes and advisors."""
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 
 
@@ -16,7 +16,21 @@ class WhereRequest(BaseModel):
     center_lat: float = Field(..., ge=-90, le=90, description="Center latitude")
     center_lon: float = Field(..., ge=-180, le=180, description="Center longitude")
     radius_km: float = Field(..., gt=0, le=500, description="Search radius in km")
-    resolution: Optional[float] = Field(5, description="Grid resolution in km")
+    resolution: Optional[float] = Field(5, gt=0, description="Grid resolution in km")
+    grid: bool = Field(
+        False,
+        description="Interpolate onto a regular grid at `resolution` instead of station points",
+    )
+    top_k: Optional[int] = Field(
+        None, ge=1, le=1000, description="Return only the k best scoring locations"
+    )
+    distribution: bool = Field(
+        False,
+        description="Add the chance of a good day and score percentiles from daily history",
+    )
+    threshold: Optional[float] = Field(
+        None, ge=0, le=100, description="Score a day must exceed to count as good"
+    )
 
     class Config:
         json_schema_extra = {
@@ -43,7 +57,15 @@ class WhenRequest(BaseModel):
     )
     end_date: Optional[str] = Field(None, description="End date in YYYY-MM-DD format")
     analysis_type: Optional[str] = Field(
-        "monthly", description="Analysis type: 'monthly', 'daily', or 'hourly'"
+        "monthly",
+        description="Analysis type: 'monthly', 'monthly_trend', 'daily', or 'hourly'",
+    )
+    distribution: bool = Field(
+        False,
+        description="Add the chance of a good day and score percentiles from daily history",
+    )
+    threshold: Optional[float] = Field(
+        None, ge=0, le=100, description="Score a day must exceed to count as good"
     )
 
     class Config:
@@ -57,6 +79,34 @@ class WhenRequest(BaseModel):
         }
 
 
+class CompareRequest(BaseModel):
+    """Request model for scoring every vibe at a location or within a radius."""
+
+    lat: float = Field(..., ge=-90, le=90, description="Latitude (or search center)")
+    lon: float = Field(..., ge=-180, le=180, description="Longitude (or search center)")
+    radius_km: Optional[float] = Field(
+        None, gt=0, le=500, description="Score every location within this radius"
+    )
+    vibes: Optional[List[str]] = Field(
+        None, description="Vibe IDs to compare (default: all standard vibes)"
+    )
+    month: Optional[int] = Field(None, ge=1, le=12, description="Month (1-12)")
+    year: Optional[int] = Field(None, description="Year for historical data")
+    start_date: Optional[str] = Field(
+        None, description="Start date in YYYY-MM-DD format"
+    )
+    end_date: Optional[str] = Field(None, description="End date in YYYY-MM-DD format")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "lat": 12.9716,
+                "lon": 77.5946,
+                "year": 2023,
+            }
+        }
+
+
 class AdvisorRequest(BaseModel):
     """Request model for getting specialized advisor recommendations."""
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class LocationScore(BaseModel):
@@ -8,6 +8,11 @@ class LocationScore(BaseModel):
     lat: float
     lon: float
     score: float
+    # Set when the request asks for the daily score distribution
+    probability: Optional[float] = None  # share of days scoring above the threshold
+    p10: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
 
 
 class WhereResponse(BaseModel):
@@ -30,6 +35,11 @@ class MonthlyScore(BaseModel):
     month: int
     month_name: str
     score: float
+    # Set when the request asks for the daily score distribution
+    probability: Optional[float] = None  # share of days scoring above the threshold
+    p10: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
 
 
 class DailyScore(BaseModel):
@@ -44,6 +54,19 @@ class HourlyScore(BaseModel):
 
     hour: int
     score: float
+    date: Optional[str] = None
+
+
+class MonthlyTrend(BaseModel):
+    """A month's score in every year of the record, with its trend."""
+
+    month: int
+    month_name: str
+    scores: List[Optional[float]]  # aligned to WhenResponse.years, None where missing
+    mean: float
+    std: float
+    slope_per_year: Optional[float] = None  # None with fewer than two years
+    num_years: int
 
 
 class WhenResponse(BaseModel):
@@ -54,6 +77,8 @@ class WhenResponse(BaseModel):
     monthly_scores: Optional[List[MonthlyScore]] = None
     daily_scores: Optional[List[DailyScore]] = None
     hourly_scores: Optional[List[HourlyScore]] = None
+    monthly_trends: Optional[List[MonthlyTrend]] = None
+    years: Optional[List[int]] = None
     best_month: Optional[int] = None
     worst_month: Optional[int] = None
     best_date: Optional[str] = None
@@ -64,6 +89,18 @@ class WhenResponse(BaseModel):
     metadata: dict
 
 
+class CompareResponse(BaseModel):
+    """Response model for the compare endpoint: a vibes x columns score matrix."""
+
+    vibes: List[str]
+    vibe_names: List[str]
+    columns: List[Dict[str, Any]]  # one per month, date range or location
+    scores: List[List[Optional[float]]]  # None where a vibe lacks data
+    best_vibe: List[Optional[str]]  # highest scoring vibe per column
+    analysis_type: str  # "monthly", "period" or "locations"
+    metadata: dict
+
+
 class Recommendation(BaseModel):
     """A single recommendation from an advisor."""
 
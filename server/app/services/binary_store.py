@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import logging
+import os
+import threading
+import numpy as np
+
+from app.services.timeseries import LocationSeries
+
+logger = logging.getLogger(__name__)
+
+# Layout shared with data/pipeline/compiled.py
+COMPILED_DIRNAME = "compiled"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+class StaleCompiledDataError(ValueError):
+    """A compiled directory was rewritten after its manifest was read."""
+
+
+def read_manifest(compiled_dir: Path) -> Optional[Dict]:
+    """Read a compiled location manifest, or None if absent or unreadable."""
+    path = compiled_dir / MANIFEST_NAME
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read manifest {path}: {e}")
+        return None
+    if manifest.get("format_version") != FORMAT_VERSION:
+        logger.info(f"Ignoring {path}: unsupported format version")
+        return None
+    return manifest
+
+
+def is_current(manifest: Dict, raw_files: List[Path]) -> bool:
+    """Whether a compiled manifest was built from exactly these raw files."""
+    if sorted(manifest.get("source_files", [])) != sorted(f.name for f in raw_files):
+        return False
+    newest_raw = max((f.stat().st_mtime for f in raw_files), default=0.0)
+    return manifest.get("source_mtime", 0.0) >= newest_raw
+
+
+def load_compiled_index(compiled_dir: Path, manifest: Dict) -> LocationSeries:
+    """Load the date index of a compiled location as a series without columns."""
+    dates = np.load(compiled_dir / "dates.npy")
+    if len(dates) != manifest["n_days"]:
+        raise StaleCompiledDataError(f"{compiled_dir} dates do not match its manifest")
+    return LocationSeries(
+        lat=manifest["lat"],
+        lon=manifest["lon"],
+        dates=np.asarray(dates, dtype="datetime64[D]"),
+    )
+
+
+def load_compiled_column(
+    compiled_dir: Path, parameter_id: str, mmap: bool = True
+) -> np.ndarray:
+    """
+    Load one compiled parameter column.
+
+    With ``mmap`` the column is a read-only memory map, so the OS page cache
+    is shared by every worker process reading the same files.
+    """
+    return np.load(compiled_dir / f"{parameter_id}.npy", mmap_mode="r" if mmap else None)
+
+
+def _tmp_path(path: Path) -> Path:
+    # Unique per process and thread so concurrent writers never share a temp file
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _atomic_save(path: Path, array: np.ndarray):
+    # Replace rather than overwrite so existing memory maps keep the old inode
+    tmp = _tmp_path(path)
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def write_compiled_series(
+    series: LocationSeries, compiled_dir: Path, raw_files: List[Path]
+) -> Path:
+    """
+    Write a LocationSeries in the compiled layout.
+
+    Used to rebuild the binary artifact from raw JSON when it is missing or
+    stale. Columns are stored as float32. The old manifest is withdrawn
+    before any column is replaced, so a reader that finds its manifest
+    unchanged after mapping a column knows the column is the one it indexed.
+    """
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    (compiled_dir / MANIFEST_NAME).unlink(missing_ok=True)
+    _atomic_save(compiled_dir / "dates.npy", series.dates.astype("datetime64[D]"))
+    for param, values in series.columns.items():
+        _atomic_save(compiled_dir / f"{param}.npy", np.asarray(values, dtype=np.float32))
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "lat": series.lat,
+        "lon": series.lon,
+        "parameters": series.parameters,
+        "n_days": int(len(series.dates)),
+        "start_date": str(series.dates[0]) if len(series.dates) else None,
+        "end_date": str(series.dates[-1]) if len(series.dates) else None,
+        "source_files": sorted(f.name for f in raw_files),
+        "source_mtime": max((f.stat().st_mtime for f in raw_files), default=0.0),
+    }
+    # Manifest last so a half-written directory is never picked up as current
+    tmp = _tmp_path(compiled_dir / MANIFEST_NAME)
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, compiled_dir / MANIFEST_NAME)
+    logger.info(f"Wrote compiled data to {compiled_dir}")
+    return compiled_dir
@@ -0,0 +1,141 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+import sys
+import threading
+import time
+
+
+def estimate_size(value: Any) -> int:
+    """Best-effort size in bytes: ``nbytes`` when available, else ``sys.getsizeof``."""
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with a byte budget.
+
+    Entries are evicted oldest-first once the total accounted size exceeds
+    ``max_bytes`` or the entry count exceeds ``max_entries``. Entries older
+    than ``ttl_seconds`` are treated as misses and dropped on access.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, size, inserted_at)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def _expired(self, entry: tuple) -> bool:
+        return self.ttl_seconds is not None and self._clock() - entry[2] > self.ttl_seconds
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it recently used) or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> bool:
+        """
+        Insert or replace an entry, evicting older entries to fit the budget.
+
+        Returns:
+            False if the value alone exceeds ``max_bytes`` and was not cached
+        """
+        size = self._sizeof(value) if size is None else int(size)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return False
+
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            while self._over_budget():
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            return True
+
+    def _over_budget(self) -> bool:
+        if self.max_bytes is not None and self._bytes > self.max_bytes:
+            return True
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return False
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._remove(key)
+            return entry[0]
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and occupancy for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,484 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+import argparse
+import json
+import logging
+import warnings
+import numpy as np
+import yaml
+
+from app.services.timeseries import LocationSeries
+
+logger = logging.getLogger(__name__)
+
+CUBE_FILENAME = "climatology_cube.npz"
+CUBE_ARRAYS = ("years", "year_range", "sums", "counts", "mins", "maxs")
+CUBE_META_NAME = "cube.json"
+
+# Same aliases the offline pipeline accepts in data/pipeline/aggregation.py
+AGGREGATION_ALIASES = {
+    "mean": "mean",
+    "avg": "mean",
+    "sum": "sum",
+    "total": "sum",
+    "min": "min",
+    "minimum": "min",
+    "max": "max",
+    "maximum": "max",
+}
+
+
+def load_parameter_aggregations(config_path: Path) -> Dict[str, str]:
+    """
+    Read per-parameter aggregation semantics from power_parameters.yml.
+
+    Args:
+        config_path: Path to the pipeline's power_parameters.yml
+
+    Returns:
+        Mapping of parameter ID to one of "mean", "sum", "min", "max".
+        Empty if the file is missing; callers default to "mean".
+    """
+    if not config_path.exists():
+        logger.warning(
+            f"Parameter config not found at {config_path}; defaulting to mean aggregation"
+        )
+        return {}
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    aggregations = {}
+    for entry in config.get("parameters", []):
+        declared = str(entry.get("aggregation", "mean")).lower()
+        agg = AGGREGATION_ALIASES.get(declared)
+        if agg is None:
+            logger.warning(
+                f"Unknown aggregation '{declared}' for {entry['id']}, defaulting to mean"
+            )
+            agg = "mean"
+        aggregations[entry["id"]] = agg
+    return aggregations
+
+
+@dataclass
+class ClimatologyCube:
+    """
+    Dense ``(location, parameter, year, month)`` statistics cube.
+
+    Each cell stores the sum, count, min and max of the valid daily values
+    for that month, which is enough to answer both the daily-mean lookups
+    used for scoring and the declared monthly aggregation (mean/sum/min/max)
+    produced offline by ``compute_monthly_statistics``.
+    """
+
+    locations: List[str]
+    parameters: List[str]
+    years: np.ndarray
+    year_range: np.ndarray
+    sums: np.ndarray
+    counts: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+    aggregations: Dict[str, str]
+
+    def __post_init__(self):
+        self._location_index = {name: i for i, name in enumerate(self.locations)}
+        self._parameter_index = {name: i for i, name in enumerate(self.parameters)}
+
+    @classmethod
+    def build(
+        cls,
+        series_by_location: Mapping[str, LocationSeries],
+        aggregations: Optional[Mapping[str, str]] = None,
+    ) -> "ClimatologyCube":
+        """
+        Build the cube from fully loaded location series.
+
+        Args:
+            series_by_location: Location name to columnar daily series
+            aggregations: Declared aggregation per parameter (default mean)
+
+        Returns:
+            ClimatologyCube covering every location and parameter seen
+        """
+        locations = sorted(series_by_location.keys())
+        parameters = sorted(
+            {p for series in series_by_location.values() for p in series.parameters}
+        )
+
+        populated = [s for s in series_by_location.values() if len(s.dates)]
+        if populated:
+            first_year = int(min(s.years[0] for s in populated))
+            last_year = int(max(s.years[-1] for s in populated))
+            years = np.arange(first_year, last_year + 1, dtype=np.int32)
+        else:
+            years = np.zeros(0, dtype=np.int32)
+
+        shape = (len(locations), len(parameters), len(years), 12)
+        sums = np.zeros(shape, dtype=np.float64)
+        counts = np.zeros(shape, dtype=np.int32)
+        mins = np.full(shape, np.nan, dtype=np.float64)
+        maxs = np.full(shape, np.nan, dtype=np.float64)
+        year_range = np.zeros((len(locations), 2), dtype=np.int32)
+
+        n_cells = len(years) * 12
+        for li, name in enumerate(locations):
+            series = series_by_location[name]
+            if len(series.dates) == 0:
+                continue
+            year_range[li] = (series.years[0], series.years[-1])
+
+            # Flat (year, month) cell index for every day
+            cell = (series.years.astype(np.int64) - years[0]) * 12 + (series.months - 1)
+
+            for param_name, values in series.columns.items():
+                pi = parameters.index(param_name)
+                valid = ~np.isnan(values)
+                cells = cell[valid]
+                vals = values[valid]
+
+                sums[li, pi] = np.bincount(cells, weights=vals, minlength=n_cells).reshape(-1, 12)
+                counts[li, pi] = np.bincount(cells, minlength=n_cells).reshape(-1, 12)
+
+                cell_min = np.full(n_cells, np.inf)
+                cell_max = np.full(n_cells, -np.inf)
+                np.minimum.at(cell_min, cells, vals)
+                np.maximum.at(cell_max, cells, vals)
+                empty = counts[li, pi].reshape(-1) == 0
+                cell_min[empty] = np.nan
+                cell_max[empty] = np.nan
+                mins[li, pi] = cell_min.reshape(-1, 12)
+                maxs[li, pi] = cell_max.reshape(-1, 12)
+
+        return cls(
+            locations=locations,
+            parameters=parameters,
+            years=years,
+            year_range=year_range,
+            sums=sums,
+            counts=counts,
+            mins=mins,
+            maxs=maxs,
+            aggregations=dict(aggregations or {}),
+        )
+
+    def save(self, path: Path) -> Path:
+        """Write the cube to a compressed ``.npz`` file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        agg_params = sorted(self.aggregations.keys())
+        np.savez_compressed(
+            path,
+            locations=np.array(self.locations, dtype=str),
+            parameters=np.array(self.parameters, dtype=str),
+            years=self.years,
+            year_range=self.year_range,
+            sums=self.sums,
+            counts=self.counts,
+            mins=self.mins,
+            maxs=self.maxs,
+            aggregation_parameters=np.array(agg_params, dtype=str),
+            aggregation_methods=np.array(
+                [self.aggregations[p] for p in agg_params], dtype=str
+            ),
+        )
+        logger.info(f"Wrote climatology cube to {path}")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "ClimatologyCube":
+        """Load a cube previously written with :meth:`save`."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                locations=data["locations"].tolist(),
+                parameters=data["parameters"].tolist(),
+                years=data["years"],
+                year_range=data["year_range"],
+                sums=data["sums"],
+                counts=data["counts"],
+                mins=data["mins"],
+                maxs=data["maxs"],
+                aggregations=dict(
+                    zip(
+                        data["aggregation_parameters"].tolist(),
+                        data["aggregation_methods"].tolist(),
+                    )
+                ),
+            )
+
+    def save_arrays(self, directory: Path) -> Path:
+        """
+        Write the cube as one uncompressed ``.npy`` file per array.
+
+        Unlike :meth:`save`, the result can be memory-mapped by
+        :meth:`load_arrays`, so processes attaching to it share one copy
+        through the OS page cache.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in CUBE_ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        with open(directory / CUBE_META_NAME, "w") as f:
+            json.dump(
+                {
+                    "locations": self.locations,
+                    "parameters": self.parameters,
+                    "aggregations": self.aggregations,
+                },
+                f,
+            )
+        return directory
+
+    @classmethod
+    def load_arrays(cls, directory: Path, mmap: bool = True) -> "ClimatologyCube":
+        """Load a cube written with :meth:`save_arrays`, read-only mapped by default."""
+        with open(directory / CUBE_META_NAME, "r") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in CUBE_ARRAYS
+        }
+        return cls(
+            locations=meta["locations"],
+            parameters=meta["parameters"],
+            aggregations=dict(meta["aggregations"]),
+            **arrays,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory footprint of the statistic arrays."""
+        return int(self.sums.nbytes + self.counts.nbytes + self.mins.nbytes + self.maxs.nbytes)
+
+    def has(self, location_name: str, parameter_id: str) -> bool:
+        """Whether the cube holds statistics for this location and parameter."""
+        return (
+            location_name in self._location_index
+            and parameter_id in self._parameter_index
+        )
+
+    def year_bounds(self, location_name: str) -> Optional[tuple]:
+        """First and last year covered by the location's daily series."""
+        li = self._location_index.get(location_name)
+        if li is None:
+            return None
+        first, last = self.year_range[li]
+        return int(first), int(last)
+
+    def _cells(self, location_name: str, parameter_id: str, month: int, year: Optional[int]):
+        li = self._location_index[location_name]
+        pi = self._parameter_index[parameter_id]
+        if year is None:
+            return li, pi, slice(None), month - 1
+        yi = int(year) - int(self.years[0]) if len(self.years) else -1
+        if yi < 0 or yi >= len(self.years):
+            return None
+        return li, pi, yi, month - 1
+
+    def mean(
+        self, location_name: str, parameter_id: str, month: int, year: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        Mean of the daily values for a month, optionally restricted to a year.
+
+        Equivalent to averaging every valid day of that month in the raw
+        series, without touching the series.
+        """
+        cells = self._cells(location_name, parameter_id, month, year)
+        if cells is None:
+            return None
+        count = self.counts[cells].sum()
+        if count == 0:
+            return None
+        return float(self.sums[cells].sum() / count)
+
+    def means(
+        self,
+        location_name: str,
+        parameter_ids: List[str],
+        month: int,
+        year: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized :meth:`mean` over several parameters.
+
+        Returns:
+            Array aligned to ``parameter_ids``, NaN where there is no data
+        """
+        result = np.full(len(parameter_ids), np.nan)
+        li = self._location_index.get(location_name)
+        if li is None:
+            return result
+
+        known = [i for i, p in enumerate(parameter_ids) if p in self._parameter_index]
+        if not known:
+            return result
+        pis = [self._parameter_index[parameter_ids[i]] for i in known]
+
+        if year is None:
+            sums = self.sums[li, pis, :, month - 1].sum(axis=1)
+            counts = self.counts[li, pis, :, month - 1].sum(axis=1)
+        else:
+            yi = int(year) - int(self.years[0]) if len(self.years) else -1
+            if yi < 0 or yi >= len(self.years):
+                return result
+            sums = self.sums[li, pis, yi, month - 1]
+            counts = self.counts[li, pis, yi, month - 1]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[known] = np.where(counts > 0, sums / counts, np.nan)
+        return result
+
+    def month_means(
+        self, location_name: str, parameter_id: str, year: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        :meth:`mean` for all 12 months of one parameter in a single slice.
+
+        Returns:
+            Array of 12 monthly means, NaN where there is no data
+        """
+        result = np.full(12, np.nan)
+        li = self._location_index.get(location_name)
+        pi = self._parameter_index.get(parameter_id)
+        if li is None or pi is None:
+            return result
+
+        if year is None:
+            sums = self.sums[li, pi].sum(axis=0)
+            counts = self.counts[li, pi].sum(axis=0)
+        else:
+            yi = int(year) - int(self.years[0]) if len(self.years) else -1
+            if yi < 0 or yi >= len(self.years):
+                return result
+            sums = self.sums[li, pi, yi]
+            counts = self.counts[li, pi, yi]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def monthly_means(
+        self, location_name: str, parameter_ids: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-year monthly means for several parameters, straight from the cube.
+
+        Returns:
+            Tuple of (years covered by the location, array of shape
+            (n_years, 12, len(parameter_ids)) with NaN where there is no data)
+        """
+        bounds = self.year_bounds(location_name)
+        if bounds is None or not len(self.years):
+            return np.zeros(0, dtype=np.int32), np.zeros((0, 12, len(parameter_ids)))
+
+        first = bounds[0] - int(self.years[0])
+        last = bounds[1] - int(self.years[0]) + 1
+        years = self.years[first:last]
+        result = np.full((len(years), 12, len(parameter_ids)), np.nan)
+
+        li = self._location_index[location_name]
+        known = [i for i, p in enumerate(parameter_ids) if p in self._parameter_index]
+        if known:
+            pis = [self._parameter_index[parameter_ids[i]] for i in known]
+            # (params, years, months) -> (years, months, params)
+            sums = self.sums[li, pis, first:last].transpose(1, 2, 0)
+            counts = self.counts[li, pis, first:last].transpose(1, 2, 0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result[:, :, known] = np.where(counts > 0, sums / counts, np.nan)
+        return years, result
+
+    def extrema(
+        self,
+        location_name: str,
+        parameter_ids: List[str],
+        month: int,
+        year: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Smallest and largest daily value per parameter for a month.
+
+        Any mean over those days lies between the two, which makes them
+        cheap bounds for pruning searches.
+
+        Returns:
+            Tuple of (mins, maxs) aligned to ``parameter_ids``, NaN where
+            there is no data
+        """
+        mins = np.full(len(parameter_ids), np.nan)
+        maxs = np.full(len(parameter_ids), np.nan)
+        li = self._location_index.get(location_name)
+        if li is None:
+            return mins, maxs
+
+        known = [i for i, p in enumerate(parameter_ids) if p in self._parameter_index]
+        if not known:
+            return mins, maxs
+        pis = [self._parameter_index[parameter_ids[i]] for i in known]
+
+        if year is None:
+            cell_mins = self.mins[li, pis, :, month - 1]
+            cell_maxs = self.maxs[li, pis, :, month - 1]
+        else:
+            yi = int(year) - int(self.years[0]) if len(self.years) else -1
+            if yi < 0 or yi >= len(self.years):
+                return mins, maxs
+            cell_mins = self.mins[li, pis, yi, month - 1][:, None]
+            cell_maxs = self.maxs[li, pis, yi, month - 1][:, None]
+
+        with warnings.catch_warnings():
+            # All-NaN rows (no data in any year) stay NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mins[known] = np.nanmin(cell_mins, axis=1)
+            maxs[known] = np.nanmax(cell_maxs, axis=1)
+        return mins, maxs
+
+    def aggregate(
+        self, location_name: str, parameter_id: str, month: int, year: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        Monthly value using the parameter's declared aggregation.
+
+        For a single year this matches a row of the offline monthly summary.
+        Without a year, sums are averaged over the years with data, means
+        are pooled over all days, and min/max are taken across years.
+
+        A month without any valid daily value is None for every aggregation.
+        The offline pandas summary reports such a month's sum as 0; here an
+        all-missing month is kept distinct from a measured zero total.
+        """
+        cells = self._cells(location_name, parameter_id, month, year)
+        if cells is None:
+            return None
+        counts = self.counts[cells]
+        if np.sum(counts) == 0:
+            return None
+
+        agg = self.aggregations.get(parameter_id, "mean")
+        if agg == "sum":
+            sums = np.atleast_1d(self.sums[cells])[np.atleast_1d(counts) > 0]
+            return float(sums.mean())
+        if agg == "min":
+            return float(np.nanmin(self.mins[cells]))
+        if agg == "max":
+            return float(np.nanmax(self.maxs[cells]))
+        return float(np.sum(self.sums[cells]) / np.sum(counts))
+
+
+def main():
+    """Build the climatology cube offline so servers can load it at startup."""
+    from app.services.data_service import DataService
+
+    parser = argparse.ArgumentParser(description="Build the Weather Vibes climatology cube")
+    parser.add_argument("--data-path", default="../data", help="Data directory with outputs/")
+    parser.add_argument("--output", default=None, help="Destination .npz file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    service = DataService(args.data_path, precompute_climatology=False)
+    cube = service.build_climatology()
+    output = Path(args.output) if args.output else service.climatology_path
+    cube.save(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+import asyncio
+import logging
+import threading
+import time
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PoolSaturatedError(RuntimeError):
+    """Every worker is busy and the wait queue is full."""
+
+
+class ComputeTimeoutError(RuntimeError):
+    """A job did not finish within the pool's timeout."""
+
+
+class ComputePool:
+    """
+    Bounded thread pool for CPU-bound route work.
+
+    Runs data loading and scoring off the event loop so one heavy request
+    cannot stall others on the same worker process. At most ``max_workers``
+    jobs run at once and ``max_queue`` more may wait; further jobs are
+    rejected immediately with :class:`PoolSaturatedError`. A job still
+    holds its slot after a timeout until its thread actually finishes, so
+    admission always reflects real load.
+
+    Threads rather than processes: the numpy kernels release the GIL, and
+    jobs share the data service's caches and memory-mapped columns.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 16,
+        timeout_seconds: Optional[float] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="compute"
+        )
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _acquire(self):
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise PoolSaturatedError(
+                    f"Compute pool saturated ({self.in_flight}/{self.capacity} jobs)"
+                )
+            self.in_flight += 1
+
+    def _release(self, future):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _track(self, fn: Callable[..., T], *args: Any) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self.running += 1
+        try:
+            result = fn(*args)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        else:
+            with self._lock:
+                self.completed += 1
+            return result
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.busy_seconds += time.perf_counter() - started
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``fn(*args)`` on a worker thread and await its result.
+
+        Raises:
+            PoolSaturatedError: If the pool and its queue are full
+            ComputeTimeoutError: If the job exceeds ``timeout_seconds``
+        """
+        self._acquire()
+        try:
+            future = self._executor.submit(self._track, fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            # A queued job is cancelled; a running one finishes in the background
+            with self._lock:
+                self.timeouts += 1
+            raise ComputeTimeoutError(
+                f"Computation exceeded {self.timeout_seconds}s"
+            ) from None
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting jobs and cancel any still queued."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "timeout_seconds": self.timeout_seconds,
+                "running": self.running,
+                "queued": self.in_flight - self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "busy_seconds": round(self.busy_seconds, 6),
+            }
+
+
+# Global instance - initialized in main.py; None runs work inline
+compute_pool: Optional[ComputePool] = None
+
+
+def get_compute_pool() -> Optional[ComputePool]:
+    """Get the global compute pool, or None when work runs inline."""
+    return compute_pool
+
+
+async def run_compute(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run route work on the global compute pool.
+
+    Saturation becomes ``429`` with a ``Retry-After`` header and a timeout
+    becomes ``504``. Without a pool the work runs inline on the event loop.
+    """
+    pool = get_compute_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return await pool.run(fn, *args)
+    except PoolSaturatedError as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=429,
+            detail="Server is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    except ComputeTimeoutError as e:
+        logger.warning(str(e))
+        raise HTTPException(status_code=504, detail=str(e))
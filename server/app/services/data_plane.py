@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import json
+import logging
+import os
+import shutil
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Layout: <root>/CURRENT names the live gen-* directory, which holds
+# snapshot.json, locations/<name>/ (compiled layout) and climatology/
+SNAPSHOTS_DIRNAME = "snapshots"
+CURRENT_NAME = "CURRENT"
+SNAPSHOT_MANIFEST = "snapshot.json"
+LOCATIONS_DIRNAME = "locations"
+CUBE_DIRNAME = "climatology"
+GENERATION_PREFIX = "gen-"
+FORMAT_VERSION = 1
+
+
+def default_root(data_path: Path) -> Path:
+    """Snapshot root used when none is configured."""
+    return Path(data_path) / "outputs" / SNAPSHOTS_DIRNAME
+
+
+def new_generation_name(snapshot_id: str) -> str:
+    """Sortable generation name tagged with the data fingerprint."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    return f"{GENERATION_PREFIX}{stamp}-{snapshot_id[:8]}"
+
+
+def location_dir(generation_dir: Path, location_name: str) -> Path:
+    """Compiled-layout directory of one location within a generation."""
+    return generation_dir / LOCATIONS_DIRNAME / location_name
+
+
+def read_current(root: Path) -> Optional[str]:
+    """Name of the live generation, or None if nothing has been published."""
+    try:
+        generation = (Path(root) / CURRENT_NAME).read_text().strip()
+    except OSError:
+        return None
+    return generation or None
+
+
+def _write_current(root: Path, generation: str):
+    # Readers see either the old or the new pointer, never a partial write
+    tmp = root / f".{CURRENT_NAME}.{os.getpid()}.{threading.get_ident()}.tmp"
+    tmp.write_text(generation + "\n")
+    os.replace(tmp, root / CURRENT_NAME)
+
+
+def read_snapshot(root: Path, generation: str) -> Optional[Dict]:
+    """Read a generation's manifest, or None if absent or unreadable."""
+    path = Path(root) / generation / SNAPSHOT_MANIFEST
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read snapshot manifest {path}: {e}")
+        return None
+    if manifest.get("format_version") != FORMAT_VERSION:
+        logger.info(f"Ignoring {path}: unsupported format version")
+        return None
+    return manifest
+
+
+def write_snapshot_manifest(
+    generation_dir: Path, generation: str, snapshot_id: str, locations: List[str]
+) -> Dict:
+    """Write the manifest that marks a staged generation as complete."""
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "generation": generation,
+        "snapshot_id": snapshot_id,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "locations": sorted(locations),
+    }
+    with open(generation_dir / SNAPSHOT_MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def list_generations(root: Path) -> List[str]:
+    """Published generations, oldest first."""
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(
+        d.name for d in root.iterdir() if d.is_dir() and d.name.startswith(GENERATION_PREFIX)
+    )
+
+
+def prune_generations(root: Path, keep: int) -> List[str]:
+    """Delete all but the newest ``keep`` generations, never the live one."""
+    current = read_current(root)
+    generations = list_generations(root)
+    stale = [g for g in generations[: max(0, len(generations) - keep)] if g != current]
+    for generation in stale:
+        shutil.rmtree(Path(root) / generation, ignore_errors=True)
+        logger.info(f"Pruned data snapshot {generation}")
+    return stale
+
+
+def commit_generation(root: Path, staging_dir: Path, generation: str, keep: int) -> str:
+    """Move a fully written staging directory into place and make it live."""
+    os.replace(staging_dir, Path(root) / generation)
+    _write_current(Path(root), generation)
+    logger.info(f"Published data snapshot {generation}")
+    prune_generations(root, keep)
+    return generation
+
+
+def main():
+    """Loader process: publish the raw data as a new shared generation."""
+    from app.services.data_service import DataService
+
+    parser = argparse.ArgumentParser(description="Publish a Weather Vibes data snapshot")
+    parser.add_argument("--data-path", default="../data", help="Data directory with outputs/")
+    parser.add_argument("--root", default=None, help="Snapshot root (default: outputs/snapshots)")
+    parser.add_argument("--keep", type=int, default=3, help="Generations to keep")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    service = DataService(args.data_path)
+    root = Path(args.root) if args.root else default_root(args.data_path)
+    service.publish_snapshot(root, keep=args.keep)
+
+
+if __name__ == "__main__":
+    main()
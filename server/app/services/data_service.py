@@ -1,30 +1,153 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
+import hashlib
+import heapq
 import json
 import numpy as np
-from functools import lru_cache
 from datetime import datetime
 import logging
+from app.services.timeseries import (
+    LocationSeries,
+    TimeSpec,
+    calendar_day_keys,
+    read_power_coordinates,
+    reduce_columns,
+)
+from app.services.climatology import (
+    CUBE_FILENAME,
+    ClimatologyCube,
+    load_parameter_aggregations,
+)
+from app.services.data_plane import (
+    CUBE_DIRNAME,
+    commit_generation,
+    location_dir,
+    new_generation_name,
+    read_current,
+    read_snapshot,
+    write_snapshot_manifest,
+)
+from app.services.cache import LRUCache
+from app.services.single_flight import SingleFlight
+from app.services.distribution import ScoreDistribution, score_distribution
+from app.services.interpolation import GridWeights, idw_weights
+from app.services.binary_store import (
+    COMPILED_DIRNAME,
+    StaleCompiledDataError,
+    is_current,
+    load_compiled_column,
+    load_compiled_index,
+    read_manifest,
+    write_compiled_series,
+)
+from app.utils.geospatial import generate_grid
+from app.utils.spatial_index import SpatialIndex
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
 class DataService:
-    """Service for accessing NASA POWER climate data from JSON files."""
+    """
+    Service for accessing NASA POWER climate data.
 
-    def __init__(self, data_path: str):
+    Reads compiled memory-mappable columns when available and falls back to
+    the raw POWER JSON files otherwise.
+    """
+
+    def __init__(
+        self,
+        data_path: str,
+        precompute_climatology: bool = True,
+        climatology_path: Optional[str] = None,
+        use_binary_cache: bool = True,
+        write_binary_cache: bool = True,
+        cache_max_bytes: Optional[int] = None,
+        cache_ttl_seconds: Optional[float] = None,
+        index_workers: int = 8,
+        grid_cache_size: int = 32,
+        idw_neighbours: int = 4,
+        idw_power: float = 2.0,
+        distribution_cache_size: int = 256,
+        snapshot_root: Optional[str] = None,
+    ):
         logger.info(f"Initializing DataService with path: {data_path}")
         self.data_path = Path(data_path)
-        self.cache: Dict = {}
+        self.use_binary_cache = use_binary_cache
+        self.write_binary_cache = write_binary_cache
+        self.index_workers = max(1, index_workers)
+        self.cache = LRUCache(max_bytes=cache_max_bytes, ttl_seconds=cache_ttl_seconds)
         self.locations_cache: Dict[str, Dict] = {}
-        self._load_available_locations()
+        # Concurrent cold loads of the same index or column share one read
+        self.load_flights = SingleFlight()
+        self.grid_cache = LRUCache(max_entries=grid_cache_size)
+        self.idw_neighbours = idw_neighbours
+        self.idw_power = idw_power
+        self.distribution_cache = LRUCache(max_entries=distribution_cache_size)
+        self.climatology_path = (
+            Path(climatology_path)
+            if climatology_path
+            else self.data_path / "outputs" / CUBE_FILENAME
+        )
+        self.parameter_aggregations = load_parameter_aggregations(
+            self.data_path / "config" / "power_parameters.yml"
+        )
+        self.climatology: Optional[ClimatologyCube] = None
+        self.spatial_index = SpatialIndex([], [], [])
+        # Published data plane generation this service is attached to, if any
+        self.snapshot_root = Path(snapshot_root) if snapshot_root else None
+        self.generation: Optional[str] = None
+
+        attached = self.snapshot_root is not None and self._attach_snapshot()
+        if not attached:
+            self._load_available_locations()
+        self._build_spatial_index()
+        if not attached:
+            self.snapshot_id = self._snapshot_fingerprint()
+            if precompute_climatology and self.locations_cache:
+                self.climatology = self._load_climatology()
         logger.info(
             f"DataService initialized with {len(self.locations_cache)} locations"
         )
 
+    def _index_location_dir(self, location_dir: Path) -> Optional[Tuple[str, Dict]]:
+        """
+        Build the locations_cache entry for one ``*_point`` directory.
+
+        Coordinates come from the compiled manifest when present, otherwise
+        from the geometry header of the first raw JSON file.
+        """
+        location_name = location_dir.name.replace("_point", "")
+        logger.debug(f"Processing location: {location_name}")
+
+        raw_dir = location_dir / "raw"
+        if not raw_dir.exists():
+            logger.warning(f"No raw directory found for {location_name}")
+            return None
+        json_files = sorted(raw_dir.glob("*.json"))
+        if not json_files:
+            logger.warning(f"No JSON files found for {location_name}")
+            return None
+        logger.debug(f"Found {len(json_files)} JSON files for {location_name}")
+
+        compiled_dir = location_dir / COMPILED_DIRNAME
+        manifest = read_manifest(compiled_dir)
+        if manifest is not None:
+            lat, lon = manifest["lat"], manifest["lon"]
+        else:
+            lat, lon = read_power_coordinates(json_files[0])
+
+        return location_name, {
+            "lat": lat,
+            "lon": lon,
+            "files": json_files,
+            "raw_dir": raw_dir,
+            "compiled_dir": compiled_dir,
+        }
+
     def _load_available_locations(self):
-        """Load metadata about available point locations."""
+        """Index the available point locations, scanning directories in parallel."""
         logger.info("Loading available locations")
         try:
             # Check if we have the outputs directory
@@ -33,39 +156,194 @@ class DataService:
                 logger.warning(f"Data outputs directory not found at {outputs_dir}")
                 return
 
-            # Find all point directories
-            for location_dir in outputs_dir.iterdir():
-                if location_dir.is_dir() and location_dir.name.endswith("_point"):
-                    location_name = location_dir.name.replace("_point", "")
-                    logger.debug(f"Processing location: {location_name}")
-
-                    # Check for raw data files
-                    raw_dir = location_dir / "raw"
-                    if raw_dir.exists():
-                        json_files = list(raw_dir.glob("*.json"))
-                        if json_files:
-                            logger.debug(
-                                f"Found {len(json_files)} JSON files for {location_name}"
-                            )
-                            # Load the first file to get coordinates
-                            with open(json_files[0], "r") as f:
-                                data = json.load(f)
-                                coords = data["geometry"]["coordinates"]
-                                self.locations_cache[location_name] = {
-                                    "lat": coords[1],
-                                    "lon": coords[0],
-                                    "files": json_files,
-                                    "raw_dir": raw_dir,
-                                }
-                        else:
-                            logger.warning(f"No JSON files found for {location_name}")
-                    else:
-                        logger.warning(f"No raw directory found for {location_name}")
+            location_dirs = sorted(
+                d for d in outputs_dir.iterdir() if d.is_dir() and d.name.endswith("_point")
+            )
+            with ThreadPoolExecutor(max_workers=self.index_workers) as pool:
+                entries = list(pool.map(self._index_location_dir, location_dirs))
+
+            for entry in entries:
+                if entry is not None:
+                    location_name, info = entry
+                    self.locations_cache[location_name] = info
 
             logger.info(f"Loaded {len(self.locations_cache)} point locations")
         except Exception as e:
             logger.error(f"Error loading locations: {e}")
 
+    def _attach_snapshot(self) -> bool:
+        """
+        Attach read-only to the live generation under ``snapshot_root``.
+
+        Columns and the climatology cube are memory-mapped from the
+        generation, so workers attached to it share one copy of the data.
+
+        Returns:
+            False if nothing usable is published (raw data is loaded instead)
+        """
+        generation = read_current(self.snapshot_root)
+        snapshot = read_snapshot(self.snapshot_root, generation) if generation else None
+        if snapshot is None:
+            logger.warning(f"No published data snapshot under {self.snapshot_root}")
+            return False
+
+        generation_dir = self.snapshot_root / generation
+        try:
+            for location_name in snapshot["locations"]:
+                compiled_dir = location_dir(generation_dir, location_name)
+                manifest = read_manifest(compiled_dir)
+                if manifest is None:
+                    raise ValueError(f"missing manifest for {location_name}")
+                self.locations_cache[location_name] = {
+                    "lat": manifest["lat"],
+                    "lon": manifest["lon"],
+                    "files": [],
+                    "raw_dir": None,
+                    "compiled_dir": compiled_dir,
+                    "manifest": manifest,
+                    "parameters": list(manifest["parameters"]),
+                    # Published columns are authoritative; there are no raw files
+                    "frozen": True,
+                }
+            cube = ClimatologyCube.load_arrays(generation_dir / CUBE_DIRNAME)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not attach data snapshot {generation}: {e}")
+            self.locations_cache.clear()
+            return False
+
+        cube.aggregations = dict(self.parameter_aggregations or cube.aggregations)
+        self.climatology = cube
+        self.generation = generation
+        self.snapshot_id = snapshot["snapshot_id"]
+        logger.info(
+            f"Attached data snapshot {generation} with {len(self.locations_cache)} locations"
+        )
+        return True
+
+    def publish_snapshot(self, root: Path, keep: int = 3) -> str:
+        """
+        Publish every location and the climatology cube as a new generation.
+
+        The generation is staged under a hidden name, renamed into place and
+        made live by atomically replacing the ``CURRENT`` pointer, so
+        attached workers never see a partial snapshot.
+
+        Args:
+            root: Snapshot root directory
+            keep: Generations to keep; older ones are deleted
+
+        Returns:
+            Name of the published generation
+        """
+        root = Path(root)
+        generation = new_generation_name(self.snapshot_id)
+        staging_dir = root / f".{generation}.tmp"
+        published = []
+        for location_name, location_data in self.locations_cache.items():
+            series = self._load_location_data(location_name)
+            if series is None:
+                continue
+            write_compiled_series(
+                series,
+                location_dir(staging_dir, location_name),
+                location_data["files"],
+            )
+            published.append(location_name)
+
+        cube = self.climatology or self.build_climatology()
+        cube.save_arrays(staging_dir / CUBE_DIRNAME)
+        write_snapshot_manifest(staging_dir, generation, self.snapshot_id, published)
+        return commit_generation(root, staging_dir, generation, keep)
+
+    def _snapshot_fingerprint(self) -> str:
+        """
+        Identifier of the indexed data: locations, coordinates and raw files.
+
+        Changes whenever a raw file is added, removed or rewritten, so caches
+        of derived results can be keyed on it.
+        """
+        digest = hashlib.sha1()
+        for name in sorted(self.locations_cache):
+            info = self.locations_cache[name]
+            digest.update(f"{name}:{info['lat']}:{info['lon']}".encode())
+            for path in info["files"]:
+                try:
+                    stat = path.stat()
+                    digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+                except OSError:
+                    digest.update(f"{path.name}:missing".encode())
+        return digest.hexdigest()[:16]
+
+    def _load_climatology(self) -> Optional[ClimatologyCube]:
+        """Load the prebuilt climatology cube if it is current, else build it."""
+        path = self.climatology_path
+        if path.exists():
+            try:
+                cube_mtime = path.stat().st_mtime
+                newest_raw = max(
+                    f.stat().st_mtime
+                    for info in self.locations_cache.values()
+                    for f in info["files"]
+                )
+                cube = ClimatologyCube.load(path)
+                if newest_raw > cube_mtime:
+                    logger.info(f"Climatology cube at {path} is older than raw data")
+                elif set(cube.locations) != set(self.locations_cache):
+                    logger.info(f"Climatology cube at {path} does not match locations")
+                else:
+                    cube.aggregations = dict(
+                        self.parameter_aggregations or cube.aggregations
+                    )
+                    logger.info(f"Loaded climatology cube from {path}")
+                    return cube
+            except Exception as e:
+                logger.warning(f"Could not load climatology cube from {path}: {e}")
+
+        try:
+            return self.build_climatology()
+        except Exception as e:
+            logger.error(f"Error building climatology cube: {e}")
+            return None
+
+    def build_climatology(self) -> ClimatologyCube:
+        """Build the (location, parameter, year, month) cube from the daily series."""
+        logger.info("Building climatology cube")
+        series_by_location = {}
+        for location_name in self.locations_cache:
+            series = self._load_location_data(location_name)
+            if series is not None:
+                series_by_location[location_name] = series
+
+        cube = ClimatologyCube.build(series_by_location, self.parameter_aggregations)
+        logger.info(
+            f"Built climatology cube for {len(cube.locations)} locations, "
+            f"{len(cube.parameters)} parameters, {len(cube.years)} years "
+            f"({cube.nbytes / 1e6:.1f} MB)"
+        )
+        return cube
+
+    def _resolve_year(
+        self, year: Optional[int], first_year: Optional[int], last_year: Optional[int]
+    ) -> Optional[int]:
+        """Drop a year filter that falls outside the available data."""
+        if year is None or first_year is None or last_year is None:
+            return year
+        if year < first_year or year > last_year:
+            logger.info(
+                f"Year {year} out of available range {first_year}-{last_year}. Falling back to all years."
+            )
+            return None
+        return year
+
+    def _build_spatial_index(self):
+        """Index the known locations for nearest and radius queries."""
+        names = list(self.locations_cache.keys())
+        self.spatial_index = SpatialIndex(
+            names,
+            [self.locations_cache[n]["lat"] for n in names],
+            [self.locations_cache[n]["lon"] for n in names],
+        )
+
     def _find_nearest_location(self, lat: float, lon: float) -> Optional[str]:
         """Find the nearest available location to the given coordinates."""
         logger.debug(f"Finding nearest location for ({lat}, {lon})")
@@ -74,163 +352,706 @@ class DataService:
             logger.warning("No locations available in cache")
             return None
 
-        min_distance = float("inf")
-        nearest_location = None
-
-        for location_name, location_data in self.locations_cache.items():
-            # Simple distance calculation (not perfect for large distances)
-            distance = np.sqrt(
-                (lat - location_data["lat"]) ** 2 + (lon - location_data["lon"]) ** 2
-            )
-
-            if distance < min_distance:
-                min_distance = distance
-                nearest_location = location_name
+        distances, indices = self.spatial_index.nearest(lat, lon, k=1)
+        nearest_location = self.spatial_index.names[indices[0, 0]]
 
         logger.debug(
-            f"Nearest location: {nearest_location} (distance: {min_distance:.4f})"
+            f"Nearest location: {nearest_location} (distance: {distances[0, 0]:.1f} km)"
         )
         return nearest_location
 
-    def _load_location_data(self, location_name: str) -> Optional[Dict]:
-        """Load all data for a location from JSON files."""
-        logger.debug(f"Loading data for location: {location_name}")
+    def nearest_location_name(self, lat: float, lon: float) -> Optional[str]:
+        """Name of the data location that point queries at (lat, lon) resolve to."""
+        return self._find_nearest_location(lat, lon)
 
-        if location_name not in self.locations_cache:
-            logger.error(f"Location {location_name} not found in cache")
+    def locations_within_radius(
+        self, center_lat: float, center_lon: float, radius_km: float
+    ) -> List[Tuple[str, float]]:
+        """
+        Locations within a great-circle radius of a point, nearest first.
+
+        Returns:
+            List of (location name, distance in km) tuples
+        """
+        indices, distances = self.spatial_index.within_radius(
+            center_lat, center_lon, radius_km
+        )[0]
+        return [
+            (self.spatial_index.names[i], float(d)) for i, d in zip(indices, distances)
+        ]
+
+    def _load_compiled_index(self, location_data: Dict) -> Optional[LocationSeries]:
+        """Read the compiled date index for a location if it is current."""
+        compiled_dir = location_data["compiled_dir"]
+        manifest = read_manifest(compiled_dir)
+        if manifest is None:
+            return None
+        if not location_data.get("frozen") and not is_current(manifest, location_data["files"]):
             return None
+        try:
+            index = load_compiled_index(compiled_dir, manifest)
+            if not location_data.get("frozen") and read_manifest(compiled_dir) != manifest:
+                raise StaleCompiledDataError(f"{compiled_dir} was rewritten while loading")
+        except Exception as e:
+            logger.warning(f"Could not load compiled data from {compiled_dir}: {e}")
+            return None
+        location_data["manifest"] = manifest
+        location_data["parameters"] = list(manifest["parameters"])
+        return index
+
+    def _load_json_series(self, location_name: str, location_data: Dict) -> LocationSeries:
+        """Parse every raw JSON file for a location into a columnar series."""
+        logger.debug(
+            f"Loading {len(location_data['files'])} files for {location_name}"
+        )
+        payloads = []
+        for json_file in location_data["files"]:
+            logger.debug(f"Loading file: {json_file.name}")
+            with open(json_file, "r") as f:
+                payloads.append(json.load(f))
+
+        series = LocationSeries.from_power_payloads(
+            payloads, location_data["lat"], location_data["lon"]
+        )
+        location_data["manifest"] = None
+        location_data["parameters"] = series.parameters
 
-        # Check cache first
-        cache_key = f"location_{location_name}"
+        # Rebuild the binary artifact so the next load (in any worker) can mmap it
+        if self.use_binary_cache and self.write_binary_cache:
+            try:
+                compiled_dir = write_compiled_series(
+                    series, location_data["compiled_dir"], location_data["files"]
+                )
+                location_data["manifest"] = read_manifest(compiled_dir)
+            except OSError as e:
+                logger.warning(f"Could not write compiled data for {location_name}: {e}")
+        return series
+
+    def _cache_columns(self, location_name: str, columns: Dict[str, np.ndarray]):
+        """Cache each column under its own (location, parameter) key."""
+        for parameter_id, values in columns.items():
+            self.cache.put(f"column_{location_name}_{parameter_id}", values)
+
+    def _load_location_index(self, location_name: str) -> LocationSeries:
+        """Load the date index for a location, preferring compiled data over JSON."""
+        cache_key = f"index_{location_name}"
+        index = self.cache.get(cache_key)
+        if index is not None:
+            return index
+        return self.load_flights.do(
+            cache_key, lambda: self._read_location_index(location_name)
+        )
+
+    def _read_location_index(self, location_name: str) -> LocationSeries:
+        cache_key = f"index_{location_name}"
         if cache_key in self.cache:
-            logger.debug(f"Using cached data for {location_name}")
-            return self.cache[cache_key]
+            # Filled by a load that finished just before this flight began
+            index = self.cache.get(cache_key)
+            if index is not None:
+                return index
 
         location_data = self.locations_cache[location_name]
-        all_data = {"parameters": {}}
+        index = None
+        source = "compiled"
+        if self.use_binary_cache or location_data.get("frozen"):
+            index = self._load_compiled_index(location_data)
+        if index is None:
+            source = "JSON"
+            series = self._load_json_series(location_name, location_data)
+            index = series.with_columns({})
+            if location_data["manifest"] is None:
+                # No compiled copy to fall back on, keep what was parsed
+                self._cache_columns(location_name, series.columns)
+
+        self.cache.put(cache_key, index)
+        logger.info(
+            f"Indexed {source} data for {location_name} with "
+            f"{len(location_data['parameters'])} parameters over {len(index.dates)} days"
+        )
+        return index
 
-        try:
-            logger.debug(
-                f"Loading {len(location_data['files'])} files for {location_name}"
+    def _load_location_columns(
+        self, location_name: str, parameter_ids: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Materialize parameter columns for a location, each cached on its own.
+
+        Compiled columns are memory-mapped one file per parameter; without a
+        compiled copy the raw JSON is parsed again and every column cached.
+        """
+        location_data = self.locations_cache[location_name]
+        available = set(location_data["parameters"])
+        columns = {}
+        missing = []
+        for parameter_id in parameter_ids:
+            if parameter_id not in available:
+                continue
+            values = self.cache.get(f"column_{location_name}_{parameter_id}")
+            if values is None:
+                missing.append(parameter_id)
+            else:
+                columns[parameter_id] = values
+
+        if not missing:
+            return columns
+
+        if location_data.get("manifest") is not None:
+            for parameter_id in missing:
+                columns[parameter_id] = self.load_flights.do(
+                    f"column_{location_name}_{parameter_id}",
+                    lambda p=parameter_id: self._read_compiled_column(location_name, p),
+                )
+        else:
+            # One parse yields every column; concurrent callers share it
+            loaded = self.load_flights.do(
+                f"json_{location_name}",
+                lambda: self._load_json_series(location_name, location_data).columns,
             )
-            # Load all JSON files for this location
-            for json_file in location_data["files"]:
-                logger.debug(f"Loading file: {json_file.name}")
-                with open(json_file, "r") as f:
-                    data = json.load(f)
-                    parameters = data["properties"]["parameter"]
-
-                    # Merge parameter data
-                    for param_name, param_values in parameters.items():
-                        if param_name not in all_data["parameters"]:
-                            all_data["parameters"][param_name] = {}
-                        all_data["parameters"][param_name].update(param_values)
-
-            # Store coordinates
-            all_data["lat"] = location_data["lat"]
-            all_data["lon"] = location_data["lon"]
-
-            # Cache the loaded data
-            self.cache[cache_key] = all_data
-            logger.info(
-                f"Loaded data for {location_name} with {len(all_data['parameters'])} parameters"
+            self._cache_columns(location_name, {p: loaded[p] for p in missing})
+            columns.update((p, loaded[p]) for p in missing)
+        logger.debug(f"Loaded columns {missing} for {location_name}")
+        return columns
+
+    def _read_compiled_column(self, location_name: str, parameter_id: str) -> np.ndarray:
+        cache_key = f"column_{location_name}_{parameter_id}"
+        if cache_key in self.cache:
+            values = self.cache.get(cache_key)
+            if values is not None:
+                return values
+        location_data = self.locations_cache[location_name]
+        compiled_dir = location_data["compiled_dir"]
+        manifest = location_data["manifest"]
+        values = load_compiled_column(compiled_dir, parameter_id)
+        # Another service (e.g. a reload) may have rewritten the directory since
+        # it was indexed; writers withdraw the manifest first, so an unchanged
+        # manifest after mapping means this column belongs to the cached index
+        if manifest is None or len(values) != manifest["n_days"] or (
+            not location_data.get("frozen") and read_manifest(compiled_dir) != manifest
+        ):
+            raise StaleCompiledDataError(f"{compiled_dir} changed since it was indexed")
+        # Charged at its full nbytes although few pages may be resident yet:
+        # a scan faults in the whole column, so the budget bounds the worst case
+        self.cache.put(cache_key, values)
+        return values
+
+    def _forget_location(self, location_name: str):
+        """Drop a location's cached index and columns so they are read afresh."""
+        self.cache.pop(f"index_{location_name}")
+        for parameter_id in self.locations_cache[location_name]["parameters"]:
+            self.cache.pop(f"column_{location_name}_{parameter_id}")
+
+    def _assemble_series(
+        self, location_name: str, parameter_ids: Optional[List[str]]
+    ) -> LocationSeries:
+        index = self._load_location_index(location_name)
+        if parameter_ids is None:
+            parameter_ids = self.locations_cache[location_name]["parameters"]
+        columns = self._load_location_columns(location_name, parameter_ids)
+        if any(len(values) != len(index.dates) for values in columns.values()):
+            raise StaleCompiledDataError(
+                f"Cached columns of {location_name} do not match its index"
             )
-            return all_data
+        return index.with_columns(columns)
+
+    def _load_location_data(
+        self, location_name: str, parameter_ids: Optional[List[str]] = None
+    ) -> Optional[LocationSeries]:
+        """
+        Load a location's series with only the requested parameter columns.
+
+        Args:
+            location_name: Known location name
+            parameter_ids: Columns to materialize (default: every parameter)
+
+        Returns:
+            LocationSeries sharing the cached date index, or None on failure
+        """
+        logger.debug(f"Loading data for location: {location_name}")
+
+        if location_name not in self.locations_cache:
+            logger.error(f"Location {location_name} not found in cache")
+            return None
+
+        try:
+            try:
+                return self._assemble_series(location_name, parameter_ids)
+            except StaleCompiledDataError as e:
+                # Re-read index and columns together from the rewritten files
+                logger.info(f"{e}; reloading {location_name}")
+                self._forget_location(location_name)
+                return self._assemble_series(location_name, parameter_ids)
 
         except Exception as e:
             logger.error(f"Error loading data for {location_name}: {e}")
             return None
 
-    def _aggregate_monthly(
+    def _clamp_range(
         self,
-        daily_data: Dict[str, float],
-        month: int,
-        year: Optional[int] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-    ) -> Optional[float]:
+        series: LocationSeries,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+        """
+        Clamp a requested date range to the data available in ``series``.
+
+        Returns:
+            Clamped (start, end), or None if the range has no overlap
+        """
+        min_date = series.min_date
+        max_date = series.max_date
+        clamped_start = start_date
+        clamped_end = end_date
+        if min_date:
+            if clamped_start and clamped_start < min_date:
+                clamped_start = min_date
+            if clamped_end and clamped_end < min_date:
+                clamped_end = min_date
+        if max_date:
+            if clamped_start and clamped_start > max_date:
+                clamped_start = max_date
+            if clamped_end and clamped_end > max_date:
+                clamped_end = max_date
+
+        if clamped_start and clamped_end and clamped_start > clamped_end:
+            logger.info(
+                f"Requested date range has no overlap with data ({start_date}..{end_date} vs {min_date}..{max_date}). Returning overall average."
+            )
+            return None
+        return clamped_start, clamped_end
+
+    def _time_selection(self, series: LocationSeries, spec: TimeSpec):
+        """Resolve a TimeSpec into a row selection (mask or slice) over ``series``."""
+        # Prefer monthly aggregation when month is specified
+        if spec.month is not None:
+            # If a specific year was requested but is outside available data, ignore year filter
+            effective_year = self._resolve_year(
+                spec.year,
+                int(series.years[0]) if len(series.dates) else None,
+                int(series.years[-1]) if len(series.dates) else None,
+            )
+            logger.debug(
+                f"Using monthly aggregation for month {spec.month}, year={effective_year}"
+            )
+            return series.time_mask(spec.month, effective_year)
+
+        if spec.start_date or spec.end_date:
+            clamped = self._clamp_range(series, spec.start_date, spec.end_date)
+            if clamped is None:
+                return slice(None)
+            logger.debug(
+                f"Using date range aggregation: start={clamped[0]}, end={clamped[1]}"
+            )
+            # The index is sorted, so the range is a contiguous slice
+            return series.range_slice(*clamped)
+
+        logger.debug("Using overall average aggregation")
+        return slice(None)
+
+    def _location_matrix(
+        self, location_name: str, parameter_ids: List[str], specs: List[TimeSpec]
+    ) -> np.ndarray:
+        """
+        Aggregate several parameters for several time specs at one location.
+
+        Monthly specs are answered from the climatology cube; other specs load
+        the daily series once and reduce all parameters per selection.
+
+        Returns:
+            Array of shape (len(specs), len(parameter_ids)), NaN for missing data
+        """
+        result = np.full((len(specs), len(parameter_ids)), np.nan)
+        cube = self.climatology
+        cube_ready = cube is not None and all(
+            cube.has(location_name, p) for p in parameter_ids
+        )
+
+        series = None
+        for row, spec in enumerate(specs):
+            if spec.month is not None and cube_ready:
+                effective_year = self._resolve_year(
+                    spec.year, *cube.year_bounds(location_name)
+                )
+                result[row] = cube.means(
+                    location_name, parameter_ids, spec.month, effective_year
+                )
+                continue
+
+            if series is None:
+                series = self._load_location_data(location_name, parameter_ids)
+                if series is None:
+                    logger.error(f"Failed to load data for {location_name}")
+                    return result
+                for parameter_id in parameter_ids:
+                    if series.column(parameter_id) is None:
+                        logger.warning(
+                            f"Parameter {parameter_id} not available for {location_name}"
+                        )
+
+            selection = self._time_selection(series, spec)
+            result[row] = reduce_columns(series.block(parameter_ids, selection))
+
+        return result
+
+    def get_parameter_matrix(
+        self,
+        parameter_ids: List[str],
+        lat: float,
+        lon: float,
+        specs: List[TimeSpec],
+    ) -> np.ndarray:
         """
-        Aggregate daily data to monthly average.
+        Get values for several parameters and time specs at a point.
+
+        The nearest location is resolved once and each time selection is
+        built once for all parameters.
 
         Args:
-            daily_data: Dictionary mapping date strings (YYYYMMDD) to values
-            month: Month number (1-12)
-            year: Optional year filter
+            parameter_ids: NASA POWER parameter IDs (columns)
+            lat: Latitude
+            lon: Longitude
+            specs: Time selections (rows)
 
         Returns:
-            Monthly average value or None if no data
+            Array of shape (len(specs), len(parameter_ids)), NaN for missing data
         """
-        values = []
+        location_name = self._find_nearest_location(lat, lon)
+        if not location_name:
+            logger.warning(f"No location data found near {lat}, {lon}")
+            return np.full((len(specs), len(parameter_ids)), np.nan)
+        return self._location_matrix(location_name, parameter_ids, specs)
 
-        for date_str, value in daily_data.items():
-            try:
-                date_obj = datetime.strptime(date_str, "%Y%m%d")
+    def get_monthly_by_year(
+        self, parameter_ids: List[str], lat: float, lon: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Monthly means for every year of the nearest location's record.
 
-                # Filter by month first
-                if date_obj.month != month:
-                    continue
+        Read from the precomputed climatology cube in one slice; without a
+        cube, one is built from the location's series.
 
-                # Optional year filter
-                if year is not None and date_obj.year != year:
-                    continue
+        Returns:
+            Tuple of (years, array of shape (n_years, 12, len(parameter_ids))
+            with NaN for missing data)
+        """
+        location_name = self._find_nearest_location(lat, lon)
+        if not location_name:
+            logger.warning(f"No location data found near {lat}, {lon}")
+            return np.zeros(0, dtype=np.int32), np.zeros((0, 12, len(parameter_ids)))
+
+        cube = self.climatology
+        if cube is None or not all(cube.has(location_name, p) for p in parameter_ids):
+            series = self._load_location_data(location_name, parameter_ids)
+            if series is None:
+                return np.zeros(0, dtype=np.int32), np.zeros((0, 12, len(parameter_ids)))
+            cube = ClimatologyCube.build(
+                {location_name: series}, self.parameter_aggregations
+            )
+        return cube.monthly_means(location_name, parameter_ids)
 
-                # Optional date range clamp (intersect month with range when provided)
-                if start_date and date_obj < start_date:
-                    continue
-                if end_date and date_obj > end_date:
-                    continue
+    def get_daily_matrix(
+        self,
+        parameter_ids: List[str],
+        lat: float,
+        lon: float,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Daily values for several parameters over an inclusive date range.
 
-                values.append(value)
-            except:
-                continue
+        The nearest location is resolved and loaded once, and the requested
+        days are located in its sorted date index with a single
+        ``searchsorted``. Days outside the record, and missing observations,
+        are filled with the calendar-day mean across all years, so ranges in
+        the future or spanning several years still get a value per day.
+
+        Args:
+            parameter_ids: NASA POWER parameter IDs (columns)
+            lat: Latitude
+            lon: Longitude
+            start_date: First day of the range
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            Tuple of (``datetime64[D]`` days, array of shape
+            (n_days, len(parameter_ids)) with NaN where even the calendar-day
+            mean is unavailable, boolean mask of days taken entirely from the
+            observed record)
+        """
+        days = np.arange(
+            np.datetime64(start_date.date(), "D"),
+            np.datetime64(end_date.date(), "D") + 1,
+        )
+        matrix = np.full((len(days), len(parameter_ids)), np.nan)
+        observed = np.zeros(len(days), dtype=bool)
+
+        location_name = self._find_nearest_location(lat, lon)
+        if not location_name:
+            logger.warning(f"No location data found near {lat}, {lon}")
+            return days, matrix, observed
+        series = self._load_location_data(location_name, parameter_ids)
+        if series is None or len(series.dates) == 0:
+            logger.error(f"Failed to load data for {location_name}")
+            return days, matrix, observed
+
+        positions = np.searchsorted(series.dates, days)
+        in_record = positions < len(series.dates)
+        in_record[in_record] = series.dates[positions[in_record]] == days[in_record]
+        matrix[in_record] = series.block(parameter_ids, positions[in_record])
+
+        missing = np.isnan(matrix)
+        observed = ~missing.any(axis=1)
+        if missing.any():
+            climatology = series.calendar_day_means(parameter_ids)
+            fill = climatology[calendar_day_keys(days)]
+            matrix[missing] = fill[missing]
+            logger.debug(
+                f"Filled {int((~observed).sum())} of {len(days)} days at {location_name} "
+                f"from calendar-day means"
+            )
+        return days, matrix, observed
+
+    def location_score_distribution(
+        self, location_name: str, plan, threshold: float
+    ) -> Optional[ScoreDistribution]:
+        """
+        Per-month distribution of a vibe's daily scores at one location.
 
-        if not values:
+        Every day of the record is scored in one vectorized pass with
+        ``plan`` (a compiled ScoringPlan) and summarised for all 12 months.
+        Results are cached per (location, vibe, threshold) and recomputed if
+        the vibe's plan has since been reloaded.
+
+        Returns:
+            ScoreDistribution, or None if the location cannot be loaded
+        """
+        key = (location_name, plan.vibe_id, float(threshold))
+        cached = self.distribution_cache.get(key)
+        if cached is not None and cached[0] is plan:
+            return cached[1]
+
+        parameter_ids = list(plan.parameter_ids)
+        series = self._load_location_data(location_name, parameter_ids)
+        if series is None:
             return None
+        block = series.block(parameter_ids)
+        daily_scores = plan.score(block)
+        # Only days with every parameter count towards the distribution
+        daily_scores[np.isnan(block).any(axis=1)] = np.nan
+
+        distribution = score_distribution(daily_scores, series.months, threshold)
+        self.distribution_cache.put(key, (plan, distribution), size=distribution.nbytes)
+        logger.debug(f"Computed {plan.vibe_id} score distribution for {location_name}")
+        return distribution
+
+    def get_score_distribution(
+        self, plan, lat: float, lon: float, threshold: float
+    ) -> Optional[ScoreDistribution]:
+        """Score distribution at the location nearest to a point."""
+        location_name = self._find_nearest_location(lat, lon)
+        if not location_name:
+            logger.warning(f"No location data found near {lat}, {lon}")
+            return None
+        return self.location_score_distribution(location_name, plan, threshold)
+
+    def get_radius_score_distributions(
+        self, plan, center_lat: float, center_lon: float, radius_km: float, threshold: float
+    ) -> Dict[Tuple[float, float], ScoreDistribution]:
+        """Score distributions keyed by (lat, lon) for every location within a radius."""
+        distributions = {}
+        for location_name, _ in self.locations_within_radius(
+            center_lat, center_lon, radius_km
+        ):
+            distribution = self.location_score_distribution(location_name, plan, threshold)
+            if distribution is not None:
+                info = self.locations_cache[location_name]
+                distributions[(info["lat"], info["lon"])] = distribution
+        return distributions
+
+    def get_radius_matrix(
+        self,
+        parameter_ids: List[str],
+        center_lat: float,
+        center_lon: float,
+        radius_km: float,
+        spec: TimeSpec,
+    ) -> Tuple[List[Tuple[float, float]], np.ndarray]:
+        """
+        Get values for several parameters at every location within a radius.
+
+        Args:
+            parameter_ids: NASA POWER parameter IDs (columns)
+            center_lat: Center latitude
+            center_lon: Center longitude
+            radius_km: Great-circle search radius in km
+            spec: Time selection applied to every location
 
-        return np.mean(values)
+        Returns:
+            Tuple of ((lat, lon) per location, array of shape
+            (n_locations, len(parameter_ids)) with NaN for missing data)
+        """
+        coords = []
+        rows = []
+        for location_name, _ in self.locations_within_radius(
+            center_lat, center_lon, radius_km
+        ):
+            info = self.locations_cache[location_name]
+            coords.append((info["lat"], info["lon"]))
+            rows.append(self._location_matrix(location_name, parameter_ids, [spec])[0])
+
+        if not rows:
+            return coords, np.zeros((0, len(parameter_ids)))
+        return coords, np.vstack(rows)
+
+    def get_grid_weights(
+        self,
+        center_lat: float,
+        center_lon: float,
+        radius_km: float,
+        resolution_km: float,
+    ) -> GridWeights:
+        """
+        Grid over a radius and its IDW weights, cached per request geometry.
+
+        Repeat requests for the same (center, radius, resolution) reuse the
+        grid and weights, so interpolation is a single gather-and-sum.
+        """
+        key = (
+            round(center_lat, 6),
+            round(center_lon, 6),
+            float(radius_km),
+            float(resolution_km),
+        )
+        grid = self.grid_cache.get(key)
+        if grid is None:
+            lats, lons = generate_grid(center_lat, center_lon, radius_km, resolution_km)
+            grid = idw_weights(
+                self.spatial_index,
+                lats,
+                lons,
+                neighbours=min(self.idw_neighbours, len(self.spatial_index)),
+                power=self.idw_power,
+            )
+            self.grid_cache.put(key, grid)
+            logger.debug(f"Built {len(lats)}-point grid weights for {key}")
+        return grid
 
-    def _aggregate_date_range(
+    def get_grid_matrix(
         self,
-        daily_data: Dict[str, float],
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-    ) -> Optional[float]:
+        parameter_ids: List[str],
+        center_lat: float,
+        center_lon: float,
+        radius_km: float,
+        resolution_km: float,
+        spec: TimeSpec,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Aggregate daily data to date range average.
+        Interpolate several parameters onto a regular grid within a radius.
+
+        Each station that contributes to the grid is aggregated once, then
+        values are spread to grid nodes by inverse-distance weighting.
 
         Args:
-            daily_data: Dictionary mapping date strings (YYYYMMDD) to values
-            start_date: Start date for filtering
-            end_date: End date for filtering
+            parameter_ids: NASA POWER parameter IDs (columns)
+            center_lat: Center latitude
+            center_lon: Center longitude
+            radius_km: Great-circle radius in km
+            resolution_km: Grid spacing in km
+            spec: Time selection applied to every station
 
         Returns:
-            Date range average value or None if no data
+            Tuple of (lats, lons, array of shape (n_points, len(parameter_ids))
+            with NaN where no neighbouring station has data)
+        """
+        if not self.locations_cache:
+            empty = np.zeros(0)
+            return empty, empty, np.zeros((0, len(parameter_ids)))
+
+        grid = self.get_grid_weights(center_lat, center_lon, radius_km, resolution_km)
+        station_values = np.full((len(grid.station_names), len(parameter_ids)), np.nan)
+        for station in np.unique(grid.station_index):
+            station_values[station] = self._location_matrix(
+                grid.station_names[station], parameter_ids, [spec]
+            )[0]
+        return grid.lats, grid.lons, grid.interpolate(station_values)
+
+    def get_radius_top_k(
+        self,
+        parameter_ids: List[str],
+        center_lat: float,
+        center_lon: float,
+        radius_km: float,
+        spec: TimeSpec,
+        k: int,
+        score_rows: Callable[[np.ndarray], np.ndarray],
+        upper_bound: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+    ) -> Tuple[List[Tuple[float, float, float]], Dict[str, int]]:
         """
-        values = []
+        Best ``k`` locations within a radius under a caller-supplied score.
 
-        for date_str, value in daily_data.items():
-            try:
-                date_obj = datetime.strptime(date_str, "%Y%m%d")
-
-                # Filter by date range if provided
-                if start_date and end_date:
-                    if start_date <= date_obj <= end_date:
-                        values.append(value)
-                elif start_date:
-                    if date_obj >= start_date:
-                        values.append(value)
-                elif end_date:
-                    if date_obj <= end_date:
-                        values.append(value)
-                else:
-                    values.append(value)
-            except:
-                continue
+        For monthly specs with a climatology cube, every candidate gets an
+        optimistic score from ``upper_bound(mins, maxs)`` over its monthly
+        daily extrema. Candidates are evaluated best bound first and the
+        search stops once no remaining bound can beat the current k-th best
+        score. Locations missing any parameter are skipped.
 
-        if not values:
-            return None
+        Args:
+            parameter_ids: NASA POWER parameter IDs (columns)
+            center_lat: Center latitude
+            center_lon: Center longitude
+            radius_km: Great-circle search radius in km
+            spec: Time selection applied to every location
+            k: Number of locations to return
+            score_rows: Maps an (n, len(parameter_ids)) block to n scores
+            upper_bound: Maps (mins, maxs) blocks to n score upper bounds
 
-        return np.mean(values)
+        Returns:
+            Tuple of ((lat, lon, score) sorted best first, search statistics)
+        """
+        candidates = [
+            name
+            for name, _ in self.locations_within_radius(center_lat, center_lon, radius_km)
+        ]
+        bounds = np.full(len(candidates), np.inf)
+
+        cube = self.climatology
+        if upper_bound is not None and spec.month is not None and cube is not None:
+            mins = np.full((len(candidates), len(parameter_ids)), np.nan)
+            maxs = np.full((len(candidates), len(parameter_ids)), np.nan)
+            for i, name in enumerate(candidates):
+                years = cube.year_bounds(name)
+                if years is not None:
+                    year = self._resolve_year(spec.year, *years)
+                    mins[i], maxs[i] = cube.extrema(name, parameter_ids, spec.month, year)
+            if candidates:
+                bounds = upper_bound(mins, maxs)
+
+        heap: List[Tuple[float, int]] = []
+        evaluated = 0
+        for i in np.argsort(-bounds, kind="stable"):
+            if len(heap) == k and bounds[i] <= heap[0][0]:
+                break
+            evaluated += 1
+            row = self._location_matrix(candidates[i], parameter_ids, [spec])
+            if np.isnan(row).any():
+                continue
+            score = float(score_rows(row)[0])
+            if len(heap) < k:
+                heapq.heappush(heap, (score, int(i)))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, int(i)))
+
+        results = []
+        for score, i in sorted(heap, key=lambda item: (-item[0], item[1])):
+            info = self.locations_cache[candidates[i]]
+            results.append((info["lat"], info["lon"], score))
+        stats = {
+            "candidates": len(candidates),
+            "evaluated": evaluated,
+            "pruned": len(candidates) - evaluated,
+        }
+        logger.debug(f"Top-{k} search over radius: {stats}")
+        return results, stats
 
     def get_value_at_point(
         self,
@@ -261,92 +1082,13 @@ class DataService:
             f"Getting value for {parameter_id} at ({lat}, {lon}), month={month}, year={year}, start_date={start_date}, end_date={end_date}"
         )
 
-        # Find nearest location
-        location_name = self._find_nearest_location(lat, lon)
-        if not location_name:
-            logger.warning(f"No location data found near {lat}, {lon}")
-            return None
-
-        # Load location data
-        location_data = self._load_location_data(location_name)
-        if not location_data:
-            logger.error(f"Failed to load data for {location_name}")
-            return None
-
-        # Get parameter data
-        if parameter_id not in location_data["parameters"]:
-            logger.warning(
-                f"Parameter {parameter_id} not available for {location_name}"
-            )
-            return None
-
-        daily_data = location_data["parameters"][parameter_id]
-        logger.debug(f"Found {len(daily_data)} daily data points for {parameter_id}")
-
-        # Compute available data range
-        try:
-            all_dates = [datetime.strptime(k, "%Y%m%d") for k in daily_data.keys()]
-            min_date = min(all_dates)
-            max_date = max(all_dates)
-        except Exception as e:
-            logger.warning(f"Failed parsing date keys for {parameter_id}: {e}")
-            min_date = None
-            max_date = None
-
-        # Prefer monthly aggregation when month is specified
-        if month is not None:
-            # If a specific year was requested but is outside available data, ignore year filter
-            effective_year = year
-            if min_date and max_date and year is not None:
-                if year < min_date.year or year > max_date.year:
-                    logger.info(
-                        f"Year {year} out of available range {min_date.year}-{max_date.year}. Falling back to all years."
-                    )
-                    effective_year = None
-
-            logger.debug(
-                f"Using monthly aggregation for month {month}, year={effective_year}"
-            )
-            result = self._aggregate_monthly(daily_data, month, effective_year)
-
-        elif start_date or end_date:
-            # Clamp requested range to available data
-            clamped_start = start_date
-            clamped_end = end_date
-            if min_date:
-                if clamped_start and clamped_start < min_date:
-                    clamped_start = min_date
-                if clamped_end and clamped_end < min_date:
-                    clamped_end = min_date
-            if max_date:
-                if clamped_start and clamped_start > max_date:
-                    clamped_start = max_date
-                if clamped_end and clamped_end > max_date:
-                    clamped_end = max_date
-
-            # If clamped range is invalid, fall back to overall average
-            if clamped_start and clamped_end and clamped_start > clamped_end:
-                logger.info(
-                    f"Requested date range has no overlap with data ({start_date}..{end_date} vs {min_date}..{max_date}). Returning overall average."
-                )
-                values = list(daily_data.values())
-                result = np.mean(values) if values else None
-            else:
-                logger.debug(
-                    f"Using date range aggregation: start={clamped_start}, end={clamped_end}"
-                )
-                result = self._aggregate_date_range(
-                    daily_data, clamped_start, clamped_end
-                )
-
-        else:
-            logger.debug("Using overall average aggregation")
-            # If no specific time filter, return overall average
-            values = list(daily_data.values())
-            result = np.mean(values) if values else None
+        matrix = self.get_parameter_matrix(
+            [parameter_id], lat, lon, [TimeSpec(month, year, start_date, end_date)]
+        )
+        result = matrix[0, 0]
 
         logger.debug(f"Final aggregated value: {result}")
-        return result
+        return None if np.isnan(result) else float(result)
 
     def get_values_in_radius(
         self,
@@ -364,46 +1106,78 @@ class DataService:
         Get parameter values for all points within a radius.
 
         Since we only have point data, this returns values for all available
-        locations within the radius.
+        locations within the great-circle radius.
 
         Returns:
             List of (lat, lon, value) tuples
         """
-        results = []
-
-        # Convert km to approximate degrees (rough approximation)
-        radius_deg = radius_km / 111.0  # 1 degree ≈ 111 km
-
-        for location_name, location_info in self.locations_cache.items():
-            loc_lat = location_info["lat"]
-            loc_lon = location_info["lon"]
-
-            # Check if within radius
-            distance = np.sqrt(
-                (center_lat - loc_lat) ** 2 + (center_lon - loc_lon) ** 2
-            )
-
-            if distance <= radius_deg:
-                value = self.get_value_at_point(
-                    parameter_id, loc_lat, loc_lon, month, year, start_date, end_date
-                )
-                if value is not None:
-                    results.append((loc_lat, loc_lon, value))
-
-        return results
+        coords, matrix = self.get_radius_matrix(
+            [parameter_id],
+            center_lat,
+            center_lon,
+            radius_km,
+            TimeSpec(month, year, start_date, end_date),
+        )
+        return [
+            (lat, lon, float(value))
+            for (lat, lon), value in zip(coords, matrix[:, 0])
+            if not np.isnan(value)
+        ]
 
     def get_monthly_values(
         self, parameter_id: str, lat: float, lon: float, year: Optional[int] = None
     ) -> Dict[int, float]:
         """Get parameter values for all 12 months at a location."""
-        monthly_values = {}
+        location_name = self._find_nearest_location(lat, lon)
+        if not location_name:
+            return {}
+
+        cube = self.climatology
+        if cube is not None and cube.has(location_name, parameter_id):
+            effective_year = self._resolve_year(year, *cube.year_bounds(location_name))
+            values = cube.month_means(location_name, parameter_id, effective_year)
+        else:
+            specs = [TimeSpec(month, year) for month in range(1, 13)]
+            values = self._location_matrix(location_name, [parameter_id], specs)[:, 0]
+
+        return {
+            month: value
+            for month, value in enumerate(values.tolist(), start=1)
+            if not np.isnan(value)
+        }
+
+    def get_monthly_aggregate(
+        self,
+        parameter_id: str,
+        lat: float,
+        lon: float,
+        month: int,
+        year: Optional[int] = None,
+    ) -> Optional[float]:
+        """
+        Get a monthly value using the aggregation declared in power_parameters.yml.
 
-        for month in range(1, 13):
-            value = self.get_value_at_point(parameter_id, lat, lon, month, year)
-            if value is not None:
-                monthly_values[month] = value
+        Unlike :meth:`get_value_at_point`, which always averages daily values,
+        this returns e.g. the monthly precipitation total, matching the offline
+        monthly summaries (see :meth:`ClimatologyCube.aggregate` for how a
+        month without valid days differs).
+        """
+        location_name = self._find_nearest_location(lat, lon)
+        if not location_name:
+            return None
 
-        return monthly_values
+        cube = self.climatology
+        if cube is None or not cube.has(location_name, parameter_id):
+            # Without a precomputed cube, summarise just this location
+            series = self._load_location_data(location_name, [parameter_id])
+            if series is None or series.column(parameter_id) is None:
+                return None
+            cube = ClimatologyCube.build(
+                {location_name: series}, self.parameter_aggregations
+            )
+
+        effective_year = self._resolve_year(year, *cube.year_bounds(location_name))
+        return cube.aggregate(location_name, parameter_id, month, effective_year)
 
     def get_all_parameters(
         self,
@@ -420,15 +1194,14 @@ class DataService:
             f"Getting all parameters {parameter_ids} at ({lat}, {lon}), month={month}, year={year}"
         )
 
-        result = {}
+        values = self.get_parameter_matrix(
+            parameter_ids, lat, lon, [TimeSpec(month, year, start_date, end_date)]
+        )[0]
 
-        for param_id in parameter_ids:
-            logger.debug(f"Getting parameter: {param_id}")
-            value = self.get_value_at_point(
-                param_id, lat, lon, month, year, start_date, end_date
-            )
-            if value is not None:
-                result[param_id] = value
+        result = {}
+        for param_id, value in zip(parameter_ids, values):
+            if not np.isnan(value):
+                result[param_id] = float(value)
                 logger.debug(f"Got value for {param_id}: {value}")
             else:
                 logger.warning(f"No value found for {param_id}")
@@ -436,6 +1209,91 @@ class DataService:
         logger.debug(f"Final result: {result}")
         return result
 
+    def warm_up(
+        self,
+        location_names: Optional[List[str]] = None,
+        parameter_ids: Optional[List[str]] = None,
+    ) -> Dict[str, any]:
+        """
+        Preload location data so the first requests do not pay for it.
+
+        Loads the date index and the requested columns of each location into
+        the cache and runs one monthly and one full-record aggregation per
+        location, exercising both the climatology cube and the series path.
+
+        Args:
+            location_names: Locations to load (default: all)
+            parameter_ids: Columns to load (default: every parameter)
+
+        Returns:
+            Summary with the number of locations and columns loaded
+        """
+        names = location_names if location_names is not None else list(self.locations_cache)
+        loaded_locations = 0
+        loaded_columns = 0
+        for location_name in names:
+            if location_name not in self.locations_cache:
+                logger.warning(f"Warm-up location {location_name} not found")
+                continue
+            series = self._load_location_data(location_name, parameter_ids)
+            if series is None:
+                continue
+            loaded_locations += 1
+            loaded_columns += len(series.columns)
+            if series.parameters:
+                self._location_matrix(
+                    location_name, series.parameters, [TimeSpec(month=1), TimeSpec()]
+                )
+
+        logger.info(
+            f"Warmed up {loaded_locations} locations ({loaded_columns} columns, "
+            f"{self.cache.current_bytes / 1e6:.1f} MB cached)"
+        )
+        return {"locations": loaded_locations, "columns": loaded_columns}
+
+    def self_check(self) -> Dict[str, any]:
+        """
+        Sanity-check a freshly built service before it takes traffic.
+
+        Loads one column of one location end to end and checks that the
+        climatology cube, if any, covers the indexed locations.
+
+        Returns:
+            Summary of what was checked
+
+        Raises:
+            ValueError: If the service could not serve requests
+        """
+        if not self.locations_cache:
+            raise ValueError("No locations indexed")
+        if len(self.spatial_index) != len(self.locations_cache):
+            raise ValueError("Spatial index does not match the indexed locations")
+
+        probe = sorted(self.locations_cache)[0]
+        try:
+            self._load_location_index(probe)
+        except Exception as e:
+            raise ValueError(f"Could not load data for {probe}: {e}") from e
+        parameters = self.locations_cache[probe]["parameters"][:1]
+        series = self._load_location_data(probe, parameters)
+        if series is None or not len(series.dates) or not series.columns:
+            raise ValueError(f"Could not load data for {probe}")
+
+        if self.climatology is not None and set(self.climatology.locations) != set(
+            self.locations_cache
+        ):
+            raise ValueError("Climatology cube does not cover the indexed locations")
+
+        return {
+            "locations": len(self.locations_cache),
+            "probe_location": probe,
+            "probe_days": int(len(series.dates)),
+        }
+
+    def get_cache_stats(self) -> Dict[str, any]:
+        """Hit/miss/eviction counters and occupancy of the location cache."""
+        return self.cache.stats()
+
     def get_available_locations(self) -> List[Dict[str, any]]:
         """Get list of all available locations."""
         return [
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+# Score percentiles reported for each month
+QUANTILES = (10, 50, 90)
+
+
+@dataclass(frozen=True)
+class ScoreDistribution:
+    """
+    Per-month distribution of a vibe's daily scores at one location.
+
+    Row ``m - 1`` of each array describes calendar month ``m`` across every
+    year of the record: the share of days scoring above ``threshold`` and
+    the score percentiles in :data:`QUANTILES`.
+    """
+
+    threshold: float
+    num_days: np.ndarray  # (12,) days with a complete score
+    probability: np.ndarray  # (12,) fraction of those days above threshold
+    quantiles: np.ndarray  # (12, len(QUANTILES)) score percentiles
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.num_days.nbytes + self.probability.nbytes + self.quantiles.nbytes)
+
+    def month(self, month: int) -> Optional[Dict[str, float]]:
+        """Summary for one month, or None if it has no scored days."""
+        if self.num_days[month - 1] == 0:
+            return None
+        summary = {"probability": float(self.probability[month - 1])}
+        for q, value in zip(QUANTILES, self.quantiles[month - 1].tolist()):
+            summary[f"p{q}"] = value
+        return summary
+
+
+def _grouped_percentiles(
+    values: np.ndarray, groups: np.ndarray, n_groups: int, percentiles: Tuple[int, ...]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linear-interpolated percentiles of ``values`` within each group at once.
+
+    Sorts once by (group, value) and indexes every group's order statistics
+    directly, matching ``np.percentile`` per group.
+
+    Returns:
+        Tuple of (group sizes, array of shape (n_groups, len(percentiles))
+        with NaN for empty groups)
+    """
+    order = np.lexsort((values, groups))
+    ordered = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    position = (counts[:, None] - 1) * (np.asarray(percentiles) / 100.0)[None, :]
+    position = np.maximum(position, 0.0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    fraction = position - lower
+
+    result = np.full((n_groups, len(percentiles)), np.nan)
+    filled = counts > 0
+    if filled.any():
+        lo = ordered[(starts[:, None] + lower)[filled]]
+        hi = ordered[(starts[:, None] + upper)[filled]]
+        result[filled] = lo + (hi - lo) * fraction[filled]
+    return counts, result
+
+
+def score_distribution(
+    daily_scores: np.ndarray, months: np.ndarray, threshold: float
+) -> ScoreDistribution:
+    """
+    Summarise daily vibe scores per calendar month in one vectorized pass.
+
+    Args:
+        daily_scores: Score of every day in the record; NaN days are ignored
+        months: Calendar month (1-12) of each day
+        threshold: Score a day must exceed to count as good
+
+    Returns:
+        ScoreDistribution over the 12 months
+    """
+    daily_scores = np.asarray(daily_scores, dtype=np.float64)
+    valid = ~np.isnan(daily_scores)
+    scores = daily_scores[valid]
+    groups = np.asarray(months, dtype=np.int64)[valid] - 1
+
+    counts, quantiles = _grouped_percentiles(scores, groups, 12, QUANTILES)
+    good = np.bincount(groups[scores > threshold], minlength=12)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        probability = np.where(counts > 0, good / counts, np.nan)
+
+    return ScoreDistribution(
+        threshold=float(threshold),
+        num_days=counts,
+        probability=probability,
+        quantiles=quantiles,
+    )
@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+
+from app.utils.spatial_index import SpatialIndex
+
+# Stations closer than this are treated as coincident with the grid point
+COINCIDENT_KM = 1e-6
+
+
+@dataclass
+class GridWeights:
+    """
+    Inverse-distance weights from grid points to their nearest stations.
+
+    Row ``i`` interpolates grid point ``(lats[i], lons[i])`` from the
+    stations ``station_index[i]`` with ``weights[i]`` (each row sums to 1).
+    Indices refer to ``station_names``.
+    """
+
+    lats: np.ndarray
+    lons: np.ndarray
+    station_names: List[str]
+    station_index: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.lats.nbytes
+            + self.lons.nbytes
+            + self.station_index.nbytes
+            + self.weights.nbytes
+        )
+
+    def interpolate(self, station_values: np.ndarray) -> np.ndarray:
+        """
+        Interpolate station values onto the grid.
+
+        Args:
+            station_values: Array of shape (len(station_names), n_params);
+                NaN entries are left out and the remaining weights renormalized
+
+        Returns:
+            Array of shape (n_points, n_params), NaN where no neighbour has data
+        """
+        gathered = station_values[self.station_index]  # (n_points, k, n_params)
+        valid = ~np.isnan(gathered)
+        weights = np.where(valid, self.weights[:, :, None], 0.0)
+        total = weights.sum(axis=1)
+        weighted = (np.where(valid, gathered, 0.0) * weights).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(total > 0, weighted / total, np.nan)
+
+
+def idw_weights(
+    index: SpatialIndex,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    neighbours: int = 4,
+    power: float = 2.0,
+) -> GridWeights:
+    """
+    Build inverse-distance weights for grid points from an index of stations.
+
+    Args:
+        index: Spatial index over the stations
+        lats: Grid latitudes
+        lons: Grid longitudes
+        neighbours: Number of nearest stations used per grid point
+        power: Distance exponent (2 is classic Shepard interpolation)
+
+    Returns:
+        GridWeights for the grid; a grid point on top of a station takes
+        that station's value
+    """
+    distances, station_index = index.nearest(lats, lons, k=neighbours)
+    coincident = distances <= COINCIDENT_KM
+    inverse = 1.0 / np.maximum(distances, COINCIDENT_KM) ** power
+    inverse = np.where(coincident.any(axis=1, keepdims=True), coincident * 1.0, inverse)
+    weights = inverse / inverse.sum(axis=1, keepdims=True)
+
+    return GridWeights(
+        lats=np.asarray(lats, dtype=np.float64),
+        lons=np.asarray(lons, dtype=np.float64),
+        station_names=list(index.names),
+        station_index=station_index,
+        weights=weights,
+    )
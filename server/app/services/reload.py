@@ -0,0 +1,240 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import time
+
+from app.core import vibe_engine as vibe_engine_module
+from app.core.vibe_engine import VibeEngine, get_vibe_engine
+from app.services import data_service as data_service_module
+from app.services.data_service import DataService
+from app.services.result_cache import get_result_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ReloadState:
+    """Outcome of the most recent snapshot reload, reported by the admin API."""
+
+    def __init__(self):
+        self.status = "idle"  # idle | running | swapped | unchanged | failed
+        self.trigger: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.duration_seconds: Optional[float] = None
+        self.snapshot_id: Optional[str] = None
+        self.previous_snapshot_id: Optional[str] = None
+        self.generation: Optional[str] = None
+        self.vibes_fingerprint: Optional[str] = None
+        self.check: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.swaps = 0
+        self.failures = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "trigger": self.trigger,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": self.duration_seconds,
+            "snapshot_id": self.snapshot_id,
+            "previous_snapshot_id": self.previous_snapshot_id,
+            "generation": self.generation,
+            "vibes_fingerprint": self.vibes_fingerprint,
+            "check": self.check,
+            "error": self.error,
+            "swaps": self.swaps,
+            "failures": self.failures,
+        }
+
+
+class SnapshotReloader:
+    """
+    Rebuild the data service in the background and swap it in atomically.
+
+    A new service is built, self-checked and warmed off the event loop
+    while the current one keeps serving. Only then is the global reference
+    replaced; requests already running hold the old service and finish on
+    it. With a ``vibes_factory`` the vibe dictionary is re-read alongside
+    and swapped with the data, so edits to it take effect on reload too.
+    Result caches are re-versioned to the new snapshot id and vibe
+    fingerprint at the swap. A failed build leaves the current service in
+    place. Reloads are serialized: a trigger while one is running is ignored.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], DataService],
+        prepare: Optional[Callable[[DataService, VibeEngine], Any]] = None,
+        vibes_factory: Optional[Callable[[], VibeEngine]] = None,
+    ):
+        self.factory = factory
+        self.prepare = prepare
+        self.vibes_factory = vibes_factory
+        self.state = ReloadState()
+        self.task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked() or (self.task is not None and not self.task.done())
+
+    @property
+    def task_status(self) -> Optional[str]:
+        """Status of the last background reload started with :meth:`start`."""
+        task = self.task
+        if task is None:
+            return None
+        if not task.done():
+            return "running"
+        if task.cancelled():
+            return "cancelled"
+        return "failed" if task.exception() is not None else "done"
+
+    def start(self, trigger: str, force: bool = False) -> asyncio.Task:
+        """Run :meth:`reload` in the background, keeping the task on ``self.task``."""
+        self.task = asyncio.create_task(self.reload(trigger, force=force))
+        return self.task
+
+    def _build(self) -> Tuple[DataService, VibeEngine]:
+        vibes = self.vibes_factory() if self.vibes_factory else get_vibe_engine()
+        service = self.factory()
+        self.state.check = service.self_check()
+        if self.prepare is not None:
+            self.prepare(service, vibes)
+        return service, vibes
+
+    def _swap(self, service: DataService, vibes: VibeEngine):
+        data_service_module.data_service = service
+        vibe_engine_module.vibe_engine = vibes
+        cache = get_result_cache()
+        if cache is not None:
+            cache.set_version(service.snapshot_id, vibes.fingerprint)
+
+    async def reload(self, trigger: str, force: bool = False) -> ReloadState:
+        """
+        Build, validate and (if the data changed or ``force``) swap in a new service.
+
+        Returns:
+            The updated state
+        """
+        if self._lock.locked():
+            logger.info(f"Reload already running; ignoring trigger '{trigger}'")
+            return self.state
+
+        async with self._lock:
+            state = self.state
+            state.status = "running"
+            state.trigger = trigger
+            state.started_at = datetime.utcnow()
+            state.finished_at = None
+            state.error = None
+            state.check = {}
+            started = time.perf_counter()
+            current = data_service_module.data_service
+            current_vibes = vibe_engine_module.vibe_engine
+            state.previous_snapshot_id = current.snapshot_id if current else None
+            logger.info(f"Reloading data snapshot (trigger: {trigger})")
+            try:
+                service, vibes = await asyncio.to_thread(self._build)
+                state.snapshot_id = service.snapshot_id
+                state.generation = service.generation
+                state.vibes_fingerprint = vibes.fingerprint
+                if (
+                    not force
+                    and current is not None
+                    and service.snapshot_id == current.snapshot_id
+                    and service.generation == current.generation
+                    and current_vibes is not None
+                    and vibes.fingerprint == current_vibes.fingerprint
+                ):
+                    state.status = "unchanged"
+                    logger.info(f"Data snapshot {service.snapshot_id} unchanged")
+                else:
+                    self._swap(service, vibes)
+                    state.status = "swapped"
+                    state.swaps += 1
+                    logger.info(
+                        f"✓ Swapped data snapshot {state.previous_snapshot_id} -> "
+                        f"{service.snapshot_id}"
+                    )
+            except Exception as e:
+                logger.error(f"Reload failed, keeping current data: {e}")
+                state.status = "failed"
+                state.error = str(e)
+                state.failures += 1
+            finally:
+                state.finished_at = datetime.utcnow()
+                state.duration_seconds = round(time.perf_counter() - started, 6)
+            return state
+
+
+def raw_files_signature(data_path: str, extra_paths: Iterable[str] = ()) -> str:
+    """
+    Cheap fingerprint of the raw point files under ``data/outputs``.
+
+    ``extra_paths`` (e.g. the vibe dictionary) are folded in as well.
+    """
+    digest = hashlib.sha1()
+    outputs_dir = Path(data_path) / "outputs"
+    paths = [
+        (path, path.relative_to(outputs_dir))
+        for path in sorted(outputs_dir.glob("*_point/raw/*.json"))
+    ]
+    paths += [(Path(p), p) for p in extra_paths]
+    for path, name in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+async def watch(
+    reloader: SnapshotReloader,
+    signature: Callable[[], Optional[str]],
+    poll_seconds: float,
+    settle: bool = True,
+):
+    """
+    Poll ``signature`` and reload whenever it changes.
+
+    With ``settle`` a change must be seen unchanged on two consecutive
+    polls before reloading, so files still being written are not picked up
+    half-way. A failing poll is logged and counts as no change, so one
+    unreadable file or pointer does not stop the watcher.
+    """
+
+    async def poll() -> Optional[str]:
+        try:
+            return await asyncio.to_thread(signature)
+        except Exception as e:
+            logger.error(f"Snapshot watcher poll failed: {e}")
+            return None
+
+    last = await poll()
+    pending = None
+    while True:
+        await asyncio.sleep(poll_seconds)
+        current = await poll()
+        if current is None or current == last:
+            pending = None
+            continue
+        if settle and current != pending:
+            pending = current
+            continue
+        last, pending = current, None
+        await reloader.reload("watcher")
+
+
+# Global instance - initialized in main.py
+reloader: Optional[SnapshotReloader] = None
+
+
+def get_reloader() -> Optional[SnapshotReloader]:
+    """Get the global snapshot reloader, or None before startup."""
+    return reloader
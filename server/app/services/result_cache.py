@@ -0,0 +1,269 @@
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Union
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.services.cache import LRUCache
+from app.services.compute_pool import run_compute
+from app.services.single_flight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Decimal places kept for coordinates in cache keys (~11 m)
+COORDINATE_PLACES = 4
+
+
+def round_coordinate(value: float) -> float:
+    """Round a latitude/longitude for use in a cache key."""
+    return round(float(value), COORDINATE_PLACES)
+
+
+def _placeholder(path: str) -> Dict[str, str]:
+    return {"__echo__": path}
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _with_placeholders(response: BaseModel, echo: Mapping[str, Any]) -> BaseModel:
+    """Copy of ``response`` with each echoed field replaced by its placeholder."""
+    update: Dict[str, Any] = {}
+    for path in echo:
+        field, _, subkey = path.partition(".")
+        if subkey:
+            container = dict(update.get(field, getattr(response, field)))
+            container[subkey] = _placeholder(path)
+            update[field] = container
+        else:
+            update[field] = _placeholder(path)
+    return response.model_copy(update=update)
+
+
+def _fill_placeholders(body: str, echo: Mapping[str, Any]) -> str:
+    for path, value in echo.items():
+        body = body.replace(_compact_json(_placeholder(path)), _compact_json(value), 1)
+    return body
+
+
+def _json_response(body: str) -> Response:
+    return Response(content=body.encode("utf-8"), media_type="application/json")
+
+
+class CacheBackend:
+    """
+    Storage for serialized route results.
+
+    Values are JSON strings so a shared store (e.g. Redis or memcached) can
+    hold them; :class:`LocalCacheBackend` is the in-process stand-in.
+    """
+
+    name = "abstract"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: Dict[str, Any], size: int):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class LocalCacheBackend(CacheBackend):
+    """In-process backend: a byte-bounded LRU cache."""
+
+    name = "local"
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self._cache = LRUCache(
+            max_bytes=max_bytes, max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(key)
+
+    def set(self, key: str, entry: Dict[str, Any], size: int):
+        self._cache.put(key, entry, size=size)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+BACKENDS: Dict[str, Callable[..., CacheBackend]] = {
+    "local": LocalCacheBackend,
+}
+
+
+def create_backend(name: str, **options) -> CacheBackend:
+    """
+    Instantiate a registered backend by name.
+
+    Raises:
+        ValueError: If no backend is registered under ``name``
+    """
+    factory = BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown result cache backend: {name}. Available: {list(BACKENDS)}")
+    return factory(**options)
+
+
+class ResultCache:
+    """
+    Cache of route responses keyed on canonicalized requests.
+
+    Keys are prefixed with a version derived from the data snapshot and the
+    vibe dictionary, so results computed against older data or vibes are
+    never served; the backend is cleared when the version changes.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.version: Optional[str] = None
+        self._version_parts: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.compute_seconds = 0.0
+        self.saved_seconds = 0.0
+        self.flights = AsyncSingleFlight()
+
+    def set_version(self, *parts: Any) -> str:
+        """Set the version from its parts, clearing the backend if it changed."""
+        if parts == self._version_parts:
+            return self.version
+        version = hashlib.sha1(json.dumps(parts, default=str).encode()).hexdigest()[:16]
+        with self._lock:
+            if version != self.version:
+                if self.version is not None:
+                    self.backend.clear()
+                    self.invalidations += 1
+                    logger.info(f"Result cache invalidated ({self.version} -> {version})")
+                self.version = version
+            self._version_parts = parts
+        return version
+
+    def make_key(self, route: str, params: Mapping[str, Any]) -> str:
+        """Deterministic key for a route and its canonical parameters."""
+        canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{self.version}:{route}:{canonical}"
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], BaseModel],
+        echo: Optional[Mapping[str, Any]] = None,
+        run: Optional[Callable[[Callable[[], Any]], Awaitable[Any]]] = None,
+    ) -> Response:
+        """
+        Serve the cached JSON body for ``key``, or compute and store it.
+
+        Hits return the stored body without re-validating or re-serializing
+        the model. ``echo`` maps field paths (``"location"`` or
+        ``"metadata.center"``) to request-specific values; they are stored as
+        placeholders and filled in per request, so requests sharing a key
+        still echo their own inputs. Concurrent misses for the same key
+        share one computation. On a miss, ``run`` executes the compute
+        and serialization (e.g. on a worker pool); without it they run
+        inline. Only successful results are stored; exceptions from
+        ``compute`` propagate uncached.
+        """
+        echo = echo or {}
+        entry = self.backend.get(key)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+                self.saved_seconds += entry["compute_seconds"]
+            return _json_response(_fill_placeholders(entry["body"], echo))
+
+        def build():
+            started = time.perf_counter()
+            response = compute()
+            elapsed = time.perf_counter() - started
+            return elapsed, _with_placeholders(response, echo).model_dump_json()
+
+        async def fill():
+            elapsed, body = await run(build) if run is not None else build()
+            if key.startswith(f"{self.version}:"):
+                # Results computed against a superseded snapshot are not kept
+                self.backend.set(key, {"body": body, "compute_seconds": elapsed}, size=len(body))
+            with self._lock:
+                self.misses += 1
+                self.compute_seconds += elapsed
+            return body
+
+        # Identical requests arriving during the computation wait for it
+        body = await self.flights.do(key, fill)
+        return _json_response(_fill_placeholders(body, echo))
+
+    def clear(self):
+        """Drop every cached result (counters are kept)."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio, compute time spent on misses and time saved by hits."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend.name,
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "coalesced": self.flights.coalesced,
+                "invalidations": self.invalidations,
+                "compute_seconds": round(self.compute_seconds, 6),
+                "saved_seconds": round(self.saved_seconds, 6),
+                "storage": self.backend.stats(),
+            }
+
+
+# Global instance - initialized in main.py; None disables result caching
+result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Get the global result cache, or None when caching is disabled."""
+    return result_cache
+
+
+async def cached_response(
+    route: str,
+    params: Optional[Mapping[str, Any]],
+    compute: Callable[[], BaseModel],
+    data_service,
+    vibe_engine,
+    echo: Optional[Mapping[str, Any]] = None,
+) -> Union[BaseModel, Response]:
+    """
+    Serve a route result through the global result cache.
+
+    ``compute`` runs on the compute pool (see :func:`run_compute`). It is
+    called directly when caching is disabled or ``params`` is None (the
+    request cannot be canonicalized). The cache version follows the data
+    service's snapshot and the vibe engine's dictionary fingerprint.
+    """
+    cache = get_result_cache()
+    if cache is None or params is None:
+        return await run_compute(compute)
+    cache.set_version(data_service.snapshot_id, vibe_engine.fingerprint)
+    return await cache.get_or_compute(
+        cache.make_key(route, params), compute, echo, run=run_compute
+    )
@@ -1,5 +1,6 @@
+import math
 import numpy as np
-from typing import Dict
+from typing import Dict, Tuple
 
 
 def score_low_is_better(value: float, min_val: float, max_val: float) -> float:
@@ -19,7 +20,7 @@ def score_low_is_better(value: float, min_val: float, max_val: float) -> float:
         return 100.0
 
     normalized = (value - min_val) / (max_val - min_val)
-    normalized = np.clip(normalized, 0, 1)
+    normalized = min(max(normalized, 0.0), 1.0)
     return (1 - normalized) * 100
 
 
@@ -40,7 +41,7 @@ def score_high_is_better(value: float, min_val: float, max_val: float) -> float:
         return 100.0
 
     normalized = (value - min_val) / (max_val - min_val)
-    normalized = np.clip(normalized, 0, 1)
+    normalized = min(max(normalized, 0.0), 1.0)
     return normalized * 100
 
 
@@ -76,7 +77,7 @@ def score_optimal_range(
         range_width = optimal_max - optimal_min
 
     # Apply exponential falloff
-    score = 100 * np.exp(-(distance / (range_width * falloff_rate)) ** 2)
+    score = 100 * math.exp(-(distance / (range_width * falloff_rate)) ** 2)
     return max(0.0, score)
 
 
@@ -104,3 +105,101 @@ def calculate_weighted_score(
     )
 
     return weighted_sum / total_weight
+
+
+def _normalize_array(values: np.ndarray, min_val, max_val):
+    """Clip ``(values - min) / (max - min)`` to [0, 1] and flag ``min == max``."""
+    values = np.asarray(values, dtype=np.float64)
+    span = np.asarray(max_val, dtype=np.float64) - np.asarray(min_val, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normalized = (values - min_val) / np.where(span == 0, np.nan, span)
+    return np.clip(normalized, 0.0, 1.0), span == 0
+
+
+def score_low_is_better_array(values: np.ndarray, min_val, max_val) -> np.ndarray:
+    """
+    Array version of :func:`score_low_is_better`.
+
+    ``min_val``/``max_val`` broadcast against ``values`` (e.g. one bound per
+    column of an ``(n_samples, n_params)`` block). NaN inputs stay NaN.
+    """
+    normalized, flat = _normalize_array(values, min_val, max_val)
+    return np.where(flat & ~np.isnan(values), 100.0, (1.0 - normalized) * 100.0)
+
+
+def score_high_is_better_array(values: np.ndarray, min_val, max_val) -> np.ndarray:
+    """Array version of :func:`score_high_is_better`. NaN inputs stay NaN."""
+    normalized, flat = _normalize_array(values, min_val, max_val)
+    return np.where(flat & ~np.isnan(values), 100.0, normalized * 100.0)
+
+
+def score_optimal_range_array(
+    values: np.ndarray, optimal_min, optimal_max, falloff_rate=2.0
+) -> np.ndarray:
+    """
+    Array version of :func:`score_optimal_range`. NaN inputs stay NaN.
+
+    A zero-width range scores 100 on the optimum and 0 elsewhere.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    distance = np.maximum(optimal_min - values, 0.0) + np.maximum(values - optimal_max, 0.0)
+    scale = (np.asarray(optimal_max, dtype=np.float64) - optimal_min) * falloff_rate
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = np.where(distance == 0, 0.0, distance / scale)
+    return np.where(np.isnan(values), np.nan, 100.0 * np.exp(-(ratio ** 2)))
+
+
+def calculate_weighted_scores(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Row-wise weighted average of a ``(n_samples, n_params)`` score block.
+
+    NaN scores are masked out and the remaining weights renormalized per
+    row, matching :func:`calculate_weighted_score` with missing parameters
+    left out. Rows without any valid score get 0. Leading dimensions
+    broadcast, so ``(n_vibes, n_samples, n_params)`` scores with
+    ``(n_vibes, 1, n_params)`` weights give ``(n_vibes, n_samples)``.
+
+    Returns:
+        Array of n_samples scores from 0-100
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    valid = ~np.isnan(scores)
+    row_weights = np.where(valid, weights, 0.0)
+    total = row_weights.sum(axis=-1)
+    weighted = (np.where(valid, scores, 0.0) * row_weights).sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, weighted / total, 0.0)
+
+
+def score_trends(
+    years: np.ndarray, scores: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-column mean, spread and least-squares trend of yearly scores.
+
+    Args:
+        years: Array of n_years years (the x axis)
+        scores: Array of shape (n_years, n_series); NaN marks a missing year
+
+    Returns:
+        Tuple of (mean, standard deviation, slope in score points per year,
+        number of valid years), each of length n_series. Statistics are NaN
+        for columns without data, and the slope needs at least two years.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    x = np.asarray(years, dtype=np.float64).reshape(-1, 1)
+    valid = ~np.isnan(scores)
+    counts = valid.sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, scores, 0.0).sum(axis=0) / counts
+        x_mean = np.where(valid, x, 0.0).sum(axis=0) / counts
+        dx = np.where(valid, x - x_mean, 0.0)
+        dy = np.where(valid, scores - mean, 0.0)
+        std = np.sqrt((dy ** 2).sum(axis=0) / counts)
+        slope = (dx * dy).sum(axis=0) / (dx ** 2).sum(axis=0)
+
+    mean = np.where(counts > 0, mean, np.nan)
+    std = np.where(counts > 0, std, np.nan)
+    slope = np.where(counts > 1, slope, np.nan)
+    return mean, std, slope, counts
@@ -0,0 +1,103 @@
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+import threading
+
+T = TypeVar("T")
+
+
+class _FlightStats:
+    """Counters shared by the thread and asyncio single-flight groups."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def _count(self, leader: bool):
+        self.calls += 1
+        if leader:
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+class SingleFlight(_FlightStats):
+    """
+    Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs ``fn``; callers arriving while it runs
+    block and receive the same result (or exception) instead of repeating
+    the work. Nothing is remembered once the call completes, so callers
+    should re-check their cache inside ``fn``. Safe across threads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+            self._count(leader)
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+class AsyncSingleFlight(_FlightStats):
+    """
+    :class:`SingleFlight` for coroutines on one event loop.
+
+    The shared work runs as its own task, so a caller that is cancelled
+    (e.g. its client disconnected) does not cancel it for the others.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        with self._lock:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        with self._lock:
+            task = self._in_flight.get(key)
+            leader = task is None
+            if leader:
+                task = asyncio.ensure_future(fn())
+                self._in_flight[key] = task
+                task.add_done_callback(lambda t: self._finish(key, t))
+            self._count(leader)
+        return await asyncio.shield(task)
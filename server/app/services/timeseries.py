@@ -0,0 +1,301 @@
+from dataclasses import dataclass, field
+import copy
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+import json
+import numpy as np
+
+# NASA POWER marks missing observations with this sentinel
+FILL_VALUE = -999.0
+
+
+def parse_date_keys(keys: Iterable[str]) -> np.ndarray:
+    """Convert POWER ``YYYYMMDD`` keys into a ``datetime64[D]`` array."""
+    return np.array(
+        [f"{key[:4]}-{key[4:6]}-{key[6:8]}" for key in keys], dtype="datetime64[D]"
+    )
+
+
+def read_power_coordinates(path: Path, chunk_size: int = 4096) -> Tuple[float, float]:
+    """
+    Read ``(lat, lon)`` from a POWER point JSON file without parsing it all.
+
+    POWER writes ``geometry`` before the (large) ``properties`` block, so the
+    file is read in chunks only until the geometry object can be decoded.
+    Falls back to a full parse if the key is not found near the start.
+
+    Args:
+        path: Raw POWER point JSON file
+        chunk_size: Bytes to read per step
+
+    Returns:
+        Tuple of (lat, lon)
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    with open(path, "r") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buffer += chunk
+            key = buffer.find('"geometry"')
+            if key >= 0:
+                colon = buffer.find(":", key + len('"geometry"'))
+                if colon >= 0:
+                    try:
+                        geometry, _ = decoder.raw_decode(buffer[colon + 1 :].lstrip())
+                        lon, lat = geometry["coordinates"][:2]
+                        return lat, lon
+                    except ValueError:
+                        pass  # geometry object not complete yet
+            if not chunk or len(buffer) > 16 * chunk_size:
+                break
+
+    with open(path, "r") as f:
+        lon, lat = json.load(f)["geometry"]["coordinates"][:2]
+    return lat, lon
+
+
+def to_datetime64(value: Optional[datetime]) -> Optional[np.datetime64]:
+    """Convert an optional ``datetime`` into a day-resolution ``datetime64``."""
+    if value is None:
+        return None
+    return np.datetime64(value.date(), "D")
+
+
+def calendar_day_keys(dates: np.ndarray) -> np.ndarray:
+    """
+    Map ``datetime64[D]`` dates to a calendar-day key in ``0..371``.
+
+    The key is ``(month - 1) * 31 + (day - 1)``, so the same calendar day
+    gets the same key in every year regardless of leap days.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    month_start = dates.astype("datetime64[M]")
+    months = month_start.astype(np.int64) % 12
+    days = (dates - month_start.astype("datetime64[D]")).astype(np.int64)
+    return months * 31 + days
+
+
+def reduce_columns(block: np.ndarray, how: str = "mean") -> np.ndarray:
+    """
+    Column-wise reduction of a ``(n_days, n_params)`` block, skipping NaN.
+
+    Args:
+        block: Daily values, one column per parameter
+        how: One of "mean", "nanmean", "sum", "min" or "max"
+
+    Returns:
+        Array of length n_params, NaN where a column has no valid values
+    """
+    valid = ~np.isnan(block)
+    counts = valid.sum(axis=0)
+    if how in ("mean", "nanmean"):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = np.where(valid, block, 0.0).sum(axis=0) / counts
+    elif how == "sum":
+        result = np.where(valid, block, 0.0).sum(axis=0)
+    elif how == "min":
+        result = np.where(valid, block, np.inf).min(axis=0, initial=np.inf)
+    elif how == "max":
+        result = np.where(valid, block, -np.inf).max(axis=0, initial=-np.inf)
+    else:
+        raise ValueError(f"Unknown reduction: {how}")
+    return np.where(counts > 0, result, np.nan)
+
+
+@dataclass(frozen=True)
+class TimeSpec:
+    """
+    Time selection for an aggregation.
+
+    A month (optionally with a year) selects that calendar month; otherwise
+    ``start_date``/``end_date`` select an inclusive range. With neither, the
+    whole record is used.
+    """
+
+    month: Optional[int] = None
+    year: Optional[int] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+@dataclass
+class LocationSeries:
+    """
+    Columnar daily time series for a single point location.
+
+    ``dates`` is a sorted ``datetime64[D]`` index shared by every column, and
+    each column is a contiguous float array aligned to it. POWER fill values
+    are stored as NaN.
+    """
+
+    lat: float
+    lon: float
+    dates: np.ndarray
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    # Calendar index arrays derived from ``dates`` once, used as filter masks
+    years: np.ndarray = field(init=False, repr=False)
+    months: np.ndarray = field(init=False, repr=False)
+    day_of_year: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        month_index = self.dates.astype("datetime64[M]").astype(np.int64)
+        self.years = (month_index // 12 + 1970).astype(np.int16)
+        self.months = (month_index % 12 + 1).astype(np.int8)
+        self.day_of_year = (
+            (self.dates - self.dates.astype("datetime64[Y]")).astype(np.int16) + 1
+        )
+
+    @classmethod
+    def from_power_payloads(
+        cls, payloads: Iterable[Mapping], lat: float, lon: float
+    ) -> "LocationSeries":
+        """
+        Build a series from one or more raw POWER point JSON payloads.
+
+        Args:
+            payloads: Parsed POWER JSON documents for the same location
+            lat: Latitude of the location
+            lon: Longitude of the location
+
+        Returns:
+            LocationSeries with all parameters aligned on a single date index
+        """
+        merged: Dict[str, Dict[str, float]] = {}
+        for payload in payloads:
+            parameters = payload["properties"]["parameter"]
+            for param_name, param_values in parameters.items():
+                merged.setdefault(param_name, {}).update(param_values)
+
+        date_keys: List[str] = sorted(
+            {key for series in merged.values() for key in series.keys()}
+        )
+        dates = parse_date_keys(date_keys)
+
+        columns = {}
+        for param_name, series in merged.items():
+            values = np.fromiter(
+                (series.get(key, np.nan) for key in date_keys),
+                dtype=np.float64,
+                count=len(date_keys),
+            )
+            values[values == FILL_VALUE] = np.nan
+            columns[param_name] = values
+
+        return cls(lat=lat, lon=lon, dates=dates, columns=columns)
+
+    def with_columns(self, columns: Mapping[str, np.ndarray]) -> "LocationSeries":
+        """
+        Series sharing this date index and calendar arrays but holding ``columns``.
+
+        Lets callers cache the index once and attach columns as they are
+        loaded, without recomputing the calendar arrays.
+        """
+        view = copy.copy(self)
+        view.columns = dict(columns)
+        return view
+
+    @property
+    def parameters(self) -> List[str]:
+        """Parameter IDs available in this series."""
+        return list(self.columns.keys())
+
+    @property
+    def min_date(self) -> Optional[datetime]:
+        """First date in the index, or None for an empty series."""
+        if len(self.dates) == 0:
+            return None
+        return self.dates[0].astype("datetime64[s]").astype(datetime)
+
+    @property
+    def max_date(self) -> Optional[datetime]:
+        """Last date in the index, or None for an empty series."""
+        if len(self.dates) == 0:
+            return None
+        return self.dates[-1].astype("datetime64[s]").astype(datetime)
+
+    def range_slice(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> slice:
+        """Index slice covering ``start_date``..``end_date`` inclusive."""
+        lo = 0
+        hi = len(self.dates)
+        if start_date:
+            lo = int(np.searchsorted(self.dates, to_datetime64(start_date), side="left"))
+        if end_date:
+            hi = int(np.searchsorted(self.dates, to_datetime64(end_date), side="right"))
+        return slice(lo, max(lo, hi))
+
+    def time_mask(
+        self,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """
+        Boolean mask over the index selecting the requested days.
+
+        Args:
+            month: Optional month filter (1-12)
+            year: Optional year filter
+            start_date: Optional inclusive lower bound
+            end_date: Optional inclusive upper bound
+
+        Returns:
+            Boolean array aligned to ``dates``
+        """
+        mask = np.zeros(len(self.dates), dtype=bool)
+        mask[self.range_slice(start_date, end_date)] = True
+        if month is not None:
+            mask &= self.months == month
+        if year is not None:
+            mask &= self.years == year
+        return mask
+
+    def column(self, parameter_id: str) -> Optional[np.ndarray]:
+        """Return the value array for a parameter, or None if unavailable."""
+        return self.columns.get(parameter_id)
+
+    def block(self, parameter_ids: List[str], selection=slice(None)) -> np.ndarray:
+        """
+        Stack the selected rows of several columns into ``(n_days, n_params)``.
+
+        Unavailable parameters produce an all-NaN column.
+        """
+        n_rows = len(self.dates[selection])
+        block = np.full((n_rows, len(parameter_ids)), np.nan)
+        for i, parameter_id in enumerate(parameter_ids):
+            values = self.columns.get(parameter_id)
+            if values is not None:
+                block[:, i] = values[selection]
+        return block
+
+    def calendar_day_means(self, parameter_ids: List[str]) -> np.ndarray:
+        """
+        Mean of each parameter per calendar day across all years.
+
+        Returns:
+            Array of shape (372, len(parameter_ids)) indexed by
+            :func:`calendar_day_keys`, NaN where a day has no valid values
+        """
+        keys = calendar_day_keys(self.dates)
+        block = self.block(parameter_ids)
+        valid = ~np.isnan(block)
+        means = np.full((372, len(parameter_ids)), np.nan)
+        for i in range(len(parameter_ids)):
+            counts = np.bincount(keys[valid[:, i]], minlength=372)
+            sums = np.bincount(keys[valid[:, i]], block[valid[:, i], i], minlength=372)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means[:, i] = np.where(counts > 0, sums / counts, np.nan)
+        return means
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the index, calendar arrays and columns."""
+        index_bytes = (
+            self.dates.nbytes + self.years.nbytes + self.months.nbytes + self.day_of_year.nbytes
+        )
+        return int(index_bytes + sum(c.nbytes for c in self.columns.values()))
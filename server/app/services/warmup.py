@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.core.vibe_engine import VibeEngine
+from app.services.data_service import DataService
+
+logger = logging.getLogger(__name__)
+
+WARMUP_MODES = ("off", "vibes", "all")
+
+
+class WarmupState:
+    """Progress of the startup warm-up, reported by the readiness endpoint."""
+
+    def __init__(self):
+        self.status = "pending"
+        self.mode: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.summary: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "complete"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "summary": self.summary,
+            "error": self.error,
+        }
+
+
+def vibe_parameters(vibe_engine: VibeEngine) -> List[str]:
+    """Union of the parameters referenced by every vibe and advisor."""
+    parameters = set()
+    for vibe_id in vibe_engine.vibes:
+        parameters.update(vibe_engine.get_required_parameters(vibe_id))
+    return sorted(parameters)
+
+
+def run_warmup(
+    state: WarmupState,
+    data_service: DataService,
+    vibe_engine: VibeEngine,
+    mode: str = "vibes",
+    locations: Optional[List[str]] = None,
+) -> WarmupState:
+    """
+    Preload data according to ``mode`` and record the outcome in ``state``.
+
+    Args:
+        state: State object to update
+        data_service: Initialized data service
+        vibe_engine: Initialized vibe engine
+        mode: "off" (nothing), "vibes" (parameters used by the vibe
+            dictionary) or "all" (every parameter)
+        locations: Locations to preload (default: all)
+
+    Returns:
+        The updated state
+    """
+    if mode not in WARMUP_MODES:
+        raise ValueError(f"Unknown warm-up mode '{mode}'. Expected one of {WARMUP_MODES}")
+
+    state.mode = mode
+    state.status = "running"
+    state.started_at = datetime.utcnow()
+    try:
+        if mode != "off":
+            parameter_ids = vibe_parameters(vibe_engine) if mode == "vibes" else None
+            state.summary = data_service.warm_up(locations or None, parameter_ids)
+        state.status = "complete"
+    except Exception as e:
+        logger.error(f"Warm-up failed: {e}")
+        state.status = "failed"
+        state.error = str(e)
+    finally:
+        state.finished_at = datetime.utcnow()
+    return state
+
+
+# Global instance - updated from main.py
+warmup_state = WarmupState()
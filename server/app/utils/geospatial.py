@@ -1,49 +1,61 @@
 import math
-from typing import List, Tuple
+from typing import List, Sequence, Tuple, Union
+import numpy as np
+
+# Radius of earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
 
 
 def haversine_distance(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float
-) -> float:
+    lat1: ArrayLike,
+    lon1: ArrayLike,
+    lat2: ArrayLike,
+    lon2: ArrayLike
+) -> Union[float, np.ndarray]:
     """
-    Calculate the great circle distance between two points
+    Calculate the great circle distance between points
     on the earth (specified in decimal degrees).
 
+    Inputs broadcast against each other, so one point can be compared with
+    many, or an (n, 1) column with a (1, m) row to get an (n, m) matrix.
+
     Args:
-        lat1: Latitude of first point
-        lon1: Longitude of first point
-        lat2: Latitude of second point
-        lon2: Longitude of second point
+        lat1: Latitude(s) of first point(s)
+        lon1: Longitude(s) of first point(s)
+        lat2: Latitude(s) of second point(s)
+        lon2: Longitude(s) of second point(s)
 
     Returns:
-        Distance in kilometers
+        Distance in kilometers (a float for scalar inputs)
     """
     # Convert decimal degrees to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(x, dtype=np.float64)) for x in (lat1, lon1, lat2, lon2)
+    )
 
     # Haversine formula
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
-
-    # Radius of earth in kilometers
-    r = 6371
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
 
-    return c * r
+    distance = c * EARTH_RADIUS_KM
+    return float(distance) if distance.ndim == 0 else distance
 
 
-def generate_grid_points(
+def generate_grid(
     center_lat: float,
     center_lon: float,
     radius_km: float,
     resolution_km: float
-) -> List[Tuple[float, float]]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Generate a grid of points within a radius.
+    Generate a grid of points within a radius as arrays.
+
+    The lattice is built with ``meshgrid`` from integer steps (so there is
+    no accumulated drift) and masked by great-circle distance.
 
     Args:
         center_lat: Center latitude
@@ -52,33 +64,45 @@ def generate_grid_points(
         resolution_km: Grid resolution in kilometers
 
     Returns:
-        List of (lat, lon) tuples representing grid points
+        Tuple of (lats, lons) arrays of the grid points
     """
-    points = []
-
     # Convert km to approximate degrees
     # (rough approximation: 1 degree ≈ 111 km at equator)
     lat_deg_per_km = 1 / 111.0
     lon_deg_per_km = 1 / (111.0 * math.cos(math.radians(center_lat)))
 
-    radius_lat = radius_km * lat_deg_per_km
-    radius_lon = radius_km * lon_deg_per_km
-    resolution_lat = resolution_km * lat_deg_per_km
-    resolution_lon = resolution_km * lon_deg_per_km
-
-    # Generate grid
-    lat = center_lat - radius_lat
-    while lat <= center_lat + radius_lat:
-        lon = center_lon - radius_lon
-        while lon <= center_lon + radius_lon:
-            # Check if point is within radius
-            distance = haversine_distance(center_lat, center_lon, lat, lon)
-            if distance <= radius_km:
-                points.append((lat, lon))
-            lon += resolution_lon
-        lat += resolution_lat
-
-    return points
+    n_steps = int(math.floor(2 * radius_km / resolution_km + 1e-9)) + 1
+    steps = np.arange(n_steps) * resolution_km - radius_km
+    lat_grid, lon_grid = np.meshgrid(
+        center_lat + steps * lat_deg_per_km,
+        center_lon + steps * lon_deg_per_km,
+        indexing="ij",
+    )
+
+    inside = haversine_distance(center_lat, center_lon, lat_grid, lon_grid) <= radius_km
+    return lat_grid[inside], lon_grid[inside]
+
+
+def generate_grid_points(
+    center_lat: float,
+    center_lon: float,
+    radius_km: float,
+    resolution_km: float
+) -> List[Tuple[float, float]]:
+    """
+    Generate a grid of points within a radius.
+
+    Args:
+        center_lat: Center latitude
+        center_lon: Center longitude
+        radius_km: Search radius in kilometers
+        resolution_km: Grid resolution in kilometers
+
+    Returns:
+        List of (lat, lon) tuples representing grid points
+    """
+    lats, lons = generate_grid(center_lat, center_lon, radius_km, resolution_km)
+    return list(zip(lats.tolist(), lons.tolist()))
 
 
 def lat_lon_to_pixel(
@@ -0,0 +1,112 @@
+from typing import List, Sequence, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+
+from app.utils.geospatial import EARTH_RADIUS_KM, ArrayLike
+
+
+def to_unit_vectors(lat: ArrayLike, lon: ArrayLike) -> np.ndarray:
+    """
+    Convert latitude/longitude in degrees to 3D unit vectors.
+
+    Args:
+        lat: Latitude(s) in degrees
+        lon: Longitude(s) in degrees
+
+    Returns:
+        Array of shape (n, 3)
+    """
+    lat_rad = np.radians(np.atleast_1d(np.asarray(lat, dtype=np.float64)))
+    lon_rad = np.radians(np.atleast_1d(np.asarray(lon, dtype=np.float64)))
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack(
+        (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad))
+    )
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """Convert unit-sphere chord length to great-circle distance in km."""
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2.0, 0.0, 1.0))
+
+
+def km_to_chord(distance_km: float) -> float:
+    """Convert great-circle distance in km to unit-sphere chord length."""
+    angle = min(distance_km / EARTH_RADIUS_KM, np.pi)
+    return float(2.0 * np.sin(angle / 2.0))
+
+
+class SpatialIndex:
+    """
+    Nearest-neighbour and radius index over point locations.
+
+    Points are embedded on the unit sphere, so Euclidean chord distance is
+    monotonic in great-circle distance, and a KD-tree answers both query
+    kinds.
+    """
+
+    def __init__(self, names: Sequence[str], lats: ArrayLike, lons: ArrayLike):
+        self.names: List[str] = list(names)
+        self.lats = np.asarray(lats, dtype=np.float64).reshape(-1)
+        self.lons = np.asarray(lons, dtype=np.float64).reshape(-1)
+        self._vectors = to_unit_vectors(self.lats, self.lons) if self.names else np.zeros((0, 3))
+        self._tree = cKDTree(self._vectors) if self.names else None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def nearest(
+        self, lat: ArrayLike, lon: ArrayLike, k: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest indexed points for one or many query points.
+
+        Args:
+            lat: Query latitude(s) in degrees
+            lon: Query longitude(s) in degrees
+            k: Number of neighbours per query
+
+        Returns:
+            Tuple of (distances_km, indices), each of shape (n_queries, k).
+            Rows are sorted nearest first.
+        """
+        queries = to_unit_vectors(lat, lon)
+        k = min(k, len(self.names))
+        if k == 0:
+            empty = np.zeros((len(queries), 0))
+            return empty, empty.astype(np.int64)
+
+        chord, idx = self._tree.query(queries, k=k)
+        chord = np.asarray(chord).reshape(len(queries), k)
+        idx = np.asarray(idx).reshape(len(queries), k)
+        return chord_to_km(chord), idx.astype(np.int64)
+
+    def within_radius(
+        self, lat: ArrayLike, lon: ArrayLike, radius_km: float
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find all indexed points within a great-circle radius.
+
+        Args:
+            lat: Query latitude(s) in degrees
+            lon: Query longitude(s) in degrees
+            radius_km: Search radius in kilometers
+
+        Returns:
+            One (indices, distances_km) pair per query, sorted nearest first
+        """
+        queries = to_unit_vectors(lat, lon)
+        if not self.names:
+            return [(np.zeros(0, dtype=np.int64), np.zeros(0)) for _ in queries]
+
+        hits = self._tree.query_ball_point(queries, r=km_to_chord(radius_km))
+        results = []
+        for query, idx in zip(queries, hits):
+            idx = np.asarray(idx, dtype=np.int64)
+            chord = np.linalg.norm(self._vectors[idx] - query, axis=1)
+            results.append(self._sorted(idx, chord))
+        return results
+
+    @staticmethod
+    def _sorted(idx: np.ndarray, chord: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(chord, kind="stable")
+        return idx[order], chord_to_km(chord[order])
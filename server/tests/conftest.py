@@ -0,0 +1,62 @@
+"""
+Shared fixtures: a tiny NASA POWER-style point dataset on disk.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+
+def _power_payload(lat, lon, start, days, values_by_param):
+    """Build a minimal POWER point JSON payload."""
+    dates = [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(days)]
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat, 900.0]},
+        "properties": {
+            "parameter": {
+                param: {date: fn(i) for i, date in enumerate(dates)}
+                for param, fn in values_by_param.items()
+            }
+        },
+        "header": {"fill_value": -999.0},
+    }
+
+
+@pytest.fixture
+def power_payload():
+    """The POWER payload builder, for tests that assemble their own series."""
+    return _power_payload
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Two point locations, each split across two yearly files."""
+    locations = {
+        "alpha": (12.0, 77.0, 10.0),
+        "beta": (13.0, 78.0, 20.0),
+    }
+    for name, (lat, lon, base) in locations.items():
+        raw_dir = tmp_path / "outputs" / f"{name}_point" / "raw"
+        raw_dir.mkdir(parents=True)
+        for year in (2020, 2021):
+            start = datetime(year, 1, 1)
+            days = (datetime(year + 1, 1, 1) - start).days
+            payload = _power_payload(
+                lat,
+                lon,
+                start,
+                days,
+                {
+                    # Month-dependent value so monthly means are easy to check
+                    "T2M": lambda i, s=start, b=base, y=year: b
+                    + (s + timedelta(days=i)).month
+                    + (y - 2020),
+                    # Every 10th day is missing
+                    "PRECTOTCORR": lambda i: -999.0 if i % 10 == 0 else 2.0,
+                },
+            )
+            path = raw_dir / f"{name}_point__{year}-{year}__20250101T000000Z.json"
+            path.write_text(json.dumps(payload))
+    return tmp_path
@@ -0,0 +1,71 @@
+"""
+Unit tests for the bounded compute pool.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.compute_pool import ComputePool, ComputeTimeoutError, PoolSaturatedError
+
+
+class TestComputePool:
+    """Test cases for the bounded compute pool."""
+
+    def test_runs_off_the_event_loop(self):
+        pool = ComputePool(max_workers=2)
+
+        async def main():
+            return await pool.run(threading.get_ident), threading.get_ident()
+
+        worker, loop = asyncio.run(main())
+        assert worker != loop
+        assert pool.stats()["completed"] == 1
+        pool.shutdown()
+
+    def test_rejects_when_saturated(self):
+        pool = ComputePool(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def main():
+            running = asyncio.ensure_future(pool.run(release.wait))
+            queued = asyncio.ensure_future(pool.run(release.wait))
+            await asyncio.sleep(0)
+            with pytest.raises(PoolSaturatedError):
+                await pool.run(release.wait)
+            release.set()
+            return await asyncio.gather(running, queued)
+
+        assert asyncio.run(main()) == [True, True]
+        stats = pool.stats()
+        assert stats["rejected"] == 1 and stats["completed"] == 2
+        assert stats["running"] == 0 and stats["queued"] == 0
+        pool.shutdown()
+
+    def test_timeout_keeps_slot_until_job_finishes(self):
+        pool = ComputePool(max_workers=1, max_queue=0, timeout_seconds=0.05)
+        release = threading.Event()
+
+        async def main():
+            with pytest.raises(ComputeTimeoutError):
+                await pool.run(release.wait)
+            # The timed-out job still occupies the only worker
+            with pytest.raises(PoolSaturatedError):
+                await pool.run(release.wait)
+
+        asyncio.run(main())
+        release.set()
+        pool.shutdown(wait=True)
+        assert pool.stats()["timeouts"] == 1 and pool.in_flight == 0
+
+    def test_exceptions_propagate(self):
+        pool = ComputePool(max_workers=1)
+
+        def fail():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            asyncio.run(pool.run(fail))
+        assert pool.stats()["failed"] == 1
+        pool.shutdown()
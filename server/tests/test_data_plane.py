@@ -0,0 +1,53 @@
+"""
+Unit tests for published, memory-mapped data snapshots.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.services.data_plane import list_generations, read_current
+from app.services.data_service import DataService
+
+
+class TestDataPlane:
+    """Test cases for published, memory-mapped data snapshots."""
+
+    def test_attached_service_maps_published_data(self, data_dir, tmp_path):
+        root = tmp_path / "snapshots"
+        source = DataService(str(data_dir))
+        generation = source.publish_snapshot(root)
+
+        attached = DataService(str(data_dir), snapshot_root=str(root))
+
+        assert read_current(root) == generation == attached.generation
+        assert attached.snapshot_id == source.snapshot_id
+        assert isinstance(attached.climatology.sums, np.memmap)
+        series = attached._load_location_data("alpha", ["T2M"])
+        assert isinstance(series.column("T2M"), np.memmap)
+        assert attached.get_value_at_point("T2M", 12.0, 77.0, 7, 2021) == pytest.approx(18.0)
+        assert attached.get_daily_matrix(
+            ["T2M"], 13.0, 78.0, datetime(2020, 3, 1), datetime(2020, 3, 2)
+        )[1][:, 0] == pytest.approx([23.0, 23.0])
+
+    def test_republish_swaps_pointer_and_prunes(self, data_dir, tmp_path):
+        root = tmp_path / "snapshots"
+        source = DataService(str(data_dir))
+        first = source.publish_snapshot(root, keep=2)
+        old = DataService(str(data_dir), snapshot_root=str(root))
+        second = source.publish_snapshot(root, keep=2)
+        third = source.publish_snapshot(root, keep=2)
+
+        assert read_current(root) == third
+        assert list_generations(root) == [second, third]
+        assert DataService(str(data_dir), snapshot_root=str(root)).generation == third
+        # Already-mapped data of a pruned generation stays readable
+        assert old.generation == first
+        assert old.get_value_at_point("T2M", 12.0, 77.0, 7) == pytest.approx(17.5)
+
+    def test_falls_back_to_raw_data_without_snapshot(self, data_dir, tmp_path):
+        service = DataService(str(data_dir), snapshot_root=str(tmp_path / "missing"))
+
+        assert service.generation is None
+        assert set(service.locations_cache) == {"alpha", "beta"}
@@ -0,0 +1,635 @@
+"""
+Unit tests for the DataService columnar time-series store.
+
+Builds a tiny NASA POWER-style point dataset on disk and checks that
+aggregations over the columnar layout behave like the original dict walk.
+"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.core.scoring_plan import compile_scoring_plan
+from app.services.data_service import DataService
+from app.services.binary_store import write_compiled_series
+from app.services.cache import LRUCache
+from app.services.climatology import ClimatologyCube
+from app.services.timeseries import (
+    LocationSeries,
+    TimeSpec,
+    calendar_day_keys,
+    read_power_coordinates,
+    reduce_columns,
+)
+
+
+class TestLocationSeries:
+    """Test cases for building the columnar series."""
+
+    def test_from_payloads_merges_files_and_sorts_dates(self, power_payload):
+        later = power_payload(1.0, 2.0, datetime(2021, 1, 1), 3, {"T2M": lambda i: i})
+        earlier = power_payload(1.0, 2.0, datetime(2020, 1, 1), 3, {"T2M": lambda i: -999.0})
+
+        series = LocationSeries.from_power_payloads([later, earlier], 1.0, 2.0)
+
+        assert series.dates.dtype == np.dtype("datetime64[D]")
+        assert len(series.dates) == 6
+        assert np.all(np.diff(series.dates.astype(np.int64)) > 0)
+        assert np.isnan(series.column("T2M")[:3]).all()
+        assert series.column("T2M")[3:].tolist() == [0.0, 1.0, 2.0]
+        assert series.min_date == datetime(2020, 1, 1)
+        assert series.max_date == datetime(2021, 1, 3)
+
+    def test_calendar_index_arrays(self, power_payload):
+        payload = power_payload(1.0, 2.0, datetime(2020, 12, 30), 4, {"T2M": lambda i: i})
+
+        series = LocationSeries.from_power_payloads([payload], 1.0, 2.0)
+
+        assert series.years.tolist() == [2020, 2020, 2021, 2021]
+        assert series.months.tolist() == [12, 12, 1, 1]
+        assert series.day_of_year.tolist() == [365, 366, 1, 2]
+
+    def test_time_mask_combines_filters(self, power_payload):
+        payload = power_payload(1.0, 2.0, datetime(2020, 1, 1), 400, {"T2M": lambda i: i})
+        series = LocationSeries.from_power_payloads([payload], 1.0, 2.0)
+
+        mask = series.time_mask(month=1, start_date=datetime(2020, 1, 20))
+
+        selected = series.dates[mask]
+        assert len(selected) == 12 + 31
+        assert selected[0] == np.datetime64("2020-01-20")
+        assert selected[-1] == np.datetime64("2021-01-31")
+
+    @pytest.mark.parametrize(
+        "how,expected", [("mean", 2.0), ("sum", 6.0), ("min", 1.0), ("max", 3.0)]
+    )
+    def test_reduce_columns_skips_nan(self, how, expected):
+        block = np.array([[1.0], [np.nan], [2.0], [3.0]])
+
+        assert reduce_columns(block, how)[0] == pytest.approx(expected)
+
+    def test_reduce_columns_all_missing(self):
+        block = np.array([[np.nan], [np.nan]])
+
+        assert np.isnan(reduce_columns(block, "sum")[0])
+
+    def test_reduce_columns(self):
+        block = np.array([[1.0, np.nan], [3.0, np.nan], [np.nan, np.nan]])
+
+        result = reduce_columns(block)
+
+        assert result[0] == pytest.approx(2.0)
+        assert np.isnan(result[1])
+
+
+class TestDataService:
+    """Test cases for DataService aggregations."""
+
+    def test_locations_discovered(self, data_dir):
+        service = DataService(str(data_dir))
+
+        names = {loc["name"] for loc in service.get_available_locations()}
+        assert names == {"alpha", "beta"}
+
+    def test_monthly_value_with_year(self, data_dir):
+        service = DataService(str(data_dir))
+
+        assert service.get_value_at_point("T2M", 12.0, 77.0, 7, 2021) == pytest.approx(18.0)
+
+    def test_monthly_value_all_years(self, data_dir):
+        service = DataService(str(data_dir))
+
+        assert service.get_value_at_point("T2M", 13.0, 78.0, 3) == pytest.approx(23.5)
+
+    def test_year_out_of_range_falls_back_to_all_years(self, data_dir):
+        service = DataService(str(data_dir))
+
+        assert service.get_value_at_point("T2M", 12.0, 77.0, 3, 1999) == pytest.approx(13.5)
+
+    def test_fill_values_are_ignored(self, data_dir):
+        service = DataService(str(data_dir))
+
+        assert service.get_value_at_point("PRECTOTCORR", 12.0, 77.0, 5) == pytest.approx(2.0)
+
+    def test_date_range_clamped_to_available_data(self, data_dir):
+        service = DataService(str(data_dir))
+
+        value = service.get_value_at_point(
+            "T2M",
+            12.0,
+            77.0,
+            start_date=datetime(2021, 12, 15),
+            end_date=datetime(2030, 1, 1),
+        )
+        assert value == pytest.approx(23.0)
+
+    def test_unknown_parameter_returns_none(self, data_dir):
+        service = DataService(str(data_dir))
+
+        assert service.get_value_at_point("WS2M", 12.0, 77.0, 1) is None
+
+    def test_get_all_parameters_skips_missing(self, data_dir):
+        service = DataService(str(data_dir))
+
+        values = service.get_all_parameters(["T2M", "WS2M"], 12.0, 77.0, 1, 2020)
+        assert values == {"T2M": pytest.approx(11.0)}
+
+
+class TestParameterMatrix:
+    """Test cases for the batched multi-parameter lookup."""
+
+    @pytest.mark.parametrize("precompute", [True, False])
+    def test_matrix_matches_single_lookups(self, data_dir, precompute):
+        service = DataService(str(data_dir), precompute_climatology=precompute)
+        params = ["T2M", "PRECTOTCORR", "WS2M"]
+        specs = [
+            TimeSpec(month=2, year=2021),
+            TimeSpec(month=11),
+            TimeSpec(start_date=datetime(2020, 3, 1), end_date=datetime(2020, 4, 30)),
+            TimeSpec(),
+        ]
+
+        matrix = service.get_parameter_matrix(params, 12.1, 77.1, specs)
+
+        assert matrix.shape == (4, 3)
+        for row, spec in enumerate(specs):
+            for col, param in enumerate(params):
+                expected = service.get_value_at_point(
+                    param, 12.0, 77.0, spec.month, spec.year, spec.start_date, spec.end_date
+                )
+                if expected is None:
+                    assert np.isnan(matrix[row, col])
+                else:
+                    assert matrix[row, col] == pytest.approx(expected)
+
+    def test_radius_matrix(self, data_dir):
+        service = DataService(str(data_dir))
+
+        coords, matrix = service.get_radius_matrix(
+            ["T2M"], 12.0, 77.0, 200.0, TimeSpec(month=1, year=2020)
+        )
+
+        assert coords == [(12.0, 77.0), (13.0, 78.0)]
+        assert matrix[:, 0] == pytest.approx([11.0, 21.0])
+
+
+class TestClimatologyCube:
+    """Test cases for the precomputed monthly climatology cube."""
+
+    def test_cube_matches_daily_series(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+        series = service._load_location_data("alpha")
+        cube = ClimatologyCube.build({"alpha": series})
+
+        for month in (1, 6, 12):
+            for year in (None, 2020, 2021):
+                mask = series.time_mask(month=month, year=year)
+                expected = np.nanmean(series.column("PRECTOTCORR")[mask])
+                assert cube.mean("alpha", "PRECTOTCORR", month, year) == pytest.approx(expected)
+
+    def test_declared_aggregation(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+        series = service._load_location_data("alpha")
+        cube = ClimatologyCube.build(
+            {"alpha": series}, {"PRECTOTCORR": "sum", "T2M": "max"}
+        )
+
+        # January 2020: 31 days, days 0, 10, 20 and 30 missing
+        assert cube.aggregate("alpha", "PRECTOTCORR", 1, 2020) == pytest.approx(27 * 2.0)
+        assert cube.aggregate("alpha", "T2M", 1) == pytest.approx(12.0)
+
+    def test_service_uses_cube_and_skips_series(self, data_dir):
+        service = DataService(str(data_dir))
+        service.cache.clear()
+
+        assert service.get_value_at_point("T2M", 12.0, 77.0, 7, 2021) == pytest.approx(18.0)
+        assert len(service.cache) == 0
+
+    def test_month_means_match_per_month_lookups(self, data_dir):
+        service = DataService(str(data_dir))
+
+        for year in (None, 2021):
+            expected = {
+                month: service.get_value_at_point("T2M", 12.0, 77.0, month, year)
+                for month in range(1, 13)
+            }
+            assert service.get_monthly_values("T2M", 12.0, 77.0, year) == pytest.approx(expected)
+        assert service.get_monthly_values("T2M", 12.0, 77.0)[7] == pytest.approx(17.5)
+
+    def test_monthly_values_without_cube(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+
+        values = service.get_monthly_values("PRECTOTCORR", 13.0, 78.0, 2020)
+
+        assert sorted(values) == list(range(1, 13))
+        assert values[2] == pytest.approx(2.0)
+
+    @pytest.mark.parametrize("precompute", [True, False])
+    def test_service_monthly_aggregate_uses_declared_aggregation(self, data_dir, precompute):
+        config = data_dir / "config"
+        config.mkdir()
+        (config / "power_parameters.yml").write_text(
+            "parameters:\n"
+            "  - id: T2M\n    aggregation: max\n"
+            "  - id: PRECTOTCORR\n    aggregation: sum\n"
+        )
+        service = DataService(str(data_dir), precompute_climatology=precompute)
+
+        # January 2020: 31 days, days 0, 10, 20 and 30 missing
+        assert service.get_monthly_aggregate(
+            "PRECTOTCORR", 12.0, 77.0, 1, 2020
+        ) == pytest.approx(27 * 2.0)
+        assert service.get_monthly_aggregate("T2M", 12.0, 77.0, 1) == pytest.approx(12.0)
+        assert service.get_monthly_aggregate("T2M", 12.0, 77.0, 1, 2020) == pytest.approx(11.0)
+
+    def test_all_missing_month_sum_is_none(self):
+        series = LocationSeries(
+            1.0,
+            2.0,
+            np.arange("2020-01-01", "2020-03-01", dtype="datetime64[D]"),
+            {"PRECTOTCORR": np.r_[np.full(31, np.nan), np.full(29, 1.0)]},
+        )
+        cube = ClimatologyCube.build({"a": series}, {"PRECTOTCORR": "sum"})
+
+        assert cube.aggregate("a", "PRECTOTCORR", 1, 2020) is None
+        assert cube.aggregate("a", "PRECTOTCORR", 2, 2020) == pytest.approx(29.0)
+
+    def test_prebuilt_cube_is_loaded(self, data_dir, tmp_path):
+        cube_path = tmp_path / "cube.npz"
+        DataService(str(data_dir)).climatology.save(cube_path)
+
+        service = DataService(str(data_dir), climatology_path=str(cube_path))
+
+        assert len(service.cache) == 0
+        assert service.get_value_at_point("T2M", 13.0, 78.0, 3) == pytest.approx(23.5)
+
+
+class TestBinaryStore:
+    """Test cases for the compiled, memory-mapped location format."""
+
+    def test_json_load_writes_compiled_columns(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+        service._load_location_data("alpha")
+
+        compiled = data_dir / "outputs" / "alpha_point" / "compiled"
+        assert (compiled / "manifest.json").exists()
+        assert (compiled / "T2M.npy").exists()
+
+    def test_compiled_columns_are_memory_mapped(self, data_dir):
+        DataService(str(data_dir), precompute_climatology=False)._load_location_data("alpha")
+
+        service = DataService(str(data_dir), precompute_climatology=False)
+        series = service._load_location_data("alpha")
+
+        assert isinstance(series.column("T2M"), np.memmap)
+        assert series.column("T2M").dtype == np.float32
+        assert service.get_value_at_point("T2M", 12.0, 77.0, 7, 2021) == pytest.approx(18.0)
+        assert service.get_value_at_point("PRECTOTCORR", 12.0, 77.0, 5) == pytest.approx(2.0)
+
+    def test_stale_compiled_data_falls_back_to_json(self, data_dir):
+        DataService(str(data_dir), precompute_climatology=False)._load_location_data("alpha")
+        raw_file = next((data_dir / "outputs" / "alpha_point" / "raw").glob("*.json"))
+        future = raw_file.stat().st_mtime + 100
+        os.utime(raw_file, (future, future))
+
+        service = DataService(
+            str(data_dir), precompute_climatology=False, write_binary_cache=False
+        )
+        series = service._load_location_data("alpha")
+
+        assert not isinstance(series.column("T2M"), np.memmap)
+
+    def test_store_rewritten_under_live_service_is_reread_consistently(self, data_dir):
+        DataService(str(data_dir), precompute_climatology=False)._load_location_data("alpha")
+        live = DataService(str(data_dir), precompute_climatology=False)
+        old = live._load_location_data("alpha", ["T2M"])
+        # Another service rewrites the compiled store with one year less of data
+        raw_files = sorted((data_dir / "outputs" / "alpha_point" / "raw").glob("*.json"))
+        shorter = LocationSeries(
+            old.lat,
+            old.lon,
+            old.dates[:366],
+            {p: np.zeros(366) for p in live.locations_cache["alpha"]["parameters"]},
+        )
+        write_compiled_series(shorter, data_dir / "outputs" / "alpha_point" / "compiled", raw_files)
+
+        series = live._load_location_data("alpha", ["T2M", "PRECTOTCORR"])
+
+        assert len(old.dates) == 731
+        assert len(series.dates) == 366
+        assert len(series.column("T2M")) == len(series.column("PRECTOTCORR")) == 366
+
+
+class TestLocationCache:
+    """Test cases for the byte-bounded location cache."""
+
+    def test_evicts_least_recently_used_within_budget(self):
+        cache = LRUCache(max_bytes=100)
+        cache.put("a", "x", size=40)
+        cache.put("b", "y", size=40)
+        cache.get("a")
+        cache.put("c", "z", size=40)
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.current_bytes == 80
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_entry_is_not_cached(self):
+        cache = LRUCache(max_bytes=10)
+        assert cache.put("a", "x", size=11) is False
+        assert len(cache) == 0
+
+    def test_ttl_expires_entries(self):
+        now = [0.0]
+        cache = LRUCache(ttl_seconds=5, clock=lambda: now[0])
+        cache.put("a", "x", size=1)
+        now[0] = 6.0
+
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["expirations"] == 1 and stats["misses"] == 1
+
+    def test_service_accounts_series_bytes(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+        series = service._load_location_data("alpha", ["T2M"])
+        service._load_location_data("alpha", ["T2M"])
+
+        stats = service.get_cache_stats()
+        assert stats["bytes"] == series.nbytes
+        assert stats["hits"] == 2 and stats["misses"] == 2
+
+    def test_service_reloads_evicted_location(self, data_dir):
+        service = DataService(
+            str(data_dir), precompute_climatology=False, cache_max_bytes=1
+        )
+
+        assert service.get_value_at_point("T2M", 12.0, 77.0, 7, 2021) == pytest.approx(18.0)
+        assert len(service.cache) == 0
+
+
+class TestLazyColumns:
+    """Test cases for per-parameter column loading."""
+
+    def test_only_requested_columns_are_materialized(self, data_dir):
+        DataService(str(data_dir), precompute_climatology=False)._load_location_data("alpha")
+        service = DataService(str(data_dir), precompute_climatology=False)
+
+        series = service._load_location_data("alpha", ["T2M", "MISSING"])
+
+        assert series.parameters == ["T2M"]
+        assert "column_alpha_T2M" in service.cache
+        assert "column_alpha_PRECTOTCORR" not in service.cache
+
+    def test_columns_share_cached_index(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+        first = service._load_location_data("alpha", ["T2M"])
+        second = service._load_location_data("alpha", ["PRECTOTCORR"])
+
+        assert first.dates is second.dates
+        assert second.parameters == ["PRECTOTCORR"]
+
+    def test_evicted_json_columns_are_reparsed(self, data_dir):
+        service = DataService(
+            str(data_dir), precompute_climatology=False, write_binary_cache=False
+        )
+        service._load_location_data("alpha", ["T2M"])
+        service.cache.pop("column_alpha_T2M")
+
+        series = service._load_location_data("alpha", ["T2M"])
+        assert not isinstance(series.column("T2M"), np.memmap)
+        assert service.get_value_at_point("T2M", 12.0, 77.0, 7, 2021) == pytest.approx(18.0)
+
+
+class TestStartupIndexing:
+    """Test cases for location discovery at startup."""
+
+    def test_coordinates_read_from_geometry_header(self, data_dir):
+        path = next((data_dir / "outputs" / "alpha_point" / "raw").glob("*.json"))
+        assert read_power_coordinates(path, chunk_size=16) == (12.0, 77.0)
+
+    def test_coordinates_after_properties_fall_back_to_full_parse(self, tmp_path):
+        path = tmp_path / "late.json"
+        path.write_text(
+            json.dumps({"properties": {"pad": "x" * 500}, "geometry": {"coordinates": [1, 2, 0]}})
+        )
+        assert read_power_coordinates(path, chunk_size=8) == (2, 1)
+
+    def test_coordinates_read_from_compiled_manifest(self, data_dir):
+        DataService(str(data_dir), precompute_climatology=False)._load_location_data("alpha")
+        for raw_file in (data_dir / "outputs" / "alpha_point" / "raw").glob("*.json"):
+            raw_file.write_text("{}")
+
+        service = DataService(str(data_dir), precompute_climatology=False, index_workers=2)
+
+        info = service.locations_cache["alpha"]
+        assert (info["lat"], info["lon"]) == (12.0, 77.0)
+        assert set(service.locations_cache) == {"alpha", "beta"}
+
+
+class TestWarmup:
+    """Test cases for the startup warm-up."""
+
+    def test_warm_up_loads_requested_columns(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+
+        summary = service.warm_up(["alpha", "unknown"], ["T2M"])
+
+        assert summary == {"locations": 1, "columns": 1}
+        assert "column_alpha_T2M" in service.cache
+        assert "column_beta_T2M" not in service.cache
+
+    def test_run_warmup_marks_state_complete(self, data_dir):
+        from app.core.vibe_engine import VibeEngine
+        from app.services.warmup import WarmupState, run_warmup
+
+        service = DataService(str(data_dir), precompute_climatology=False)
+        state = WarmupState()
+        assert not state.ready
+
+        run_warmup(state, service, VibeEngine(), mode="vibes")
+
+        assert state.ready
+        assert state.summary["locations"] == 2
+        assert "column_alpha_T2M" in service.cache
+
+
+class TestTopK:
+    """Test cases for the pruned top-k radius search."""
+
+    @staticmethod
+    def _score(block):
+        # Higher temperature is better
+        return block[:, 0]
+
+    @staticmethod
+    def _bound(mins, maxs):
+        return maxs[:, 0]
+
+    def test_extrema_bound_monthly_means(self, data_dir):
+        service = DataService(str(data_dir))
+        mins, maxs = service.climatology.extrema("beta", ["T2M", "MISSING"], 3)
+
+        assert (mins[0], maxs[0]) == (23.0, 24.0)
+        assert np.isnan(mins[1]) and np.isnan(maxs[1])
+
+    def test_top_k_prunes_dominated_locations(self, data_dir):
+        service = DataService(str(data_dir))
+
+        results, stats = service.get_radius_top_k(
+            ["T2M"], 12.5, 77.5, 300, TimeSpec(month=3), 1, self._score, self._bound
+        )
+
+        assert [(lat, lon) for lat, lon, _ in results] == [(13.0, 78.0)]
+        assert results[0][2] == pytest.approx(23.5)
+        assert stats == {"candidates": 2, "evaluated": 1, "pruned": 1}
+
+    def test_top_k_without_bounds_matches_full_scan(self, data_dir):
+        service = DataService(str(data_dir))
+        spec = TimeSpec(start_date=datetime(2020, 1, 1), end_date=datetime(2020, 12, 31))
+
+        results, stats = service.get_radius_top_k(
+            ["T2M"], 12.5, 77.5, 300, spec, 5, self._score, self._bound
+        )
+
+        assert [lat for lat, _, _ in results] == [13.0, 12.0]
+        assert stats["evaluated"] == 2
+
+
+class TestGridMatrix:
+    """Test cases for IDW-interpolated grids."""
+
+    def test_grid_values_lie_between_stations(self, data_dir):
+        service = DataService(str(data_dir))
+
+        lats, lons, matrix = service.get_grid_matrix(
+            ["T2M", "MISSING"], 12.5, 77.5, 60, 10, TimeSpec(month=3)
+        )
+
+        assert len(lats) == len(lons) == len(matrix) > 0
+        assert np.all((matrix[:, 0] >= 13.5) & (matrix[:, 0] <= 23.5))
+        assert np.isnan(matrix[:, 1]).all()
+
+    def test_grid_weights_are_cached_per_geometry(self, data_dir):
+        service = DataService(str(data_dir))
+
+        first = service.get_grid_weights(12.5, 77.5, 60, 10)
+
+        assert service.get_grid_weights(12.5, 77.5, 60, 10) is first
+        assert service.get_grid_weights(12.5, 77.5, 60, 5) is not first
+
+
+class TestDailyMatrix:
+    """Test cases for single-pass daily slicing."""
+
+    def test_days_inside_record_are_observed(self, data_dir):
+        service = DataService(str(data_dir))
+
+        days, matrix, observed = service.get_daily_matrix(
+            ["T2M", "PRECTOTCORR"], 12.0, 77.0, datetime(2020, 12, 30), datetime(2021, 1, 2)
+        )
+
+        assert days.tolist() == [
+            datetime(2020, 12, 30).date(),
+            datetime(2020, 12, 31).date(),
+            datetime(2021, 1, 1).date(),
+            datetime(2021, 1, 2).date(),
+        ]
+        assert matrix[:, 0].tolist() == [22.0, 22.0, 12.0, 12.0]
+        # 2021-01-01 is day 0 of its file; precipitation is missing in every year
+        assert observed.tolist() == [True, True, False, True]
+        assert np.isnan(matrix[2, 1])
+
+    def test_missing_observations_are_filled(self, data_dir):
+        service = DataService(str(data_dir))
+
+        # Day 70 of 2020 (March 11) is missing, but March 11 2021 is not
+        _, matrix, observed = service.get_daily_matrix(
+            ["PRECTOTCORR"], 12.0, 77.0, datetime(2020, 3, 11), datetime(2020, 3, 11)
+        )
+
+        assert not observed[0]
+        assert matrix[0, 0] == pytest.approx(2.0)
+
+    def test_days_outside_record_use_calendar_day_means(self, data_dir):
+        service = DataService(str(data_dir))
+
+        days, matrix, observed = service.get_daily_matrix(
+            ["T2M", "MISSING"], 12.0, 77.0, datetime(2026, 3, 5), datetime(2026, 3, 6)
+        )
+
+        assert len(days) == 2
+        assert not observed.any()
+        # March is 13 in 2020 and 14 in 2021
+        assert matrix[:, 0].tolist() == [13.5, 13.5]
+        assert np.isnan(matrix[:, 1]).all()
+
+    def test_calendar_day_keys_ignore_leap_days(self):
+        dates = np.array(["2020-03-01", "2021-03-01", "2020-02-29"], dtype="datetime64[D]")
+
+        keys = calendar_day_keys(dates)
+
+        assert keys[0] == keys[1] == 2 * 31
+        assert keys[2] == 31 + 28
+
+
+class TestMonthlyByYear:
+    """Test cases for the years x months matrix behind trend analysis."""
+
+    def test_cube_slice_matches_per_year_means(self, data_dir):
+        service = DataService(str(data_dir))
+
+        years, matrix = service.get_monthly_by_year(["T2M", "MISSING"], 12.0, 77.0)
+
+        assert years.tolist() == [2020, 2021]
+        assert matrix.shape == (2, 12, 2)
+        np.testing.assert_allclose(matrix[0, :, 0], 10 + np.arange(1, 13))
+        np.testing.assert_allclose(matrix[1, :, 0], 11 + np.arange(1, 13))
+        assert np.isnan(matrix[:, :, 1]).all()
+
+    def test_without_cube_builds_from_series(self, data_dir):
+        service = DataService(str(data_dir), precompute_climatology=False)
+
+        years, matrix = service.get_monthly_by_year(["T2M"], 13.0, 78.0)
+
+        assert years.tolist() == [2020, 2021]
+        assert matrix[1, 2, 0] == pytest.approx(20 + 3 + 1)
+
+
+class TestScoreDistributions:
+    """Test cases for cached per-location score distributions."""
+
+    CONFIG = {
+        "parameters": [
+            {"id": "T2M", "weight": 1, "scoring": "high_is_better", "min": 0, "max": 100},
+        ]
+    }
+
+    def test_distribution_is_cached_per_plan(self, data_dir):
+        service = DataService(str(data_dir))
+        plan = compile_scoring_plan("warm", self.CONFIG)
+
+        first = service.get_score_distribution(plan, 12.0, 77.0, 12.5)
+        second = service.get_score_distribution(plan, 12.0, 77.0, 12.5)
+        reloaded = service.get_score_distribution(
+            compile_scoring_plan("warm", self.CONFIG), 12.0, 77.0, 12.5
+        )
+
+        assert second is first
+        assert reloaded is not first
+        # March scores 13 in 2020 and 14 in 2021, so every day is above 12.5
+        assert first.month(3)["probability"] == 1.0
+        assert first.month(3)["p50"] == pytest.approx(13.5)
+        # February scores 12 and 13: only the 2021 days count
+        assert first.month(2)["probability"] == pytest.approx(28 / 57)
+
+    def test_radius_distributions_keyed_by_coordinates(self, data_dir):
+        service = DataService(str(data_dir))
+        plan = compile_scoring_plan("warm", self.CONFIG)
+
+        distributions = service.get_radius_score_distributions(plan, 12.5, 77.5, 300, 50.0)
+
+        assert set(distributions) == {(12.0, 77.0), (13.0, 78.0)}
+        assert distributions[(13.0, 78.0)].month(1)["probability"] == 0.0
@@ -0,0 +1,127 @@
+"""
+Unit tests for geospatial utilities and the location spatial index.
+"""
+
+import numpy as np
+import pytest
+
+from app.services.interpolation import idw_weights
+from app.utils.geospatial import (
+    generate_grid,
+    generate_grid_points,
+    haversine_distance,
+)
+from app.utils.spatial_index import SpatialIndex
+
+# A few of the bundled point locations
+LOCATIONS = {
+    "bangalore": (12.972, 77.595),
+    "mysore": (12.296, 76.639),
+    "ooty": (11.41, 76.695),
+    "goa": (15.3, 74.0),
+    "pondicherry": (11.934, 79.83),
+}
+
+
+@pytest.fixture
+def index():
+    """Spatial index over the sample locations."""
+    names = list(LOCATIONS)
+    return SpatialIndex(
+        names, [LOCATIONS[n][0] for n in names], [LOCATIONS[n][1] for n in names]
+    )
+
+
+class TestSpatialIndex:
+    """Test cases for nearest and radius queries."""
+
+    def test_nearest_single_point(self, index):
+        distances, indices = index.nearest(12.9, 77.5)
+
+        assert index.names[indices[0, 0]] == "bangalore"
+        assert distances[0, 0] == pytest.approx(
+            haversine_distance(12.9, 77.5, *LOCATIONS["bangalore"]), rel=1e-6
+        )
+
+    def test_nearest_k_batch_sorted(self, index):
+        lats = np.array([12.3, 15.0])
+        lons = np.array([76.6, 74.2])
+
+        distances, indices = index.nearest(lats, lons, k=3)
+
+        assert distances.shape == (2, 3)
+        assert index.names[indices[0, 0]] == "mysore"
+        assert index.names[indices[1, 0]] == "goa"
+        assert np.all(np.diff(distances, axis=1) >= 0)
+
+    def test_within_radius_uses_great_circle_km(self, index):
+        center = LOCATIONS["bangalore"]
+        radius = haversine_distance(*center, *LOCATIONS["mysore"]) + 1.0
+
+        indices, distances = index.within_radius(*center, radius)[0]
+
+        assert [index.names[i] for i in indices] == ["bangalore", "mysore"]
+        assert distances[0] == pytest.approx(0.0, abs=1e-6)
+
+    def test_empty_index(self):
+        empty = SpatialIndex([], [], [])
+
+        distances, indices = empty.nearest(0.0, 0.0)
+        assert indices.shape == (1, 0)
+        assert len(empty.within_radius(0.0, 0.0, 100.0)[0][0]) == 0
+
+
+class TestGrid:
+    """Test cases for grid generation and IDW interpolation."""
+
+    def test_grid_matches_loop_version(self):
+        lats, lons = generate_grid(12.97, 77.59, 50, 5)
+        expected = np.array(generate_grid_points(12.97, 77.59, 50, 5))
+
+        # The loop accumulates drift, so nodes right on the boundary may differ
+        assert abs(len(lats) - len(expected)) <= 4
+        distances = [haversine_distance(12.97, 77.59, a, b) for a, b in zip(lats, lons)]
+        assert max(distances) <= 50
+        offsets = np.hypot(
+            lats[:, None] - expected[:, 0], lons[:, None] - expected[:, 1]
+        ).min(axis=1)
+        assert offsets.max() < 1e-6
+
+    def test_idw_reproduces_station_values(self, index):
+        names = index.names
+        lats = np.array([LOCATIONS[n][0] for n in names])
+        lons = np.array([LOCATIONS[n][1] for n in names])
+        values = np.arange(len(names), dtype=float)[:, None]
+
+        grid = idw_weights(index, lats, lons, neighbours=3)
+
+        np.testing.assert_allclose(grid.interpolate(values)[:, 0], values[:, 0])
+        np.testing.assert_allclose(grid.weights.sum(axis=1), 1.0)
+
+    def test_idw_skips_missing_station_values(self, index):
+        grid = idw_weights(index, np.array([12.6]), np.array([77.1]), neighbours=2)
+        values = np.full((len(index.names), 2), 5.0)
+        values[grid.station_index[0, 0], 0] = np.nan
+        values[:, 1] = np.nan
+
+        result = grid.interpolate(values)
+
+        assert result[0, 0] == pytest.approx(5.0)
+        assert np.isnan(result[0, 1])
+
+
+class TestVectorizedGeospatial:
+    """Array-native geospatial helpers against their scalar behaviour."""
+
+    def test_haversine_broadcasts_to_matrix(self):
+        names = list(LOCATIONS)
+        lats = np.array([LOCATIONS[n][0] for n in names])
+        lons = np.array([LOCATIONS[n][1] for n in names])
+
+        matrix = haversine_distance(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+
+        assert matrix.shape == (len(names), len(names))
+        assert matrix[0, 1] == pytest.approx(
+            haversine_distance(*LOCATIONS[names[0]], *LOCATIONS[names[1]])
+        )
+        assert isinstance(haversine_distance(0.0, 0.0, 1.0, 1.0), float)
@@ -0,0 +1,219 @@
+"""
+Unit tests for hot-reloading data snapshots.
+"""
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.routes import admin as admin_module
+from app.core import vibe_engine as vibe_engine_module
+from app.services import data_service as data_service_module
+from app.services import result_cache as result_cache_module
+from app.services.data_service import DataService
+from app.main import app
+from app.services.reload import ReloadState, SnapshotReloader, raw_files_signature, watch
+from app.services.result_cache import ResultCache, create_backend
+
+
+@pytest.fixture(autouse=True)
+def vibes(monkeypatch):
+    """A stand-in for the global vibe engine the reloader swaps with the data."""
+    engine = SimpleNamespace(fingerprint="vibes")
+    monkeypatch.setattr(vibe_engine_module, "vibe_engine", engine)
+    return engine
+
+
+class TestSnapshotReloader:
+    """Test cases for background rebuild and atomic swap of the data service."""
+
+    @staticmethod
+    def _touch_raw_file(data_dir):
+        raw = next((data_dir / "outputs" / "alpha_point" / "raw").glob("*.json"))
+        stat = raw.stat()
+        os.utime(raw, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_swaps_when_data_changes(self, data_dir, monkeypatch):
+        current = DataService(str(data_dir))
+        monkeypatch.setattr(data_service_module, "data_service", current)
+        reloader = SnapshotReloader(lambda: DataService(str(data_dir)))
+
+        assert asyncio.run(reloader.reload("test")).status == "unchanged"
+        assert data_service_module.data_service is current
+
+        self._touch_raw_file(data_dir)
+        state = asyncio.run(reloader.reload("test"))
+
+        assert state.status == "swapped" and state.swaps == 1
+        assert data_service_module.data_service is not current
+        assert state.previous_snapshot_id == current.snapshot_id != state.snapshot_id
+        assert state.check["locations"] == 2
+
+    def test_force_swaps_unchanged_data(self, data_dir, monkeypatch):
+        current = DataService(str(data_dir))
+        monkeypatch.setattr(data_service_module, "data_service", current)
+        reloader = SnapshotReloader(lambda: DataService(str(data_dir)))
+
+        assert asyncio.run(reloader.reload("test", force=True)).status == "swapped"
+        assert data_service_module.data_service is not current
+
+    def test_failed_build_keeps_current_service(self, data_dir, tmp_path, monkeypatch):
+        current = DataService(str(data_dir))
+        monkeypatch.setattr(data_service_module, "data_service", current)
+        reloader = SnapshotReloader(lambda: DataService(str(tmp_path / "empty")))
+
+        state = asyncio.run(reloader.reload("test"))
+
+        assert state.status == "failed" and state.failures == 1
+        assert "No locations" in state.error
+        assert data_service_module.data_service is current
+
+    def test_swap_reversions_result_cache(self, data_dir, monkeypatch):
+        current = DataService(str(data_dir))
+        cache = ResultCache(create_backend("local"))
+        cache.set_version(current.snapshot_id, "vibes")
+        monkeypatch.setattr(data_service_module, "data_service", current)
+        monkeypatch.setattr(result_cache_module, "result_cache", cache)
+        self._touch_raw_file(data_dir)
+
+        state = asyncio.run(SnapshotReloader(lambda: DataService(str(data_dir))).reload("test"))
+
+        assert state.status == "swapped"
+        assert cache.stats()["invalidations"] == 1
+        assert cache.version == cache.set_version(state.snapshot_id, "vibes")
+
+    def test_vibe_dictionary_change_swaps_and_reversions(self, data_dir, vibes, monkeypatch):
+        current = DataService(str(data_dir))
+        cache = ResultCache(create_backend("local"))
+        cache.set_version(current.snapshot_id, vibes.fingerprint)
+        monkeypatch.setattr(data_service_module, "data_service", current)
+        monkeypatch.setattr(result_cache_module, "result_cache", cache)
+        edited = SimpleNamespace(fingerprint="edited")
+        prepared = []
+        reloader = SnapshotReloader(
+            lambda: current,
+            prepare=lambda service, engine: prepared.append(engine),
+            vibes_factory=lambda: edited,
+        )
+
+        state = asyncio.run(reloader.reload("test"))
+
+        assert state.status == "swapped" and state.vibes_fingerprint == "edited"
+        assert vibe_engine_module.vibe_engine is edited and prepared == [edited]
+        assert cache.version == cache.set_version(current.snapshot_id, "edited")
+
+    def test_raw_signature_follows_files(self, data_dir):
+        before = raw_files_signature(str(data_dir))
+        self._touch_raw_file(data_dir)
+
+        assert raw_files_signature(str(data_dir)) != before
+
+    def test_raw_signature_follows_extra_paths(self, data_dir):
+        vibes = data_dir / "vibe_dictionary.json"
+        vibes.write_text("{}")
+        before = raw_files_signature(str(data_dir), [str(vibes)])
+        vibes.write_text('{"warm": {}}')
+
+        assert raw_files_signature(str(data_dir), [str(vibes)]) != before
+
+    def test_watch_waits_for_changes_to_settle(self):
+        signatures = iter(["a", "b", "c", "c", "c"])
+        triggers = []
+
+        class Stop(Exception):
+            pass
+
+        class Reloader:
+            async def reload(self, trigger):
+                triggers.append(trigger)
+                raise Stop
+
+        with pytest.raises(Stop):
+            asyncio.run(watch(Reloader(), lambda: next(signatures), 0))
+        # "b" was replaced before it settled; "c" reloaded once seen twice
+        assert triggers == ["watcher"]
+        assert next(signatures) == "c"
+
+    def test_watch_survives_failing_polls(self):
+        values = iter(["a", OSError("gone"), "b", OSError("gone"), "b"])
+
+        def flaky():
+            value = next(values)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        triggers = []
+
+        class Stop(Exception):
+            pass
+
+        class Reloader:
+            async def reload(self, trigger):
+                triggers.append(trigger)
+                raise Stop
+
+        with pytest.raises(Stop):
+            asyncio.run(watch(Reloader(), flaky, 0, settle=False))
+        assert triggers == ["watcher"]
+
+
+class TestAdminReload:
+    """Test cases for the /admin/reload endpoints."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        reloader = SimpleNamespace(state=ReloadState(), running=False, task_status=None)
+        monkeypatch.setattr(admin_module, "get_reloader", lambda: reloader)
+        monkeypatch.setattr(admin_module.settings, "admin_token", "secret")
+        return TestClient(app)
+
+    def test_disabled_without_configured_token(self, client, monkeypatch):
+        monkeypatch.setattr(admin_module.settings, "admin_token", None)
+
+        response = client.get("/api/admin/reload")
+
+        assert response.status_code == 403
+        assert "disabled" in response.json()["detail"]
+
+    def test_rejects_missing_or_wrong_token(self, client):
+        assert client.get("/api/admin/reload").status_code == 403
+        assert client.get(
+            "/api/admin/reload", headers={"X-Admin-Token": "guess"}
+        ).status_code == 403
+
+    def test_reports_state_with_token(self, client):
+        response = client.get("/api/admin/reload", headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "idle" and response.json()["task"] is None
+
+    def test_no_wait_accepts_and_tracks_background_task(self, data_dir, monkeypatch):
+        current = DataService(str(data_dir))
+        monkeypatch.setattr(data_service_module, "data_service", current)
+        monkeypatch.setattr(admin_module.settings, "admin_token", "secret")
+        reloader = SnapshotReloader(lambda: DataService(str(data_dir)))
+        monkeypatch.setattr(admin_module, "get_reloader", lambda: reloader)
+
+        async def main():
+            response = await admin_module.reload_data(
+                force=True, wait=False, x_admin_token="secret"
+            )
+            assert reloader.running
+            with pytest.raises(HTTPException) as conflict:
+                await admin_module.reload_data(wait=False, x_admin_token="secret")
+            await reloader.task
+            return response, conflict.value, await admin_module.get_reload_status("secret")
+
+        response, conflict, status = asyncio.run(main())
+
+        assert response.status_code == 202
+        assert json.loads(response.body) == {"accepted": True, "task": "running"}
+        assert conflict.status_code == 409
+        assert status["task"] == "done" and status["status"] == "swapped"
+        assert data_service_module.data_service is not current
@@ -0,0 +1,224 @@
+"""
+Unit tests for the versioned route result cache.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+
+from app.api.routes import when as when_module
+from app.core.vibe_engine import VibeEngine
+from app.models.requests import WhenRequest
+from app.services import data_service as data_service_module
+from app.services import result_cache as result_cache_module
+from app.services.data_service import DataService
+from app.services.result_cache import ResultCache, create_backend
+
+
+class _Payload(BaseModel):
+    location: dict
+    metadata: dict
+    value: float
+
+
+class TestResultCache:
+    """Test cases for the canonical-key route result cache."""
+
+    @staticmethod
+    def _serve(cache, key, value=1.0, echo=None, calls=None):
+        def compute():
+            if calls is not None:
+                calls.append(key)
+            return _Payload(location={"lat": 0}, metadata={"center": None, "n": 2}, value=value)
+
+        response = asyncio.run(cache.get_or_compute(key, compute, echo))
+        return json.loads(response.body)
+
+    def test_hit_serves_stored_body_with_request_echo(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap", "vibes")
+        key = cache.make_key("when", {"vibe": "beach_day", "month": 7})
+        calls = []
+
+        first = self._serve(cache, key, echo={"location": {"lat": 1.5}}, calls=calls)
+        second = self._serve(
+            cache, key, value=99.0, echo={"location": {"lat": 1.5001}}, calls=calls
+        )
+
+        assert calls == [key]
+        assert first["location"] == {"lat": 1.5}
+        assert second == {**first, "location": {"lat": 1.5001}}
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["saved_seconds"] == pytest.approx(stats["compute_seconds"])
+
+    def test_nested_echo_keeps_sibling_fields(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap")
+        body = self._serve(
+            cache, cache.make_key("where", {}), echo={"metadata.center": {"lat": 3.0, "lon": 4.0}}
+        )
+
+        assert body["metadata"] == {"center": {"lat": 3.0, "lon": 4.0}, "n": 2}
+
+    def test_keys_are_canonical(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap")
+
+        assert cache.make_key("where", {"a": 1, "b": [1, 2]}) == cache.make_key(
+            "where", {"b": [1, 2], "a": 1}
+        )
+        assert cache.make_key("where", {"a": 1}) != cache.make_key("when", {"a": 1})
+
+    def test_version_change_invalidates(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap-1", "vibes")
+        calls = []
+        self._serve(cache, cache.make_key("when", {}), calls=calls)
+
+        cache.set_version("snap-1", "vibes")
+        self._serve(cache, cache.make_key("when", {}), calls=calls)
+        cache.set_version("snap-2", "vibes")
+        self._serve(cache, cache.make_key("when", {}), calls=calls)
+
+        assert len(calls) == 2
+        assert cache.stats()["invalidations"] == 1
+
+    def test_failures_are_not_cached(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap")
+
+        def compute():
+            raise ValueError("boom")
+
+        key = cache.make_key("when", {})
+        with pytest.raises(ValueError):
+            asyncio.run(cache.get_or_compute(key, compute))
+        assert cache.backend.get(key) is None
+        assert cache.stats()["misses"] == 0
+
+    def test_local_backend_is_byte_bounded(self):
+        cache = ResultCache(create_backend("local", max_bytes=100))
+        cache.set_version("snap")
+        first, second = cache.make_key("when", {"i": 1}), cache.make_key("when", {"i": 2})
+        self._serve(cache, first)
+        self._serve(cache, second)
+
+        assert cache.backend.get(first) is None
+        assert cache.backend.get(second) is not None
+
+    def test_concurrent_misses_share_one_computation(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return _Payload(location={}, metadata={}, value=1.0)
+
+        async def slow_run(fn):
+            await asyncio.sleep(0.05)
+            return fn()
+
+        key = cache.make_key("when", {})
+
+        async def main():
+            return await asyncio.gather(
+                *[
+                    cache.get_or_compute(key, compute, {"location": {"i": i}}, run=slow_run)
+                    for i in range(3)
+                ]
+            )
+
+        bodies = [json.loads(r.body) for r in asyncio.run(main())]
+        assert len(calls) == 1
+        assert [b["location"] for b in bodies] == [{"i": 0}, {"i": 1}, {"i": 2}]
+        stats = cache.stats()
+        assert stats["misses"] == 1 and stats["coalesced"] == 2
+
+    def test_superseded_results_are_not_stored(self):
+        cache = ResultCache(create_backend("local"))
+        cache.set_version("snap-1")
+        key = cache.make_key("when", {})
+
+        async def run_across_swap(fn):
+            cache.set_version("snap-2")
+            return fn()
+
+        response = asyncio.run(
+            cache.get_or_compute(
+                key, lambda: _Payload(location={}, metadata={}, value=1.0), run=run_across_swap
+            )
+        )
+
+        assert json.loads(response.body)["value"] == 1.0
+        assert cache.backend.get(key) is None
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            create_backend("bogus")
+
+    def test_snapshot_id_follows_raw_files(self, data_dir):
+        before = DataService(str(data_dir), precompute_climatology=False).snapshot_id
+        raw = next((data_dir / "outputs" / "alpha_point" / "raw").glob("*.json"))
+        stat = raw.stat()
+        os.utime(raw, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        after = DataService(str(data_dir), precompute_climatology=False).snapshot_id
+        assert after != before
+
+
+class TestWhenCacheKeys:
+    """Test cases for /when keys built from the dates the analysis uses."""
+
+    @pytest.fixture
+    def today(self, data_dir, tmp_path, monkeypatch):
+        vibes = tmp_path / "vibes.json"
+        vibes.write_text(json.dumps({
+            "warm": {
+                "name": "Warm",
+                "parameters": [
+                    {"id": "T2M", "weight": 1.0, "scoring": "high_is_better", "min": 0, "max": 40}
+                ],
+            }
+        }))
+        monkeypatch.setattr("app.core.vibe_engine.vibe_engine", VibeEngine(str(vibes)))
+        monkeypatch.setattr(data_service_module, "data_service", DataService(str(data_dir)))
+        monkeypatch.setattr(
+            result_cache_module, "result_cache", ResultCache(create_backend("local"))
+        )
+        today = [datetime(2020, 3, 1)]
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return today[0]
+
+        monkeypatch.setattr(when_module, "datetime", Clock)
+        return today
+
+    @staticmethod
+    def _when(**fields):
+        request = WhenRequest(vibe="warm", lat=12.0, lon=77.0, analysis_type="hourly", **fields)
+        return json.loads(asyncio.run(when_module.find_when(request)).body)
+
+    def test_hourly_default_day_follows_today(self, today):
+        first = self._when()
+        today[0] = datetime(2020, 3, 2)
+        second = self._when()
+
+        assert first["metadata"]["best_date"] == "2020-03-01"
+        assert second["metadata"]["best_date"] == "2020-03-02"
+        assert second["metadata"]["date_range"] == {"start": "2020-03-02", "end": "2020-03-02"}
+
+    def test_start_date_without_end_date_is_keyed_on_today(self, today):
+        self._when(start_date="2020-01-05")
+        today[0] = datetime(2020, 3, 2)
+
+        response = self._when(start_date="2020-01-05")
+
+        assert response["metadata"]["date_range"] == {"start": "2020-03-02", "end": "2020-03-02"}
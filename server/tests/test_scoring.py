@@ -0,0 +1,360 @@
+"""
+Unit tests for the scalar and vectorized vibe scoring functions.
+"""
+
+import numpy as np
+import pytest
+
+from app.core.scoring_plan import compile_scoring_plan
+from app.core.vibe_engine import VibeEngine
+from app.services.distribution import QUANTILES, score_distribution
+from app.services.scoring_service import (
+    calculate_weighted_score,
+    calculate_weighted_scores,
+    score_high_is_better,
+    score_high_is_better_array,
+    score_low_is_better,
+    score_low_is_better_array,
+    score_optimal_range,
+    score_optimal_range_array,
+    score_trends,
+)
+
+VALUES = np.array([-5.0, 0.0, 3.5, 10.0, 24.0, 28.0, 33.0, 80.0])
+
+SCALAR_SCORERS = {
+    "low_is_better": lambda v, c: score_low_is_better(v, c["min"], c["max"]),
+    "high_is_better": lambda v, c: score_high_is_better(v, c["min"], c["max"]),
+    "optimal_range": lambda v, c: score_optimal_range(
+        v, c["optimal_min"], c["optimal_max"], c.get("falloff_rate", 2.0)
+    ),
+}
+
+
+def _reference_score(config, parameter_values):
+    """Score one sample straight from the vibe config with the scalar scorers."""
+    scores, weights = {}, {}
+    for param_config in config["parameters"]:
+        value = parameter_values.get(param_config["id"])
+        if value is None:
+            continue
+        scores[param_config["id"]] = SCALAR_SCORERS[param_config["scoring"]](
+            value, param_config
+        )
+        weights[param_config["id"]] = param_config["weight"]
+    return calculate_weighted_score(scores, weights)
+
+
+@pytest.fixture(scope="module")
+def vibe_engine():
+    return VibeEngine()
+
+
+class TestArrayScoring:
+    """Array scorers must agree with the scalar versions element-wise."""
+
+    @pytest.mark.parametrize(
+        "scalar, array",
+        [
+            (score_low_is_better, score_low_is_better_array),
+            (score_high_is_better, score_high_is_better_array),
+        ],
+    )
+    @pytest.mark.parametrize("bounds", [(0, 10), (0, 100), (5, 5)])
+    def test_linear_scores_match_scalar(self, scalar, array, bounds):
+        expected = [scalar(v, *bounds) for v in VALUES]
+        np.testing.assert_allclose(array(VALUES, *bounds), expected)
+
+    @pytest.mark.parametrize("optimum", [(24, 32, 2.0), (18, 26, 1.5)])
+    def test_optimal_range_matches_scalar(self, optimum):
+        expected = [score_optimal_range(v, *optimum) for v in VALUES]
+        np.testing.assert_allclose(score_optimal_range_array(VALUES, *optimum), expected)
+
+    def test_nan_propagates(self):
+        values = np.array([np.nan, 5.0])
+        assert np.isnan(score_low_is_better_array(values, 0, 10)[0])
+        assert np.isnan(score_optimal_range_array(values, 0, 10)[0])
+
+    def test_weighted_scores_mask_missing(self):
+        scores = np.array([[100.0, 50.0], [np.nan, 50.0], [np.nan, np.nan]])
+        weights = np.array([0.75, 0.25])
+
+        result = calculate_weighted_scores(scores, weights)
+
+        assert result[0] == pytest.approx(
+            calculate_weighted_score({"a": 100.0, "b": 50.0}, {"a": 0.75, "b": 0.25})
+        )
+        assert result[1] == pytest.approx(50.0)
+        assert result[2] == 0.0
+
+
+class TestBatchVibeScoring:
+    """VibeEngine.calculate_vibe_scores against the per-dict scorer."""
+
+    @pytest.mark.parametrize("vibe_id", ["stargazing", "beach_day", "cozy_rain", "hiking"])
+    def test_matches_scalar_scorer(self, vibe_engine, vibe_id):
+        params = vibe_engine.get_required_parameters(vibe_id)
+        rng = np.random.default_rng(0)
+        values = rng.uniform(0, 40, size=(50, len(params)))
+
+        batch = vibe_engine.calculate_vibe_scores(vibe_id, values, params)
+
+        config = vibe_engine.get_vibe_config(vibe_id)
+        expected = [_reference_score(config, dict(zip(params, row))) for row in values.tolist()]
+        np.testing.assert_allclose(batch, expected)
+        assert vibe_engine.calculate_vibe_score(
+            vibe_id, dict(zip(params, values[0]))
+        ) == pytest.approx(expected[0])
+
+    def test_missing_values_drop_their_weight(self, vibe_engine):
+        params = vibe_engine.get_required_parameters("beach_day")
+        values = np.array([[8.0, 28.0, np.nan]])
+
+        batch = vibe_engine.calculate_vibe_scores("beach_day", values, params)
+
+        expected = _reference_score(
+            vibe_engine.get_vibe_config("beach_day"), {params[0]: 8.0, params[1]: 28.0}
+        )
+        assert batch[0] == pytest.approx(expected)
+
+    def test_advisor_is_rejected(self, vibe_engine):
+        with pytest.raises(ValueError, match="Advisors"):
+            vibe_engine.calculate_vibe_scores("fashion_stylist", np.zeros((1, 1)), ["T2M"])
+
+
+class TestScoringPlan:
+    """Test cases for compiled scoring plans."""
+
+    CONFIG = {
+        "parameters": [
+            {"id": "T2M", "weight": 3, "scoring": "optimal_range", "optimal_min": 20, "optimal_max": 25},
+            {"id": "RH2M", "weight": 1, "scoring": "low_is_better", "min": 0, "max": 100},
+        ]
+    }
+
+    def test_plan_is_normalized_and_read_only(self):
+        plan = compile_scoring_plan("test", self.CONFIG)
+
+        assert plan.parameter_ids == ("T2M", "RH2M")
+        np.testing.assert_allclose(plan.weights, [0.75, 0.25])
+        assert plan.falloff[0] == 2.0
+        with pytest.raises(ValueError):
+            plan.weights[0] = 1.0
+
+    def test_gather_reorders_columns(self):
+        plan = compile_scoring_plan("test", self.CONFIG)
+        block = plan.gather(np.array([[50.0, 22.0]]), ["RH2M", "T2M"])
+
+        np.testing.assert_array_equal(block, [[22.0, 50.0]])
+
+    @pytest.mark.parametrize(
+        "change, message",
+        [
+            ({"scoring": "bogus"}, "Unknown scoring method"),
+            ({"optimal_min": 30}, "optimal_min > optimal_max"),
+            ({"weight": "heavy"}, "non-numeric 'weight'"),
+            ({"falloff_rate": 0}, "positive falloff_rate"),
+        ],
+    )
+    def test_invalid_config_is_rejected(self, change, message):
+        config = {"parameters": [dict(self.CONFIG["parameters"][0], **change)]}
+        with pytest.raises(ValueError, match=message):
+            compile_scoring_plan("test", config)
+
+    def test_engine_rejects_bad_dictionary_at_load(self, tmp_path):
+        path = tmp_path / "vibes.json"
+        path.write_text('{"bad": {"parameters": [{"id": "T2M", "weight": 1, "scoring": "low_is_better"}]}}')
+
+        with pytest.raises(ValueError, match="missing 'min'"):
+            VibeEngine(str(path))
+
+
+class TestStackedScoring:
+    """Scoring every vibe at once must match scoring them one by one."""
+
+    def test_all_vibes_match_single_vibe_scores(self, vibe_engine):
+        stacked = vibe_engine.get_stacked_plan()
+        params = list(stacked.parameter_ids)
+        values = np.random.default_rng(1).uniform(0, 40, size=(30, len(params)))
+        values[3, 0] = np.nan
+
+        scores = vibe_engine.calculate_all_vibe_scores(values, params)
+
+        assert scores.shape == (len(stacked.vibe_ids), 30)
+        for row, vibe_id in zip(scores, stacked.vibe_ids):
+            np.testing.assert_allclose(
+                row, vibe_engine.calculate_vibe_scores(vibe_id, values, params)
+            )
+
+    def test_stacked_plan_is_cached_per_selection(self, vibe_engine):
+        selection = ["beach_day", "stargazing"]
+        stacked = vibe_engine.get_stacked_plan(selection)
+
+        assert stacked is vibe_engine.get_stacked_plan(selection)
+        assert stacked.vibe_ids == ("beach_day", "stargazing")
+        assert not stacked.usage[1, stacked.parameter_ids.index("T2M")]
+
+    def test_reordered_selections_share_one_cached_plan(self):
+        vibe_engine = VibeEngine()
+        forward = vibe_engine.get_stacked_plan(["beach_day", "stargazing"])
+        reverse = vibe_engine.get_stacked_plan(["stargazing", "beach_day", "stargazing"])
+
+        assert len(vibe_engine._stacked_plans) == 1
+        assert reverse.vibe_ids == ("stargazing", "beach_day")
+        assert reverse.parameter_ids == forward.parameter_ids
+        np.testing.assert_array_equal(reverse.weights, forward.weights[::-1])
+
+        rng = np.random.default_rng(3)
+        values = rng.uniform(0, 40, size=(16, len(forward.parameter_ids)))
+        np.testing.assert_allclose(reverse.score(values), forward.score(values)[::-1])
+
+    def test_stacked_plan_cache_is_bounded(self, monkeypatch):
+        vibe_engine = VibeEngine()
+        monkeypatch.setattr(vibe_engine._stacked_plans, "max_entries", 2)
+        for selection in (["beach_day"], ["stargazing"], ["hiking"], ["cozy_rain"]):
+            vibe_engine.get_stacked_plan(selection)
+
+        assert len(vibe_engine._stacked_plans) == 2
+
+
+class TestUpperBound:
+    """Score upper bounds used to prune top-k searches."""
+
+    @pytest.mark.parametrize("vibe_id", ["stargazing", "beach_day", "cozy_rain", "hiking"])
+    def test_bound_dominates_any_value_in_interval(self, vibe_engine, vibe_id):
+        plan = vibe_engine.get_scoring_plan(vibe_id)
+        rng = np.random.default_rng(2)
+        lower = rng.uniform(0, 30, size=(40, len(plan.parameter_ids)))
+        upper = lower + rng.uniform(0, 20, size=lower.shape)
+        inside = lower + rng.uniform(0, 1, size=lower.shape) * (upper - lower)
+
+        bound = plan.upper_bound(lower, upper)
+
+        assert np.all(bound >= plan.score(inside) - 1e-9)
+        np.testing.assert_allclose(plan.upper_bound(inside, inside), plan.score(inside))
+
+    def test_unknown_bounds_are_optimistic(self, vibe_engine):
+        plan = vibe_engine.get_scoring_plan("beach_day")
+        nan = np.full((1, len(plan.parameter_ids)), np.nan)
+
+        assert plan.upper_bound(nan, nan)[0] == pytest.approx(100.0)
+
+
+class TestDiurnalCurve:
+    """Test cases for the hour-of-day profile applied to daily scores."""
+
+    CONFIG = TestScoringPlan.CONFIG
+
+    @staticmethod
+    def _legacy_multiplier(hour):
+        # The fixed profile /when used before curves were configurable
+        if 6 <= hour <= 8:
+            return 0.9
+        if 9 <= hour <= 11:
+            return 1.1
+        if 12 <= hour <= 14:
+            return 1.2
+        if 15 <= hour <= 17:
+            return 1.1
+        if 18 <= hour <= 20:
+            return 0.8
+        return 0.6
+
+    def test_default_curve_matches_legacy_profile(self):
+        plan = compile_scoring_plan("test", self.CONFIG)
+
+        hourly = plan.hourly_scores(np.array([50.0, 90.0, np.nan]))
+
+        assert hourly.shape == (3, 24)
+        for hour in range(24):
+            expected = self._legacy_multiplier(hour)
+            assert hourly[0, hour] == pytest.approx(50.0 * expected)
+            assert hourly[1, hour] == pytest.approx(min(100.0, 90.0 * expected))
+        assert np.isnan(hourly[2]).all()
+
+    def test_custom_curve(self):
+        curve = [1.0] * 6 + [0.0] * 18
+        plan = compile_scoring_plan("test", dict(self.CONFIG, diurnal_curve=curve))
+
+        np.testing.assert_allclose(plan.hourly_scores([80.0])[0], np.array(curve) * 80.0)
+
+    @pytest.mark.parametrize(
+        "curve, message",
+        [
+            ([1.0] * 23, "24 hourly multipliers"),
+            ([1.0] * 23 + ["high"], "non-numeric"),
+            ([1.0] * 23 + [-0.5], "negative multiplier"),
+        ],
+    )
+    def test_invalid_curve_is_rejected(self, curve, message):
+        with pytest.raises(ValueError, match=message):
+            compile_scoring_plan("test", dict(self.CONFIG, diurnal_curve=curve))
+
+    def test_engine_scores_days_by_hours(self, vibe_engine):
+        params = vibe_engine.get_required_parameters("stargazing")
+        values = np.array([[8.0, 40.0, 1.0], [2.0, 90.0, 20.0]])
+
+        hourly = vibe_engine.calculate_hourly_scores("stargazing", values, params)
+        daily = vibe_engine.calculate_vibe_scores("stargazing", values, params)
+
+        assert hourly.shape == (2, 24)
+        # Stargazing peaks at night
+        np.testing.assert_allclose(hourly[:, 0], daily)
+        assert (hourly[:, 12] < hourly[:, 0]).all()
+
+
+class TestScoreTrends:
+    """Test cases for per-month trend statistics over years."""
+
+    def test_matches_polyfit_with_missing_years(self):
+        years = np.arange(2000, 2006)
+        scores = np.array(
+            [
+                [50.0, 80.0, np.nan],
+                [52.0, 78.0, np.nan],
+                [np.nan, 75.0, 40.0],
+                [57.0, 74.0, np.nan],
+                [60.0, 70.0, np.nan],
+                [61.0, 69.0, np.nan],
+            ]
+        )
+
+        mean, std, slope, counts = score_trends(years, scores)
+
+        assert counts.tolist() == [5, 6, 1]
+        valid = ~np.isnan(scores[:, 0])
+        assert slope[0] == pytest.approx(np.polyfit(years[valid], scores[valid, 0], 1)[0])
+        assert slope[1] == pytest.approx(np.polyfit(years, scores[:, 1], 1)[0])
+        assert mean[1] == pytest.approx(scores[:, 1].mean())
+        assert std[1] == pytest.approx(scores[:, 1].std())
+        # A single year has a mean but no trend
+        assert mean[2] == 40.0 and std[2] == 0.0 and np.isnan(slope[2])
+
+
+class TestScoreDistribution:
+    """Test cases for per-month daily score distributions."""
+
+    def test_matches_per_month_numpy(self):
+        rng = np.random.default_rng(7)
+        months = rng.integers(1, 13, 2000)
+        scores = rng.uniform(0, 100, 2000)
+        scores[::17] = np.nan
+        months[months == 4] = 5  # April has no days
+
+        distribution = score_distribution(scores, months, 60.0)
+
+        for month in range(1, 13):
+            values = scores[(months == month) & ~np.isnan(scores)]
+            summary = distribution.month(month)
+            if not len(values):
+                assert summary is None
+                continue
+            assert summary["probability"] == pytest.approx((values > 60.0).mean())
+            for q in QUANTILES:
+                assert summary[f"p{q}"] == pytest.approx(np.percentile(values, q))
+
+    def test_single_day_month(self):
+        distribution = score_distribution(np.array([42.0]), np.array([3]), 40.0)
+
+        assert distribution.month(3) == {"probability": 1.0, "p10": 42.0, "p50": 42.0, "p90": 42.0}
+        assert distribution.num_days.sum() == 1
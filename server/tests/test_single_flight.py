@@ -0,0 +1,92 @@
+"""
+Unit tests for coalescing concurrent identical work.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.data_service import DataService
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for coalescing concurrent identical work."""
+
+    def test_threads_share_one_execution(self):
+        flights = SingleFlight()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flights.do("k", load)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        stats = flights.stats()
+        assert stats["executions"] == 1 and stats["coalesced"] == 4 and stats["in_flight"] == 0
+
+    def test_exception_reaches_every_caller_and_is_not_kept(self):
+        flights = SingleFlight()
+
+        def fail():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            flights.do("k", fail)
+        assert flights.do("k", lambda: 1) == 1
+
+    def test_async_cancelled_caller_does_not_cancel_others(self):
+        flights = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            first = asyncio.ensure_future(flights.do("k", work))
+            second = asyncio.ensure_future(flights.do("k", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == 42
+        assert flights.stats()["executions"] == 1
+
+    def test_cold_location_parsed_once(self, data_dir, monkeypatch):
+        service = DataService(
+            str(data_dir), precompute_climatology=False, use_binary_cache=False
+        )
+        parse = service._load_json_series
+        calls = []
+
+        def slow_parse(*args):
+            calls.append(args[0])
+            time.sleep(0.05)
+            return parse(*args)
+
+        monkeypatch.setattr(service, "_load_json_series", slow_parse)
+        threads = [
+            threading.Thread(target=service._load_location_data, args=("alpha", ["T2M"]))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["alpha"]
+        assert service.load_flights.stats()["coalesced"] == 5